@@ -0,0 +1,175 @@
+import numpy as np
+from interfaces import ISolver, IGraph
+from graph import SudokuGraph
+from propagation import PropagatingSolver
+
+# Status por puzzle devolvido por BatchSolver.resolver_lote
+SEM_SOLUCAO = -1
+RESOLVIDO_PROPAGACAO = 0
+RESOLVIDO_BUSCA = 1
+
+
+class BatchSolver:
+    """
+    Resolve lotes de puzzles de uma vez, com propagação vetorizada (NumPy).
+
+    Cada puzzle é uma linha de um array (N, n⁴) com 0 nas células vazias.
+    Os candidatos de todos os puzzles ficam em um único array de máscaras de
+    bits, e a eliminação pelos vizinhos e os singles (naked e hidden) são
+    aplicados ao lote inteiro como operações de array, por unidade do grafo.
+
+    Só os puzzles que continuam indecisos após a propagação caem na busca
+    individual do solver de reserva (injetado, como no PuzzleGenerator).
+    """
+
+    def __init__(self, n: int = 3, solver_reserva: ISolver | None = None, tamanho_bloco: int = 4096,
+                 graph: IGraph | None = None):
+        """
+        Args:
+            n: Ordem do Sudoku (ex: 3 para 9x9).
+            solver_reserva: ISolver usado nos puzzles que a propagação não resolve.
+            tamanho_bloco: Quantos puzzles propagar por vez (limita a memória).
+            graph: Grafo a usar (ex: uma variante); padrão: SudokuGraph(n).
+                   Todas as unidades precisam ter n² vértices.
+        """
+        self.graph = graph if graph is not None else SudokuGraph(n=n)
+        topologia = self.graph.topologia
+
+        self.tamanho = topologia.tamanho
+        self.num_vertices = topologia.num_vertices
+        self.tamanho_bloco = tamanho_bloco
+        self.solver_reserva = solver_reserva or PropagatingSolver()
+
+        # Tabelas de índices para "gather" vetorizado: (unidades, tamanho) e (vértices, k).
+        # Nas variantes com vértices em menos unidades que outros, as colunas
+        # apontam para uma unidade vazia extra (índice len(unidades))
+        self.unidades = np.array(topologia.unidades, dtype=np.intp)
+        self.unidades_de = np.array(topologia.colunas_unidades, dtype=np.intp).T
+        self.com_vazia = bool((self.unidades_de == len(topologia.unidades)).any())
+
+        if self.tamanho <= 16:
+            self.dtype = np.uint16
+        elif self.tamanho <= 32:
+            self.dtype = np.uint32
+        else:
+            self.dtype = np.uint64
+        self.cheia = self.dtype((1 << self.tamanho) - 1)
+
+    def resolver_lote(self, puzzles) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Resolve todos os puzzles do lote.
+
+        Args:
+            puzzles: Array (N, n⁴) de inteiros, 0 para células vazias.
+
+        Returns:
+            (solucoes, status): solucoes é um array (N, n⁴) com os grids resolvidos
+            (puzzles sem solução voltam como vieram) e status é um vetor (N,) com
+            RESOLVIDO_PROPAGACAO, RESOLVIDO_BUSCA ou SEM_SOLUCAO.
+        """
+        puzzles = np.asarray(puzzles)
+        if puzzles.ndim != 2 or puzzles.shape[1] != self.num_vertices:
+            raise ValueError(f"Esperado um array (N, {self.num_vertices}), recebido {puzzles.shape}.")
+
+        solucoes = puzzles.astype(np.uint8, copy=True)
+        status = np.full(len(puzzles), RESOLVIDO_PROPAGACAO, dtype=np.int8)
+
+        for inicio in range(0, len(puzzles), self.tamanho_bloco):
+            fim = inicio + self.tamanho_bloco
+            self._resolver_bloco(puzzles[inicio:fim], solucoes[inicio:fim], status[inicio:fim])
+
+        return solucoes, status
+
+    def _resolver_bloco(self, puzzles: np.ndarray, solucoes: np.ndarray, status: np.ndarray):
+        """Propaga o bloco inteiro e resolve por busca apenas os que sobrarem."""
+        candidatos, invalido = self._propagar(self._candidatos_iniciais(puzzles))
+
+        decidido = (candidatos & (candidatos - 1)) == 0
+        completo = decidido.all(axis=1) & ~invalido
+
+        status[invalido] = SEM_SOLUCAO
+        status[~completo & ~invalido] = RESOLVIDO_BUSCA
+
+        # Converte as máscaras decididas (potências de 2) de volta em cores
+        cores = np.where(decidido, np.log2(np.maximum(candidatos, 1)).astype(np.uint8) + 1, 0)
+        solucoes[completo] = cores[completo]
+
+        # Fallback: busca individual, partindo dos vértices já decididos
+        for i in np.flatnonzero(~completo & ~invalido):
+            grid = cores[i].reshape(self.tamanho, self.tamanho).tolist()
+
+            if self.solver_reserva.solve(grid, self.graph):
+                solucoes[i] = np.array(grid, dtype=np.uint8).reshape(-1)
+            else:
+                status[i] = SEM_SOLUCAO
+
+    def _candidatos_iniciais(self, puzzles: np.ndarray) -> np.ndarray:
+        """Máscara da pista nos vértices preenchidos e todas as cores nos vazios."""
+        valores = puzzles.astype(np.int64)
+        pistas = np.left_shift(1, np.maximum(valores - 1, 0)).astype(self.dtype)
+        return np.where(valores > 0, pistas, self.cheia).astype(self.dtype)
+
+    def _propagar(self, candidatos: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Repete o passo de propagação até o ponto fixo. A cada rodada só os
+        puzzles que ainda mudaram (e não são inválidos) continuam no lote.
+        """
+        invalido = np.zeros(len(candidatos), dtype=bool)
+        ativos = np.arange(len(candidatos))
+
+        while ativos.size:
+            antes = candidatos[ativos]
+            depois, ruim = self._passo(antes)
+
+            candidatos[ativos] = depois
+            invalido[ativos[ruim]] = True
+
+            mudou = (depois != antes).any(axis=1) & ~ruim
+            ativos = ativos[mudou]
+
+        return candidatos, invalido
+
+    def _por_vertice(self, por_unidade: np.ndarray) -> np.ndarray:
+        """(M, U) -> (M, V, k): os valores das unidades de cada vértice."""
+        if self.com_vazia:
+            por_unidade = np.pad(por_unidade, ((0, 0), (0, 1))) # Unidade vazia = 0
+        return por_unidade[:, self.unidades_de]
+
+    def _passo(self, c: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Uma rodada de eliminação + naked singles + hidden singles sobre o lote.
+        Retorna os novos candidatos e quais puzzles entraram em contradição.
+        """
+        # 1. Naked singles: cada unidade acumula as cores dos vértices decididos
+        decidido = (c & (c - 1)) == 0
+        fixos = np.where(decidido, c, 0).astype(self.dtype)
+        por_unidade = fixos[:, self.unidades]                       # (M, U, T)
+        usadas = np.bitwise_or.reduce(por_unidade, axis=2)          # (M, U)
+
+        # Potências de 2 distintas somam o mesmo que seu OR; se não, há cor repetida
+        soma = por_unidade.sum(axis=2, dtype=np.int64)
+        ruim = (soma != usadas.astype(np.int64)).any(axis=1)
+
+        # 2. Elimina dos vértices indecisos as cores usadas em suas unidades
+        vizinhas = np.bitwise_or.reduce(self._por_vertice(usadas), axis=2)   # (M, V)
+        c = np.where(decidido, c, c & ~vizinhas).astype(self.dtype)
+
+        # 3. Hidden singles: cores que aparecem em um único vértice da unidade
+        por_unidade = c[:, self.unidades]
+        vista = np.zeros(por_unidade.shape[:2], dtype=self.dtype)
+        repetida = np.zeros_like(vista)
+        for t in range(self.tamanho):
+            m = por_unidade[:, :, t]
+            repetida |= vista & m
+            vista |= m
+
+        ruim |= (vista != self.cheia).any(axis=1)   # Cor sem lugar na unidade
+
+        unicas = vista & ~repetida
+        m = c & np.bitwise_or.reduce(self._por_vertice(unicas), axis=2)
+        ruim |= ((m & (m - 1)) != 0).any(axis=1)    # Duas cores presas ao mesmo vértice
+
+        c = np.where(m != 0, m, c).astype(self.dtype)
+        ruim |= (c == 0).any(axis=1)
+
+        return c, ruim
@@ -0,0 +1,272 @@
+"""
+Suite de benchmarks dos solvers, contadores e do gerador.
+
+Roda cada motor sobre o corpus em benchmarks/corpus (4x4, 9x9 do fácil ao
+extremo, 16x16 e 25x25), mede tempo total, nós explorados (via
+instrumentation.SearchStats) e pico de memória por motor e por classe, grava os resultados em JSON
+e compara com a baseline salva. Qualquer regressão acima da tolerância faz o
+script terminar com código 1.
+
+Uso:
+    python benchmark.py                    # roda e compara com a baseline
+    python benchmark.py --salvar-baseline  # grava os resultados como nova baseline
+    python benchmark.py --motores dlx bitmask --classes 9x9_extremo
+
+A baseline depende da máquina: gere-a de novo com --salvar-baseline ao trocar
+de ambiente de referência.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from graph import SudokuGraph
+from solvers import (NaiveBacktrackingSolver, SmartBacktrackingSolver, BitmaskBacktrackingSolver,
+                     BacktrackingCounter, IterativeSolver)
+from propagation import PropagatingSolver
+from dlx import DancingLinksSolver
+from generator import PuzzleGenerator
+from instrumentation import SearchStats
+from utils import linha_para_grid
+
+DIRETORIO_BENCHMARKS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks")
+DIRETORIO_CORPUS = os.path.join(DIRETORIO_BENCHMARKS, "corpus")
+
+# (classe, ordem n, arquivo do corpus)
+CLASSES = [
+    ("4x4", 2, "4x4.txt"),
+    ("9x9_facil", 3, "9x9_facil.txt"),
+    ("9x9_medio", 3, "9x9_medio.txt"),
+    ("9x9_dificil", 3, "9x9_dificil.txt"),
+    ("9x9_extremo", 3, "9x9_extremo.txt"),
+    ("16x16", 4, "16x16.txt"),
+    ("25x25", 5, "25x25.txt"),
+]
+
+TODAS = {classe for classe, _, _ in CLASSES}
+ATE_9X9 = {"4x4", "9x9_facil", "9x9_medio", "9x9_dificil", "9x9_extremo"}
+
+# Motor -> (classe ISolver, classes em que roda). Os motores sem inferência
+# não terminam em tempo útil nos tabuleiros maiores.
+SOLVERS = {
+    "naive": (NaiveBacktrackingSolver, {"4x4", "9x9_facil", "9x9_medio"}),
+    "smart": (SmartBacktrackingSolver, ATE_9X9),
+    "bitmask": (BitmaskBacktrackingSolver, ATE_9X9),
+    "propagacao": (PropagatingSolver, TODAS),
+    "dlx": (DancingLinksSolver, TODAS),
+    "iterativo": (IterativeSolver, TODAS),
+}
+
+# Contador -> (classe ISolutionCounter, classes em que roda)
+CONTADORES = {
+    "backtracking": (BacktrackingCounter, ATE_9X9),
+    "dlx": (DancingLinksSolver, TODAS),
+    "iterativo": (IterativeSolver, TODAS),
+}
+
+# (ordem n, quantidade de puzzles) gerados por contador, com semente fixa
+GERACOES = [(2, 10), (3, 3)]
+SEMENTE_GERADOR = 2024
+
+
+def carregar_corpus(arquivo: str, n: int) -> list[str]:
+    """Lê as linhas de puzzle de um arquivo do corpus (ignora vazias e comentários '#')."""
+    with open(os.path.join(DIRETORIO_CORPUS, arquivo), encoding="utf-8") as f:
+        linhas = [linha.strip() for linha in f]
+    return [linha for linha in linhas if linha and not linha.startswith("#")]
+
+
+def medir(executar, entradas, motor=None) -> dict:
+    """
+    Mede uma função sobre todas as entradas.
+
+    'executar(entrada)' retorna True em caso de sucesso. O tempo é medido
+    numa passada sem instrumentação nem tracemalloc (que deixam tudo mais
+    lento); o pico de memória e, se 'motor' for informado, os nós explorados
+    (via SearchStats) saem de uma segunda passada.
+    """
+    tempo = 0.0
+    falhas = 0
+
+    for entrada in entradas:
+        inicio = time.perf_counter()
+        sucesso = executar(entrada)
+        tempo += time.perf_counter() - inicio
+
+        if not sucesso:
+            falhas += 1
+
+    if motor is not None:
+        motor.estatisticas = SearchStats(acumular=True)
+
+    tracemalloc.start()
+    pico = 0
+    for entrada in entradas:
+        tracemalloc.reset_peak()
+        executar(entrada)
+        pico = max(pico, tracemalloc.get_traced_memory()[1])
+    tracemalloc.stop()
+
+    nos = None
+    if motor is not None:
+        nos = motor.estatisticas.nos
+        motor.estatisticas = None
+
+    return {
+        "entradas": len(entradas),
+        "tempo_s": round(tempo, 6),
+        "nos": nos,
+        "memoria_pico_kb": round(pico / 1024, 1),
+        "falhas": falhas,
+    }
+
+
+def rodar(motores: set[str] | None = None, classes: set[str] | None = None) -> dict:
+    """Executa a suite completa (ou o filtro pedido) e retorna o dicionário de resultados."""
+    resultados = {}
+
+    for classe, n, arquivo in CLASSES:
+        if classes and classe not in classes:
+            continue
+
+        graph = SudokuGraph(n=n)
+        linhas = carregar_corpus(arquivo, n)
+
+        for nome, (fabrica, suportadas) in SOLVERS.items():
+            if classe not in suportadas or (motores and nome not in motores):
+                continue
+
+            solver = fabrica()
+
+            def resolver(linha):
+                return solver.solve(linha_para_grid(linha, n), graph)
+
+            print(f"  solve/{nome}/{classe}...", file=sys.stderr)
+            resultados[f"solve/{nome}/{classe}"] = medir(resolver, linhas, solver)
+
+        for nome, (fabrica, suportadas) in CONTADORES.items():
+            if classe not in suportadas or (motores and nome not in motores):
+                continue
+
+            contador = fabrica()
+
+            def contar(linha):
+                return contador.count_solutions(linha_para_grid(linha, n), graph, limit=2) >= 1
+
+            print(f"  count/{nome}/{classe}...", file=sys.stderr)
+            resultados[f"count/{nome}/{classe}"] = medir(contar, linhas, contador)
+
+    for nome, (fabrica, _) in CONTADORES.items():
+        if motores and nome not in motores:
+            continue
+
+        for n, quantidade in GERACOES:
+            gerador = PuzzleGenerator(BitmaskBacktrackingSolver(), fabrica())
+
+            def gerar(indice):
+                rng = random.Random(f"{SEMENTE_GERADOR}:{indice}")
+                gerador.gerar_puzzle(n, rng=rng, verbose=False)
+                return True
+
+            # Os nós da geração são os das verificações de unicidade do contador
+            print(f"  gerar/{nome}/n{n}...", file=sys.stderr)
+            resultados[f"gerar/{nome}/n{n}"] = medir(gerar, list(range(quantidade)), gerador.counter)
+
+    return {
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+
+
+def comparar(atual: dict, baseline: dict, tolerancia: float, minimo_s: float) -> list[str]:
+    """
+    Lista as regressões de 'atual' em relação à baseline:
+    - tempo acima de (1 + tolerancia) vezes o da baseline (e mais de minimo_s
+      de diferença absoluta, para ignorar ruído em medições minúsculas);
+    - nós explorados acima de (1 + tolerancia) vezes os da baseline;
+    - mais falhas do que na baseline.
+    """
+    regressoes = []
+
+    for chave, base in baseline["resultados"].items():
+        novo = atual["resultados"].get(chave)
+        if novo is None:
+            continue
+
+        if novo["tempo_s"] > base["tempo_s"] * (1 + tolerancia) and novo["tempo_s"] - base["tempo_s"] > minimo_s:
+            regressoes.append(f"{chave}: tempo {base['tempo_s']:.4f}s -> {novo['tempo_s']:.4f}s")
+
+        if base["nos"] is not None and novo["nos"] is not None and novo["nos"] > base["nos"] * (1 + tolerancia):
+            regressoes.append(f"{chave}: nós {base['nos']} -> {novo['nos']}")
+
+        if novo["falhas"] > base["falhas"]:
+            regressoes.append(f"{chave}: falhas {base['falhas']} -> {novo['falhas']}")
+
+    return regressoes
+
+
+def imprimir_tabela(atual: dict, baseline: dict | None):
+    print(f"\n{'caso':<32} {'tempo (s)':>10} {'base (s)':>10} {'nós':>10} {'pico (KB)':>10} {'falhas':>7}")
+    for chave, r in atual["resultados"].items():
+        base = baseline["resultados"].get(chave) if baseline else None
+        tempo_base = f"{base['tempo_s']:.4f}" if base else "-"
+        nos = r["nos"] if r["nos"] is not None else "-"
+        print(f"{chave:<32} {r['tempo_s']:>10.4f} {tempo_base:>10} {nos:>10} {r['memoria_pico_kb']:>10} {r['falhas']:>7}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks dos solvers, contadores e gerador.")
+    parser.add_argument("--baseline", default=os.path.join(DIRETORIO_BENCHMARKS, "baseline.json"),
+                        help="Arquivo da baseline a comparar/gravar.")
+    parser.add_argument("--saida", default=os.path.join(DIRETORIO_BENCHMARKS, "ultimo_resultado.json"),
+                        help="Onde gravar os resultados desta execução.")
+    parser.add_argument("--salvar-baseline", action="store_true", help="Grava os resultados como nova baseline.")
+    parser.add_argument("--tolerancia", type=float, default=0.5,
+                        help="Piora relativa aceita antes de acusar regressão (0.5 = 50%%).")
+    parser.add_argument("--minimo", type=float, default=0.05,
+                        help="Diferença absoluta mínima de tempo (s) para acusar regressão.")
+    parser.add_argument("--motores", nargs="*", help="Roda apenas estes motores/contadores.")
+    parser.add_argument("--classes", nargs="*", help="Roda apenas estas classes do corpus.")
+    args = parser.parse_args()
+
+    print("Rodando benchmarks...", file=sys.stderr)
+    atual = rodar(set(args.motores or []), set(args.classes or []))
+
+    with open(args.saida, "w", encoding="utf-8") as f:
+        json.dump(atual, f, indent=2, ensure_ascii=False)
+
+    if args.salvar_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(atual, f, indent=2, ensure_ascii=False)
+        imprimir_tabela(atual, None)
+        print(f"\nBaseline gravada em {args.baseline}")
+        return 0
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    imprimir_tabela(atual, baseline)
+
+    if baseline is None:
+        print(f"\nSem baseline em {args.baseline}; use --salvar-baseline para criar uma.")
+        return 0
+
+    regressoes = comparar(atual, baseline, args.tolerancia, args.minimo)
+    if regressoes:
+        print("\n!!! REGRESSÃO DE PERFORMANCE !!!")
+        for regressao in regressoes:
+            print(f"  - {regressao}")
+        return 1
+
+    print("\nSem regressões em relação à baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
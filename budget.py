@@ -0,0 +1,101 @@
+from time import perf_counter
+from typing import Callable
+
+
+class _OrcamentoEsgotado:
+    """
+    Resultado de um solve/count_solutions interrompido pelo orçamento.
+
+    É falso em contexto booleano (como uma falha), então quem só testa
+    'if solver.solve(...)' trata o caso como "sem solução"; para distinguir
+    "não há solução" de "não deu tempo", compare com 'is ORCAMENTO_ESGOTADO'.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self):
+        return False
+
+    def __repr__(self):
+        return "ORCAMENTO_ESGOTADO"
+
+    def __reduce__(self):
+        return "ORCAMENTO_ESGOTADO" # Continua único ao atravessar processos
+
+
+ORCAMENTO_ESGOTADO = _OrcamentoEsgotado()
+
+
+class SearchBudget:
+    """
+    Limites de tempo e de nós para a busca de um ISolver/ISolutionCounter.
+
+    Para ativar, basta atribuir uma instância ao atributo 'orcamento' do motor
+    (ex: counter.orcamento = SearchBudget(prazo=0.5)). Com o atributo em None
+    (o padrão), os motores pagam apenas um teste 'is None' por nó. Ao esgotar,
+    solve, count_solutions e tem_solucao_alternativa devolvem
+    ORCAMENTO_ESGOTADO no lugar de True/False ou da contagem.
+
+    - prazo: segundos de relógio a partir do início da chamada.
+    - max_nos: nós (atribuições tentadas) permitidos.
+    - intervalo_relogio: o relógio só é consultado a cada tantos nós, para
+      que o prazo não pese na busca; o atraso máximo é esse número de nós.
+    - cancelar: função sem argumentos consultada junto com o relógio; se
+      devolver True, o orçamento acaba (ex: Event.is_set de outro processo,
+      para interromper uma busca que perdeu uma corrida).
+
+    Com acumular=False (padrão) cada chamada recebe o orçamento inteiro; com
+    True, o prazo começa a correr na primeira chamada e nós e prazo são
+    divididos entre todas elas (ex: todas as verificações de uma geração).
+    """
+
+    def __init__(self, prazo: float | None = None, max_nos: int | None = None,
+                 intervalo_relogio: int = 256, acumular: bool = False,
+                 cancelar: Callable[[], bool] | None = None):
+        self.prazo = prazo
+        self.max_nos = max_nos
+        self.intervalo_relogio = intervalo_relogio
+        self.acumular = acumular
+        self.cancelar = cancelar
+        self.limite_tempo = None
+        self.zerar()
+
+    def zerar(self):
+        self.nos = 0
+        self.esgotado = False
+        self.limite_tempo = None
+
+    def iniciar(self):
+        """Chamado pelos motores no início de cada solve/count_solutions."""
+        if not self.acumular:
+            self.zerar()
+        if self.prazo is not None and self.limite_tempo is None:
+            self.limite_tempo = perf_counter() + self.prazo
+        elif self.limite_tempo is not None and perf_counter() >= self.limite_tempo:
+            self.esgotado = True # Prazo acumulado já vencido antes desta chamada
+
+    def consumir(self) -> bool:
+        """Contabiliza um nó. Retorna True se o orçamento acabou (a busca deve parar)."""
+        self.nos += 1
+
+        if self.max_nos is not None and self.nos > self.max_nos:
+            self.esgotado = True
+        elif self.nos % self.intervalo_relogio == 0:
+            if self.limite_tempo is not None and perf_counter() >= self.limite_tempo:
+                self.esgotado = True
+            elif self.cancelar is not None and self.cancelar():
+                self.esgotado = True
+
+        return self.esgotado
+
+    def restante(self) -> float | None:
+        """Segundos que ainda restam do prazo (None se não há prazo)."""
+        if self.limite_tempo is None:
+            return self.prazo
+        return max(0.0, self.limite_tempo - perf_counter())
+
+    def para_dict(self) -> dict:
+        return {"nos": self.nos, "esgotado": self.esgotado}
+
+    def __repr__(self):
+        return f"SearchBudget(prazo={self.prazo}, max_nos={self.max_nos}, nos={self.nos}, esgotado={self.esgotado})"
@@ -0,0 +1,123 @@
+import dbm
+from collections import OrderedDict
+from interfaces import ISolver, IGraph
+from budget import ORCAMENTO_ESGOTADO
+from grid import CompactGrid, valores_por_vertice, gravar_por_vertice
+from symmetry import forma_canonica
+
+# Valor guardado para puzzles sem solução (soluções nunca são vazias)
+_SEM_SOLUCAO = b""
+
+
+class CachedSolver(ISolver):
+    """
+    Camada de cache na frente de qualquer ISolver.
+
+    Cada puzzle é levado à forma canônica sob as simetrias do Sudoku (troca de
+    dígitos, transposição, permutações de bandas/pilhas e de linhas/colunas
+    dentro delas), então versões transformadas de um mesmo puzzle dividem a
+    mesma entrada. Numa falta, o solver injetado resolve a forma canônica; a
+    solução guardada volta ao puzzle original pela transformação inversa.
+
+    - Memória: LRU limitado a 'capacidade' entradas.
+    - Disco (opcional): 'arquivo' abre um banco dbm persistente, consultado
+      quando a LRU falha e atualizado a cada nova solução.
+
+    Estatísticas: acertos_memoria, acertos_disco, faltas e descartes (saídas
+    da LRU); resumo em estatisticas_cache().
+
+    Variantes (topologia não clássica) vão direto ao solver injetado: as
+    simetrias da forma canônica não preservam diagonais, janelas ou regiões.
+    """
+
+    def __init__(self, solver: ISolver, capacidade: int = 10000, arquivo: str | None = None):
+        if capacidade < 1:
+            raise ValueError("capacidade deve ser pelo menos 1.")
+
+        self.solver = solver
+        self.capacidade = capacidade
+        self.lru = OrderedDict()
+        self.disco = dbm.open(arquivo, "c") if arquivo is not None else None
+
+        self.acertos_memoria = 0
+        self.acertos_disco = 0
+        self.faltas = 0
+        self.descartes = 0
+
+    def solve(self, grid: list[list[int]], graph: IGraph) -> bool:
+        topologia = graph.topologia
+        if not topologia.classica:
+            return self.solver.solve(grid, graph)
+
+        valores = valores_por_vertice(grid, topologia.coordenadas)
+        forma, transformacao = forma_canonica(valores, topologia.n)
+
+        solucao = self._consultar(forma)
+        if solucao is None:
+            self.faltas += 1
+            canonico = CompactGrid(topologia.n, forma)
+            resultado = self.solver.solve(canonico, graph)
+            if resultado is ORCAMENTO_ESGOTADO:
+                return resultado # Sem resposta definitiva: nada a guardar
+            solucao = bytes(canonico.valores) if resultado else _SEM_SOLUCAO
+            self._guardar(forma, solucao)
+
+        if solucao == _SEM_SOLUCAO:
+            return False
+
+        gravar_por_vertice(grid, topologia.coordenadas, transformacao.desfazer(solucao))
+        return True
+
+    def _consultar(self, chave: bytes) -> bytes | None:
+        """Procura na LRU e depois no disco. Retorna None numa falta."""
+        solucao = self.lru.get(chave)
+        if solucao is not None:
+            self.lru.move_to_end(chave)
+            self.acertos_memoria += 1
+            return solucao
+
+        if self.disco is not None:
+            solucao = self.disco.get(chave)
+            if solucao is not None:
+                self.acertos_disco += 1
+                self._inserir_lru(chave, solucao)
+                return solucao
+
+        return None
+
+    def _guardar(self, chave: bytes, solucao: bytes):
+        self._inserir_lru(chave, solucao)
+        if self.disco is not None:
+            self.disco[chave] = solucao
+
+    def _inserir_lru(self, chave: bytes, solucao: bytes):
+        self.lru[chave] = solucao
+        self.lru.move_to_end(chave)
+        if len(self.lru) > self.capacidade:
+            self.lru.popitem(last=False)
+            self.descartes += 1
+
+    def estatisticas_cache(self) -> dict:
+        consultas = self.acertos_memoria + self.acertos_disco + self.faltas
+        acertos = self.acertos_memoria + self.acertos_disco
+        return {
+            "consultas": consultas,
+            "acertos_memoria": self.acertos_memoria,
+            "acertos_disco": self.acertos_disco,
+            "faltas": self.faltas,
+            "descartes": self.descartes,
+            "taxa_acerto": acertos / consultas if consultas else 0.0,
+            "entradas_memoria": len(self.lru),
+        }
+
+    def fechar(self):
+        """Fecha o banco em disco (se houver)."""
+        if self.disco is not None:
+            self.disco.close()
+            self.disco = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
@@ -0,0 +1,184 @@
+import mmap
+import os
+import struct
+from typing import Iterable
+from grid import CompactGrid
+from utils import linha_para_grid, grid_para_linha
+
+# Cabeçalho: assinatura, versão, ordem n, bits por célula, reservado, quantidade
+_CABECALHO = struct.Struct("<4sBBBBQ")
+_ASSINATURA = b"SDKP"
+_VERSAO = 1
+_OFFSET_QUANTIDADE = 8
+
+# Caminho rápido para 4 bits (9x9): cada célula vira um dígito hexadecimal
+_PARA_HEX = bytes.maketrans(bytes(range(16)), b"0123456789abcdef")
+_DE_HEX = bytes.maketrans(b"0123456789abcdef", bytes(range(16)))
+
+
+def bits_por_celula(n: int) -> int:
+    """Mínimo de bits para guardar 0..n² (4 para 9x9, 5 para 16x16 e 25x25)."""
+    return (n * n).bit_length()
+
+
+def tamanho_registro(n: int) -> int:
+    """Bytes por puzzle (41 para 9x9)."""
+    return (n ** 4 * bits_por_celula(n) + 7) // 8
+
+
+def empacotar(valores, n: int) -> bytes:
+    """Empacota os valores por vértice no mínimo de bits por célula."""
+    bits = bits_por_celula(n)
+    tamanho = tamanho_registro(n)
+
+    if bits == 4:
+        texto = bytes(valores).translate(_PARA_HEX)
+        if len(texto) % 2:
+            texto += b"0"
+        return bytes.fromhex(texto.decode("ascii"))
+
+    acumulado = 0
+    for i, valor in enumerate(valores):
+        acumulado |= valor << (i * bits)
+    return acumulado.to_bytes(tamanho, "little")
+
+
+def desempacotar(registro, n: int) -> bytearray:
+    """Inverso de empacotar: devolve os valores por vértice."""
+    bits = bits_por_celula(n)
+    num_vertices = n ** 4
+
+    if bits == 4:
+        return bytearray(bytes(registro).hex().encode("ascii").translate(_DE_HEX)[:num_vertices])
+
+    acumulado = int.from_bytes(registro, "little")
+    mascara = (1 << bits) - 1
+    return bytearray((acumulado >> (i * bits)) & mascara for i in range(num_vertices))
+
+
+def _valores(grid, n: int):
+    """Aceita CompactGrid, lista de listas ou sequência plana."""
+    if isinstance(grid, CompactGrid):
+        return grid.valores
+    if len(grid) == n * n and not isinstance(grid[0], int):
+        return [valor for linha in grid for valor in linha]
+    return grid
+
+
+class PuzzleWriter:
+    """
+    Grava puzzles em streaming no formato binário empacotado.
+
+    A quantidade no cabeçalho é atualizada ao fechar, então dá para gravar
+    direto da saída do gerador ou do solver sem saber o total de antemão.
+    """
+
+    def __init__(self, caminho: str, n: int):
+        self.n = n
+        self.quantidade = 0
+        self.arquivo = open(caminho, "wb")
+        self.arquivo.write(_CABECALHO.pack(_ASSINATURA, _VERSAO, n, bits_por_celula(n), 0, 0))
+
+    def escrever(self, grid):
+        """Grava um puzzle (CompactGrid, lista de listas ou valores planos)."""
+        self.arquivo.write(empacotar(_valores(grid, self.n), self.n))
+        self.quantidade += 1
+
+    def escrever_todos(self, grids: Iterable) -> int:
+        for grid in grids:
+            self.escrever(grid)
+        return self.quantidade
+
+    def fechar(self):
+        if self.arquivo.closed:
+            return
+        self.arquivo.seek(_OFFSET_QUANTIDADE)
+        self.arquivo.write(struct.pack("<Q", self.quantidade))
+        self.arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+class PuzzleDatabase:
+    """
+    Leitura de um arquivo de puzzles empacotados via mmap.
+
+    Nada é carregado na abertura: cada acesso (db[i], iteração) desempacota
+    apenas o registro pedido, direto das páginas mapeadas. Vários processos
+    podem abrir o mesmo arquivo e compartilhar o cache de páginas do sistema.
+    """
+
+    def __init__(self, caminho: str):
+        with open(caminho, "rb") as f:
+            cabecalho = f.read(_CABECALHO.size)
+            if len(cabecalho) < _CABECALHO.size:
+                raise ValueError(f"{caminho}: arquivo truncado.")
+
+            assinatura, versao, n, bits, _, quantidade = _CABECALHO.unpack(cabecalho)
+            if assinatura != _ASSINATURA or versao != _VERSAO:
+                raise ValueError(f"{caminho}: não é um banco de puzzles (versão {_VERSAO}).")
+            if bits != bits_por_celula(n):
+                raise ValueError(f"{caminho}: {bits} bits por célula não correspondem a n={n}.")
+
+            self.n = n
+            self.quantidade = quantidade
+            self.tamanho_registro = tamanho_registro(n)
+
+            esperado = _CABECALHO.size + quantidade * self.tamanho_registro
+            if os.fstat(f.fileno()).st_size < esperado:
+                raise ValueError(f"{caminho}: arquivo truncado.")
+
+            self.mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if quantidade else None
+
+    def __len__(self) -> int:
+        return self.quantidade
+
+    def valores(self, i: int) -> bytearray:
+        """Valores por vértice do puzzle i."""
+        if i < 0:
+            i += self.quantidade
+        if not 0 <= i < self.quantidade:
+            raise IndexError(f"Puzzle {i} fora do intervalo (0-{self.quantidade - 1}).")
+
+        inicio = _CABECALHO.size + i * self.tamanho_registro
+        return desempacotar(self.mapa[inicio:inicio + self.tamanho_registro], self.n)
+
+    def __getitem__(self, i: int) -> CompactGrid:
+        return CompactGrid(self.n, self.valores(i))
+
+    def __iter__(self):
+        for i in range(self.quantidade):
+            yield self[i]
+
+    def fechar(self):
+        if self.mapa is not None:
+            self.mapa.close()
+            self.mapa = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+def texto_para_banco(entrada: str, saida: str, n: int) -> int:
+    """Converte o formato de uma linha por puzzle no formato binário. Retorna a quantidade."""
+    with open(entrada, encoding="utf-8") as f, PuzzleWriter(saida, n) as escritor:
+        for linha in f:
+            linha = linha.strip()
+            if linha and not linha.startswith("#"):
+                escritor.escrever(linha_para_grid(linha, n))
+        return escritor.quantidade
+
+
+def banco_para_texto(entrada: str, saida: str) -> int:
+    """Converte o formato binário em uma linha por puzzle. Retorna a quantidade."""
+    with PuzzleDatabase(entrada) as banco, open(saida, "w", encoding="utf-8") as f:
+        for grid in banco:
+            f.write(grid_para_linha(grid) + "\n")
+        return len(banco)
@@ -0,0 +1,361 @@
+from time import perf_counter
+from interfaces import ISolver, ISolutionCounter, IGraph
+from budget import ORCAMENTO_ESGOTADO
+from grid import valores_por_vertice
+
+# Cache das matrizes de cobertura exata, uma por topologia (montada uma única vez)
+_MATRIZES = {}
+
+
+class _MatrizCobertura:
+    """
+    Matriz de cobertura exata de um grafo Sudoku em Dancing Links (Knuth).
+
+    Cada linha da matriz é um par (vértice, cor) e cobre as colunas (restrições):
+    1. O vértice recebe exatamente uma cor.
+    2. Cada unidade do vértice contém a cor exatamente uma vez (no clássico:
+       linha, coluna e bloco; nas variantes, também regiões, diagonais...).
+
+    Por isso toda unidade precisa ter exatamente n² vértices.
+
+    Os nós ficam em listas paralelas (L, R, U, D, C) em vez de objetos, e o
+    cover/uncover é exatamente reversível: depois de cada busca a matriz volta
+    ao estado original, o que permite reaproveitá-la entre puzzles.
+    """
+
+    def __init__(self, graph: IGraph):
+        topologia = graph.topologia
+        self.tamanho = topologia.tamanho
+        self.num_vertices = topologia.num_vertices
+        self.coordenadas = topologia.coordenadas
+
+        unidades = topologia.unidades
+        if any(len(unidade) != self.tamanho for unidade in unidades):
+            raise ValueError(f"Cobertura exata exige unidades com exatamente {self.tamanho} vértices.")
+
+        num_colunas = self.num_vertices + len(unidades) * self.tamanho
+
+        # Nó 0 é a raiz; nós 1..num_colunas são os cabeçalhos das colunas
+        self.L = [i - 1 for i in range(num_colunas + 1)]
+        self.R = [i + 1 for i in range(num_colunas + 1)]
+        self.L[0] = num_colunas
+        self.R[num_colunas] = 0
+        self.U = list(range(num_colunas + 1))
+        self.D = list(range(num_colunas + 1))
+        self.C = list(range(num_colunas + 1))
+        self.S = [0] * (num_colunas + 1)   # Tamanho (nº de nós) de cada coluna
+        self.linha_do_no = [-1] * (num_colunas + 1)
+
+        # primeiro_no[r]: índice do primeiro nó da linha r = v * tamanho + (cor - 1)
+        self.primeiro_no = []
+
+        # Colunas da unidade u: 1 + num_vertices + u * tamanho + (cor - 1)
+        for v in range(self.num_vertices):
+            for d in range(self.tamanho):
+                colunas = (1 + v,) + tuple(1 + self.num_vertices + u * self.tamanho + d
+                                          for u in topologia.unidades_de[v])
+                self._adicionar_linha(v * self.tamanho + d, colunas)
+
+    def _adicionar_linha(self, r: int, colunas: tuple[int, ...]):
+        """Insere a linha r, ligando um nó no fim de cada coluna indicada."""
+        primeiro = len(self.C)
+        self.primeiro_no.append(primeiro)
+
+        for i, c in enumerate(colunas):
+            no = primeiro + i
+
+            # Ligação vertical: insere acima do cabeçalho (fim da coluna)
+            self.U.append(self.U[c])
+            self.D.append(c)
+            self.D[self.U[c]] = no
+            self.U[c] = no
+            self.C.append(c)
+            self.S[c] += 1
+            self.linha_do_no.append(r)
+
+            # Ligação horizontal circular dentro da linha
+            self.L.append(no - 1 if i > 0 else primeiro + len(colunas) - 1)
+            self.R.append(no + 1 if i < len(colunas) - 1 else primeiro)
+
+    def cobrir(self, c: int):
+        """Remove a coluna c e todas as linhas que a cobrem."""
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+
+        R[L[c]] = R[c]
+        L[R[c]] = L[c]
+
+        i = D[c]
+        while i != c:
+            j = R[i]
+            while j != i:
+                U[D[j]] = U[j]
+                D[U[j]] = D[j]
+                S[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def descobrir(self, c: int):
+        """Desfaz cobrir(c), na ordem exatamente inversa."""
+        L, R, U, D, C, S = self.L, self.R, self.U, self.D, self.C, self.S
+
+        i = U[c]
+        while i != c:
+            j = L[i]
+            while j != i:
+                S[C[j]] += 1
+                U[D[j]] = j
+                D[U[j]] = j
+                j = L[j]
+            i = U[i]
+
+        R[L[c]] = c
+        L[R[c]] = c
+
+
+    def ocultar_linha(self, primeiro: int):
+        """Retira uma linha inteira das suas colunas (a linha deixa de ser opção)."""
+        U, D, C, S = self.U, self.D, self.C, self.S
+
+        j = primeiro
+        while True:
+            U[D[j]] = U[j]
+            D[U[j]] = D[j]
+            S[C[j]] -= 1
+            j = self.R[j]
+            if j == primeiro:
+                break
+
+    def restaurar_linha(self, primeiro: int):
+        """Desfaz ocultar_linha(primeiro)."""
+        U, D, C, S = self.U, self.D, self.C, self.S
+
+        j = primeiro
+        while True:
+            S[C[j]] += 1
+            U[D[j]] = j
+            D[U[j]] = j
+            j = self.R[j]
+            if j == primeiro:
+                break
+
+
+def _obter_matriz(graph: IGraph) -> _MatrizCobertura:
+    """Retorna a matriz de cobertura da topologia do grafo, montando-a na 1ª vez."""
+    topologia = graph.topologia
+    if topologia not in _MATRIZES:
+        _MATRIZES[topologia] = _MatrizCobertura(graph)
+    return _MATRIZES[topologia]
+
+
+class DancingLinksSolver(ISolver, ISolutionCounter):
+    """
+    Resolve e conta soluções reduzindo o Sudoku a um problema de cobertura
+    exata, resolvido pelo Algorithm X de Knuth com Dancing Links.
+
+    A matriz de cada ordem 'n' é montada uma vez por processo e reaproveitada:
+    as pistas são "selecionadas" cobrindo suas colunas antes da busca e
+    desfeitas ao final, sem reconstruir nada a cada chamada.
+    """
+
+    def solve(self, grid: list[list[int]], graph: IGraph) -> bool:
+        encontradas = self._executar(grid, graph, limite=1)
+
+        if encontradas is ORCAMENTO_ESGOTADO:
+            return encontradas
+        if encontradas == 0:
+            return False
+
+        # Decodifica as linhas escolhidas (vértice, cor) de volta para o grid 2D
+        for r in self.solucao:
+            v, d = divmod(r, self.matriz.tamanho)
+            (linha, col) = self.matriz.coordenadas[v]
+            grid[linha][col] = d + 1
+
+        return True
+
+    def count_solutions(self, grid: list[list[int]], graph: IGraph, limit: int | None = None) -> int:
+        return self._executar(grid, graph, limite=limit)
+
+    def tem_solucao_alternativa(self, grid: list[list[int]], graph: IGraph, v: int, cor_proibida: int) -> bool:
+        """
+        Busca uma solução com v != cor_proibida ocultando a linha (v, cor_proibida)
+        da matriz durante a busca, sem copiar o grid.
+        """
+        matriz = _obter_matriz(graph)
+        primeiro = matriz.primeiro_no[v * matriz.tamanho + cor_proibida - 1]
+
+        matriz.ocultar_linha(primeiro)
+        try:
+            encontradas = self._executar(grid, graph, limite=1)
+            return encontradas if encontradas is ORCAMENTO_ESGOTADO else encontradas > 0
+        finally:
+            matriz.restaurar_linha(primeiro)
+
+    def _executar(self, grid: list[list[int]], graph: IGraph, limite: int | None) -> int:
+        """Seleciona as pistas, roda a busca e restaura a matriz. Retorna o nº de soluções."""
+        self.matriz = _obter_matriz(graph)
+        self.limite = limite
+        self.contador_solucoes = 0
+        self.solucao = []
+        self.parcial = []
+
+        if self.estatisticas is not None:
+            self.estatisticas.iniciar()
+        if self.orcamento is not None:
+            self.orcamento.iniciar()
+
+        tamanho = self.matriz.tamanho
+        selecionadas = []   # Nós das pistas já selecionadas (para desfazer)
+        colunas_cobertas = set()
+
+        try:
+            for v, cor in enumerate(valores_por_vertice(grid, self.matriz.coordenadas)):
+                if cor == 0:
+                    continue
+
+                primeiro = self.matriz.primeiro_no[v * tamanho + cor - 1]
+
+                # Pistas conflitantes tentariam cobrir a mesma coluna duas vezes
+                colunas = self._colunas_da_linha(primeiro)
+                if colunas_cobertas.intersection(colunas):
+                    return 0
+                colunas_cobertas.update(colunas)
+
+                self._selecionar(primeiro)
+                selecionadas.append(primeiro)
+                self.parcial.append(v * tamanho + cor - 1)
+
+            self._buscar()
+        finally:
+            # Restaura a matriz compartilhada, mesmo em caso de erro
+            for primeiro in reversed(selecionadas):
+                self._desselecionar(primeiro)
+
+        if self.orcamento is not None and self.orcamento.esgotado:
+            return ORCAMENTO_ESGOTADO
+        return self.contador_solucoes
+
+    def _colunas_da_linha(self, primeiro: int) -> list[int]:
+        colunas = [self.matriz.C[primeiro]]
+        j = self.matriz.R[primeiro]
+        while j != primeiro:
+            colunas.append(self.matriz.C[j])
+            j = self.matriz.R[j]
+        return colunas
+
+    def _selecionar(self, no: int):
+        """Inclui a linha do nó na solução parcial, cobrindo todas as suas colunas."""
+        m = self.matriz
+        m.cobrir(m.C[no])
+        j = m.R[no]
+        while j != no:
+            m.cobrir(m.C[j])
+            j = m.R[j]
+
+    def _desselecionar(self, no: int):
+        """Desfaz _selecionar(no), descobrindo as colunas na ordem inversa."""
+        m = self.matriz
+        j = m.L[no]
+        while j != no:
+            m.descobrir(m.C[j])
+            j = m.L[j]
+        m.descobrir(m.C[no])
+
+    def _buscar(self) -> bool:
+        """
+        Algorithm X com pilha explícita de quadros [coluna coberta, nó da
+        linha em teste], sem recursão (a profundidade é o número de células
+        vazias, o que estouraria o limite de recursão do Python no 36x36).
+        Retorna True quando o limite de soluções foi atingido ou o orçamento
+        acabou (sinal para parar); a matriz volta ao estado original em
+        qualquer caso.
+        """
+        m = self.matriz
+        R, L, D, C, S = m.R, m.L, m.D, m.C, m.S
+        est = self.estatisticas
+        orcamento = self.orcamento
+
+        pilha = []
+        parar = False
+        descer = True # Há um nó novo a examinar (a linha do topo acabou de ser escolhida)
+
+        while True:
+            if descer:
+                if orcamento is not None and orcamento.consumir():
+                    parar = True
+
+                # Caso Base (Sucesso): todas as restrições cobertas
+                elif R[0] == 0:
+                    self.contador_solucoes += 1
+                    if self.contador_solucoes == 1:
+                        self.solucao = list(self.parcial)
+                    parar = self.limite is not None and self.contador_solucoes >= self.limite
+
+                else:
+                    if est is not None:
+                        inicio = perf_counter()
+
+                    # Heurística S (equivalente ao MRV): coluna com menos linhas
+                    c = R[0]
+                    menor = S[c]
+                    j = R[c]
+                    while j != 0 and menor > 1:
+                        if S[j] < menor:
+                            c = j
+                            menor = S[j]
+                        j = R[j]
+
+                    if est is not None:
+                        est.tempo_selecao += perf_counter() - inicio
+                        est.candidatos_avaliados += menor
+
+                    # Com menor == 0 a restrição é impossível de cobrir: beco sem saída
+                    if menor > 0:
+                        m.cobrir(c)
+                        pilha.append([c, c])
+
+            if not pilha:
+                return parar
+
+            quadro = pilha[-1]
+            c, r = quadro
+
+            # Desfaz a linha que estava em teste neste quadro (se havia uma)
+            if r != c:
+                if est is not None:
+                    inicio = perf_counter()
+
+                j = L[r]
+                while j != r:
+                    m.descobrir(C[j])
+                    j = L[j]
+
+                if est is not None:
+                    est.tempo_validacao += perf_counter() - inicio
+                    est.backtrack()
+                self.parcial.pop()
+
+            r = D[r]
+            if parar or r == c:
+                # Linhas esgotadas (ou parada): volta para o quadro de baixo
+                m.descobrir(c)
+                pilha.pop()
+                descer = False
+                continue
+
+            # Tenta a próxima linha da coluna
+            quadro[1] = r
+            self.parcial.append(m.linha_do_no[r])
+            if est is not None:
+                inicio = perf_counter()
+
+            j = R[r]
+            while j != r:
+                m.cobrir(C[j])
+                j = R[j]
+
+            if est is not None:
+                est.tempo_validacao += perf_counter() - inicio
+                v, d = divmod(m.linha_do_no[r], m.tamanho)
+                est.no(v, d + 1)
+            descer = True
@@ -1,7 +1,119 @@
-import copy
 import random
+from collections import deque
 from interfaces import ISolver, ISolutionCounter
+from budget import SearchBudget, ORCAMENTO_ESGOTADO
 from graph import SudokuGraph
+from grid import CompactGrid
+from symmetry import transformacao_aleatoria
+from solvers import IterativeSolver
+
+# Simetrias aceitas por PuzzleGenerator.gerar_puzzle_em_lotes
+SIMETRIAS = ("nenhuma", "central", "quadrupla")
+
+
+def grade_padrao(n: int) -> CompactGrid:
+    """Solução completa de fórmula fechada para qualquer ordem n (sem busca)."""
+    t = n * n
+    return CompactGrid(n, [((linha % n) * n + linha // n + col) % t + 1
+                           for linha in range(t) for col in range(t)])
+
+
+def grupos_simetricos(graph: SudokuGraph, simetria: str = "nenhuma") -> list[tuple[int, ...]]:
+    """
+    Particiona os vértices em grupos que saem ou ficam juntos na cavação:
+    cada vértice sozinho, pares opostos pelo centro (rotação de 180°) ou
+    as órbitas da rotação de 90° (até 4 células).
+    """
+    t = graph.tamanho
+    vistos = set()
+    grupos = []
+
+    for v in range(graph.num_vertices):
+        if v in vistos:
+            continue
+
+        (l, c) = graph.vertice_para_grid(v)
+        if simetria == "central":
+            celulas = [(l, c), (t - 1 - l, t - 1 - c)]
+        elif simetria == "quadrupla":
+            celulas = [(l, c), (c, t - 1 - l), (t - 1 - l, t - 1 - c), (t - 1 - c, l)]
+        else:
+            celulas = [(l, c)]
+
+        grupo = tuple(sorted({graph.grid_para_vertice(linha, col) for linha, col in celulas}))
+        vistos.update(grupo)
+        grupos.append(grupo)
+
+    return grupos
+
+
+class BaseGridGenerator:
+    """
+    Produz soluções completas (grids base) aplicando simetrias aleatórias a
+    um pool de soluções-semente, sem rodar nenhuma busca por grid.
+
+    O pool de cada ordem n começa com as soluções pré-computadas de
+    SEMENTES_PADRAO (de 4x4 a 25x25, várias classes de isomorfismo), então
+    o padrão não roda busca nenhuma; ordens sem sementes usam a grade de
+    fórmula fechada, que sozinha dá uma única classe. Cada grid novo é uma
+    transformação aleatória (troca de dígitos, linhas/colunas dentro das
+    bandas/pilhas, bandas/pilhas, transposição) de uma semente sorteada.
+
+    Opcionalmente, 'sementes' acrescenta ao pool soluções obtidas pelo
+    solver injetado (padrão: IterativeSolver, com propagação) a partir de uma
+    primeira linha embaralhada, com um rng próprio (semente_pool), então o
+    pool é o mesmo em qualquer processo; e, com proporcao_solver > 0, essa
+    fração dos pedidos resolve uma solução nova (que entra no pool, até
+    max_pool). Cada solução resolvida custa uma busca inteira: ~0,03s no
+    9x9, ~0,4s no 16x16 e ~3s no 25x25.
+    """
+
+    def __init__(self, solver: ISolver | None = None, sementes: int = 0,
+                 proporcao_solver: float = 0.0, max_pool: int = 64, semente_pool=0):
+        if solver is None:
+            solver = IterativeSolver()
+
+        self.solver = solver
+        self.sementes = sementes
+        self.proporcao_solver = proporcao_solver
+        self.max_pool = max_pool
+        self.semente_pool = semente_pool
+        self.pools = {}
+
+    def gerar(self, n: int, rng: random.Random | None = None) -> CompactGrid:
+        """Retorna uma nova solução completa de ordem n."""
+        rng = rng or random
+        pool = self._pool(n)
+
+        if self.proporcao_solver > 0 and rng.random() < self.proporcao_solver:
+            nova = self._resolver_semente(n, rng)
+            if len(pool) < self.max_pool:
+                pool.append(nova)
+            return CompactGrid(n, nova)
+
+        return CompactGrid(n, transformacao_aleatoria(n, rng).aplicar(rng.choice(pool)))
+
+    def _pool(self, n: int) -> list[bytes]:
+        pool = self.pools.get(n)
+        if pool is None:
+            rng = random.Random(f"{self.semente_pool}:{n}")
+            pool = [bytes.fromhex(semente) for semente in SEMENTES_PADRAO.get(n, ())]
+            if not pool:
+                pool.append(bytes(grade_padrao(n).valores))
+            pool.extend(self._resolver_semente(n, rng) for _ in range(self.sementes))
+            self.pools[n] = pool
+        return pool
+
+    def _resolver_semente(self, n: int, rng) -> bytes:
+        """Resolve um grid vazio com a primeira linha embaralhada."""
+        grid = CompactGrid(n)
+        primeira_linha = list(range(1, n * n + 1))
+        rng.shuffle(primeira_linha)
+        grid.valores[:n * n] = bytes(primeira_linha)
+
+        if not self.solver.solve(grid, SudokuGraph(n=n)):
+            raise Exception("Erro: Não foi possível gerar um tabuleiro base.")
+        return bytes(grid.valores)
 
 class PuzzleGenerator:
     """
@@ -10,88 +122,458 @@ class PuzzleGenerator:
     específicos de resolução e contagem.
     """
 
-    def __init__(self, solver: ISolver, counter: ISolutionCounter):
+    def __init__(self, solver: ISolver, counter: ISolutionCounter,
+                 bases: BaseGridGenerator | None = None):
         """
         Inicializa o gerador com as 'ferramentas' necessárias.
 
         Args:
             solver: Um objeto que implementa ISolver (para criar a solução inicial).
             counter: Um objeto que implementa ISolutionCounter (para verificar a unicidade).
+            bases: Se informado, fornece as soluções base por isomorfismos
+                   aleatórios, em vez de resolver um grid a cada puzzle.
         """
         self.solver = solver
         self.counter = counter
+        self.bases = bases
+        self.completo = True
+        self.verificacoes = 0 # Chamadas ao contador na última geração
 
-    def gerar_puzzle(self, n: int) -> tuple[list[list[int]], list[list[int]]]:
+    def gerar_puzzle(self, n: int, rng: random.Random | None = None, verbose: bool = True,
+                     prazo: float | None = None) -> tuple[list[list[int]], list[list[int]]]:
         """
         Gera um novo puzzle de Sudoku com garantia de solução única.
 
         Args:
             n: O tamanho do bloco (ex: 3 para 9x9).
+            rng: Gerador aleatório a usar (para resultados reprodutíveis).
+                 Padrão: o módulo random global.
+            verbose: Se False, não imprime o progresso (uso em serviços/lotes).
+            prazo: Modo "anytime": segundos disponíveis para a geração inteira.
+                   Ao esgotar, a cavação para e o puzzle atual é devolvido
+                   (sempre com solução única, só com mais pistas que o normal).
+                   'completo' indica depois se todas as células foram testadas.
+                   'verificacoes', quantas chamadas ao contador foram feitas.
 
         Returns:
             Uma tupla contendo (puzzle, solucao)
         """
+        return self._com_prazo(prazo, self._gerar, n, rng or random, verbose)
+
+    def gerar_puzzle_em_lotes(self, n: int, rng: random.Random | None = None, verbose: bool = True,
+                              prazo: float | None = None, alvo_pistas: int | None = None,
+                              simetria: str = "nenhuma",
+                              tamanho_lote: int = 16,
+                              nos_por_vertice: int | None = 4) -> tuple[list[list[int]], list[list[int]]]:
+        """
+        Como gerar_puzzle, mas remove as pistas em lotes: uma única contagem
+        (limit=2) valida a remoção do lote inteiro. Se a unicidade quebra, o
+        lote é dividido ao meio e cada metade é tentada (bisseção) até isolar
+        as pistas necessárias. O tamanho do lote se adapta: dobra quando um
+        lote sai inteiro e cai pela metade quando quebra, então o começo da
+        cavação (quase tudo sai) gasta poucas verificações e o fim (quase
+        nada sai) volta ao teste de célula a célula. Se o contador entrega a
+        segunda solução (ao_encontrar) e ela só difere da original em um
+        grupo do lote, esse grupo fica sem bisseção nenhuma.
+
+        Sem alvo nem prazo, o puzzle é mínimo como no modo célula a célula:
+        uma pista só fica se removê-la sozinha já quebrava a unicidade.
+
+        Args:
+            n, rng, verbose, prazo: Como em gerar_puzzle.
+            alvo_pistas: Para de cavar ao atingir esse número de pistas (nunca
+                         remove abaixo dele; pode terminar acima se o puzzle
+                         ficar mínimo antes, ou se com simetria nenhum grupo
+                         restante couber na diferença).
+            simetria: "nenhuma", "central" (pares opostos pelo centro) ou
+                      "quadrupla" (órbitas da rotação de 90°); cada grupo
+                      de células sai ou fica junto.
+            tamanho_lote: Grupos no primeiro lote.
+            nos_por_vertice: Limite de nós das verificações de lotes com mais
+                             de um grupo, por vértice do grafo (4 = 324 nós no
+                             9x9); acima disso o lote conta como quebrado e é
+                             dividido. None = sem limite. Grupos sozinhos
+                             nunca têm limite, para o puzzle sair mínimo.
+
+        'verificacoes' indica depois quantas chamadas ao contador foram feitas.
+        """
+        if simetria not in SIMETRIAS:
+            raise ValueError(f"Simetria desconhecida: {simetria!r} (use {', '.join(SIMETRIAS)}).")
+
+        return self._com_prazo(prazo, self._gerar_em_lotes, n, rng or random, verbose,
+                               alvo_pistas, simetria, max(1, tamanho_lote), nos_por_vertice)
+
+    def _com_prazo(self, prazo: float | None, corpo, *args):
+        """Roda corpo(*args, orcamento) com o prazo da geração no contador."""
+        self.completo = True
+        self.verificacoes = 0
+
+        # O prazo vira um orçamento acumulado no contador: divide o tempo entre
+        # todas as verificações e interrompe até uma verificação em andamento
+        orcamento_anterior = self.counter.orcamento
+        orcamento = None
+        if prazo is not None:
+            orcamento = SearchBudget(prazo=prazo, acumular=True)
+            orcamento.iniciar()
+            self.counter.orcamento = orcamento
+
+        try:
+            return corpo(*args, orcamento)
+        finally:
+            self.counter.orcamento = orcamento_anterior
+
+    def _solucao_base(self, n: int, graph: SudokuGraph, rng, verbose: bool) -> CompactGrid:
+        """Passo comum aos dois modos: uma solução completa aleatória."""
+        # Grid compacto (bytearray plano): as cópias abaixo são cópias de buffer
+        grid_vazio = CompactGrid(n)
         
+        if verbose:
+            print("Gerando solução base aleatória...")
+
+        if self.bases is not None:
+            # Isomorfismo aleatório de uma semente: sem busca
+            grid_vazio = self.bases.gerar(n, rng)
+        else:
+            # 2a. Introduzir Aleatoriedade: Preencher a primeira linha aleatoriamente
+            # Isso garante que o solver gere um tabuleiro diferente a cada execução
+            primeira_linha = list(range(1, graph.tamanho + 1))
+            rng.shuffle(primeira_linha)
+
+            grid_vazio.valores[:graph.tamanho] = bytes(primeira_linha)
+
+            # 2b. Resolver o resto
+            # Verificamos se o solver teve sucesso (embora seja quase garantido aqui)
+            if not self.solver.solve(grid_vazio, graph):
+                raise Exception("Erro: Não foi possível gerar um tabuleiro base.")
+
+        return grid_vazio
+
+    def _gerar(self, n: int, rng, verbose: bool, orcamento: SearchBudget | None):
+        """Corpo de gerar_puzzle (o orçamento do prazo já está no contador)."""
         # --- Passo 1: Criar a base (Grid e Grafo) ---
         graph = SudokuGraph(n=n)
-        grid_vazio = [[0] * graph.tamanho for _ in range(graph.tamanho)]
-        
-        # --- Passo 2: Gerar uma solução completa [CORRIGIDO] ---
-        print("Gerando solução base aleatória...")
-        
-        # 2a. Introduzir Aleatoriedade: Preencher a primeira linha aleatoriamente
-        # Isso garante que o solver gere um tabuleiro diferente a cada execução
-        primeira_linha = list(range(1, graph.tamanho + 1))
-        random.shuffle(primeira_linha)
-        
-        for c in range(graph.tamanho):
-            grid_vazio[0][c] = primeira_linha[c]
-            
-        # 2b. Resolver o resto
-        # Verificamos se o solver teve sucesso (embora seja quase garantido aqui)
-        if not self.solver.solve(grid_vazio, graph):
-            raise Exception("Erro: Não foi possível gerar um tabuleiro base.")
 
-        solucao_completa = copy.deepcopy(grid_vazio)
+        # --- Passo 2: Gerar uma solução completa [CORRIGIDO] ---
+        grid_vazio = self._solucao_base(n, graph, rng, verbose)
+        solucao_completa = grid_vazio.snapshot()
         
-        # Este é o grid que vamos "cavar" para criar o puzzle
-        puzzle_grid = copy.deepcopy(solucao_completa)
+        # Este é o grid que vamos "cavar" para criar o puzzle (o próprio grid
+        # resolvido: a solução já está guardada no snapshot)
+        puzzle_grid = grid_vazio
+        valores = puzzle_grid.valores
         
         # --- Passo 3: Preparar a Remoção (Poda) ---
         # Cria uma lista de todos os vértices (0 a 80) e a embaralha
         vertices = list(range(graph.num_vertices))
-        random.shuffle(vertices)
+        rng.shuffle(vertices)
         
-        print(f"Iniciando a 'cavação' de {len(vertices)} células...")
+        if verbose:
+            print(f"Iniciando a 'cavação' de {len(vertices)} células...")
         
         # --- Passo 4: Loop de Remoção e Verificação ---
         for v in vertices:
-            (linha, col) = graph.vertice_para_grid(v)
-            
+            # Modo anytime: sem tempo para novas verificações
+            if orcamento is not None and orcamento.restante() == 0:
+                self.completo = False
+                break
+
             # Guarda o valor caso precisemos desfazer
-            valor_removido = puzzle_grid[linha][col]
+            valor_removido = valores[v]
             
             # Pula se a célula já foi removida (ex: em um puzzle simétrico)
             if valor_removido == 0:
                 continue
 
             # 4a. Tenta remover a pista
-            puzzle_grid[linha][col] = 0
+            valores[v] = 0
             
             # 4b. Verifica a Unicidade
-            # É CRUCIAL usar uma cópia, pois o contador modifica o grid!
-            grid_para_teste = copy.deepcopy(puzzle_grid)
-            
-            num_solucoes = self.counter.count_solutions(grid_para_teste, graph)
-            
-            # 4c. Decide
-            if num_solucoes > 1:
+            # O puzzle anterior tinha solução única (a solução completa), então
+            # a remoção só é inválida se existir uma solução com outra cor em v.
+            # O contador não modifica o grid, dispensando a cópia a cada teste.
+            self.verificacoes += 1
+            alternativa = self.counter.tem_solucao_alternativa(puzzle_grid, graph, v, valor_removido)
+
+            if alternativa is ORCAMENTO_ESGOTADO:
+                # Verificação interrompida: sem garantia, a pista volta
+                valores[v] = valor_removido
+                self.completo = False
+                if orcamento is not None:
+                    break # Prazo da geração esgotado: fica o melhor puzzle até aqui
+            elif alternativa:
                 # Se tiver mais de uma solução, a remoção foi inválida.
                 # Desfaz a remoção (coloca o número de volta).
-                puzzle_grid[linha][col] = valor_removido
+                valores[v] = valor_removido
             # else:
-                # Se num_solucoes == 1, a remoção foi válida! 
+                # Se a única solução é a original, a remoção foi válida!
                 # Deixa a célula como 0 e continua o loop.
         
-        print("Geração concluída.")
-        return (puzzle_grid, solucao_completa)
+        if verbose:
+            print("Geração concluída." if self.completo else "Geração interrompida pelo prazo.")
+        # Adaptadores: a API pública continua devolvendo listas de listas
+        return (puzzle_grid.para_lista(), CompactGrid(n, solucao_completa).para_lista())
+
+    def _gerar_em_lotes(self, n: int, rng, verbose: bool, alvo_pistas: int | None, simetria: str,
+                        tamanho_lote: int, nos_por_vertice: int | None, orcamento: SearchBudget | None):
+        """Corpo de gerar_puzzle_em_lotes (o orçamento do prazo já está no contador)."""
+        graph = SudokuGraph(n=n)
+        puzzle_grid = self._solucao_base(n, graph, rng, verbose)
+        solucao_completa = puzzle_grid.snapshot()
+
+        grupos = grupos_simetricos(graph, simetria)
+        rng.shuffle(grupos)
+
+        pistas = graph.num_vertices
+        alvo = alvo_pistas or 0
+        limite_nos = nos_por_vertice * graph.num_vertices if nos_por_vertice is not None else None
+
+        # Grupos ainda não tentados. Um grupo só sai da fila ao entrar em um
+        # lote: depois dele, ou foi removido ou ficou como necessário
+        pendentes = deque(grupos)
+
+        if verbose:
+            print(f"Iniciando a cavação de {len(grupos)} grupos de células "
+                  f"(primeiro lote: {tamanho_lote} grupos)...")
+
+        while pendentes and pistas > alvo:
+            if orcamento is not None and orcamento.restante() == 0:
+                self.completo = False
+                break
+
+            # Monta o lote sem descer abaixo do alvo, mesmo se ele sair
+            # inteiro. Os grupos que não cabem no excesso voltam para a fila:
+            # se a bisseção mantiver parte do lote, eles ainda cabem depois
+            lote = []
+            adiados = []
+            excesso = pistas - alvo
+            while pendentes and len(lote) < tamanho_lote and excesso > 0:
+                grupo = pendentes.popleft()
+                if len(grupo) <= excesso:
+                    lote.append(grupo)
+                    excesso -= len(grupo)
+                else:
+                    adiados.append(grupo)
+            pendentes.extendleft(reversed(adiados))
+
+            if not lote:
+                break # Nenhum grupo restante cabe sem passar do alvo
+
+            removidas, inteiro = self._remover_lote(puzzle_grid, graph, lote, solucao_completa,
+                                                    orcamento, limite_nos)
+            pistas -= removidas
+            tamanho_lote = tamanho_lote * 2 if inteiro else max(1, tamanho_lote // 2)
+
+            if not self.completo and orcamento is not None:
+                break # Prazo da geração esgotado: fica o melhor puzzle até aqui
+
+        if verbose:
+            print(f"Geração concluída: {pistas} pistas, {self.verificacoes} verificações."
+                  if self.completo else "Geração interrompida pelo prazo.")
+        return (puzzle_grid.para_lista(), CompactGrid(n, solucao_completa).para_lista())
+
+    def _remover_lote(self, grid: CompactGrid, graph: SudokuGraph, lote: list[tuple[int, ...]],
+                      solucao: bytes, orcamento: SearchBudget | None, limite_nos: int | None,
+                      falha_conhecida: bool = False) -> tuple[int, bool]:
+        """
+        Remove os grupos do lote se o puzzle continuar com solução única;
+        senão, tenta cada metade (bisseção). Retorna (pistas removidas, se o
+        lote saiu inteiro). Com falha_conhecida, já se sabe que o lote
+        inteiro quebra a unicidade e a verificação é pulada.
+        """
+        if not lote:
+            return 0, True
+        if orcamento is not None and orcamento.restante() == 0:
+            self.completo = False
+            return 0, False
+
+        valores = grid.valores
+        alternativa = None
+        comprovada = falha_conhecida # A quebra foi vista (e não só inconclusiva)?
+
+        if not falha_conhecida:
+            removidos = [(v, valores[v]) for grupo in lote for v in grupo]
+            for v, _ in removidos:
+                valores[v] = 0
+
+            unica, alternativa = self._verificar(grid, graph, [v for v, _ in removidos], solucao,
+                                                 limite_nos if len(lote) > 1 else None)
+            if unica:
+                return len(removidos), True
+            comprovada = unica is False
+
+            for v, valor in removidos:
+                valores[v] = valor
+
+            if not self.completo and orcamento is not None:
+                return 0, False # Prazo esgotado no meio da verificação
+
+        if len(lote) == 1:
+            # Necessário agora, continua necessário: remover mais pistas só
+            # aumenta o número de soluções
+            return 0, False
+
+        if alternativa is not None:
+            # A outra solução concorda com a original em todo o resto do
+            # puzzle; se ela só difere em um grupo do lote, esse grupo
+            # sozinho já a permite (fica, sem verificar) e o resto é tentado
+            culpados = [grupo for grupo in lote if any(alternativa[v] != solucao[v] for v in grupo)]
+            if len(culpados) == 1:
+                removidas, _ = self._remover_lote(grid, graph, [g for g in lote if g is not culpados[0]],
+                                                  solucao, orcamento, limite_nos)
+                return removidas, False
+
+        meio = len(lote) // 2
+        primeira, inteira = self._remover_lote(grid, graph, lote[:meio], solucao, orcamento, limite_nos)
+        # Se a primeira metade saiu inteira, a quebra vem da segunda sozinha
+        segunda, _ = self._remover_lote(grid, graph, lote[meio:], solucao, orcamento, limite_nos,
+                                        falha_conhecida=inteira and comprovada)
+        return primeira + segunda, False
+
+    def _verificar(self, grid: CompactGrid, graph: SudokuGraph, removidos: list[int], solucao: bytes,
+                   limite_nos: int | None) -> tuple[bool | None, bytes | None]:
+        """
+        Uma chamada ao contador para o puzzle sem as pistas 'removidos':
+        count_solutions com limit=2 (o puzzle anterior era único), ou
+        tem_solucao_alternativa quando só uma célula saiu.
+        Retorna (única, alternativa), onde alternativa é uma solução diferente
+        da original, quando o contador a entrega por 'ao_encontrar'.
+
+        Com limite_nos, uma busca mais longa que isso é inconclusiva: única
+        vem None e as pistas ficam, como numa quebra (o lote é dividido, mas
+        nada é deduzido dela). Lotes grandes podem cair em puzzles muito
+        abertos, onde a busca sem propagação demora a achar até a segunda
+        solução.
+        """
+        alternativa = None
+
+        def guardar(valores_busca):
+            nonlocal alternativa
+            if alternativa is None and bytes(valores_busca) != solucao:
+                alternativa = bytes(valores_busca)
+
+        orcamento_anterior = self.counter.orcamento
+        ao_encontrar_anterior = self.counter.ao_encontrar
+        self.counter.ao_encontrar = guardar
+        if limite_nos is not None:
+            # Respeita o prazo em curso (o orçamento acumulado do contador)
+            prazo = orcamento_anterior.restante() if orcamento_anterior is not None else None
+            self.counter.orcamento = SearchBudget(prazo=prazo, max_nos=limite_nos)
+
+        self.verificacoes += 1
+        try:
+            if len(removidos) == 1:
+                # Uma célula só: a pergunta mais barata do modo célula a célula
+                v = removidos[0]
+                resultado = self.counter.tem_solucao_alternativa(grid, graph, v, solucao[v])
+                unica = not resultado
+            else:
+                resultado = self.counter.count_solutions(grid, graph, limit=2)
+                unica = resultado == 1
+        finally:
+            self.counter.orcamento = orcamento_anterior
+            self.counter.ao_encontrar = ao_encontrar_anterior
+
+        if alternativa is not None:
+            return False, alternativa # Prova de quebra, mesmo que o orçamento tenha acabado depois
+
+        if resultado is ORCAMENTO_ESGOTADO:
+            sem_tempo = orcamento_anterior is not None and orcamento_anterior.restante() == 0
+            if limite_nos is None or sem_tempo:
+                self.completo = False # Sem garantia: as pistas voltam
+            return None, None
+
+        return unica, alternativa
+
+
+# --- Sementes pré-computadas ---
+# Soluções completas por ordem n, em hexadecimal (um byte por célula, por vértice),
+# usadas como pool padrão do BaseGridGenerator. Foram resolvidas uma vez com o
+# IterativeSolver a partir de primeiras linhas embaralhadas (no 4x4, um representante
+# de cada uma das duas classes de isomorfismo); ordens sem entrada usam grade_padrao.
+SEMENTES_PADRAO: dict[int, tuple[str, ...]] = {
+    2: (
+        "01020304030401020201040304030201",
+        "01020304030401020203040104010203",
+    ),
+    3: (
+        "0607090805040102030102030607090405080405080102030607090206010308050709040703040209010508060908050406"
+        "07020301030402050108090607050107090306080402080906070402030105",
+        "0507060209010408030102030407080506090408090305060102070204010803050907060603050704090201080809070106"
+        "02030405030502060804070901070108090203060504090604050107080302",
+        "0608030104050907020102040708090305060507090203060104080203010805040609070809060307010502040405070609"
+        "02080103030105040607020809070602090108040305090408050203070601",
+        "0802030605010907040104050708090203060607090203040105080203010504070806090708060309020401050509040106"
+        "08030207030108040705060902040502090106070803090607080203050401",
+        "0406020301090805070103050607080204090708090204050103060201060805030709040307080902040506010509040106"
+        "07030208060203040801090705080407050902060103090501070306040802",
+        "0803060905020107040102040306070508090507090104080203060208010703040906050604030209050701080709050608"
+        "01030402030108050206040907040507080109060203090602040703080501",
+    ),
+    4: (
+        "020c040b0805010a030e090d06070f100103050607090f100204080a0b0c0d0e0708090a0b0c0d0e05060f10010203040d0e"
+        "0f100203040601070b0c0508090a030701020c0d0a040e0b05060f100809090d060e010208070f1004030a0b0c050f0a0804"
+        "050b100307090c01020e060d100b0c050e06090f080d0a020301040704010a030d0706080c05020e10090b0f050f1007090e"
+        "0b0c0a0106040d0302080e020d080f1005010b0307090c040a0606090b0c040a030210080d0f07050e01080502090a010e0b"
+        "060f0307040d100c0a04070f03080c090d0210050e06010b0b060301100f070d040c0e08090a05020c100e0d06040205090a"
+        "010b080f0703",
+        "090b0302010e080a10070d0c0f06050401040506070b0c0f020308090a0d0e1007080a0c04050d10060b0e0f010203090d0e"
+        "0f10020306090104050a07080b0c020104080d0609030c0f07050b0e100a0e0306050c100f020a010b0d040709080f0a070b"
+        "05040108090e06100c030d02100c090d0a070e0b040203080501060f030708010b09040c0e0d0f0206100a050a0f0b04100d"
+        "0206050c01030e09080705100c090801030e07060a04020b0f0d06020d0e0f0a05070809100b03040c0104050e07030c1001"
+        "0d0a0906080f020b080d010309020b040f050c0e100a07060b09020f06080a05031004070d0c010e0c06100a0e0f070d0b08"
+        "020109050403",
+        "09020d0a060c10040805010e03070f0b01030405020708090b0d0f10060a0c0e0607080b0a0d0e0f0203040c010509100c0e"
+        "0f100103050b0607090a0204080d020a01030e0904080c0b0d050f1006070b10050f03010a07090e08060c0d02040408060d"
+        "0c0b02050f100a0709010e03070c090e0d0f0610030102040a080b050306020409050b010d0a0e08100f070c0d0b0c01070a"
+        "030e040f1009080605020e0510070f080c020106030b04090d0a0f090a0804100d06050c07020b0e0301050d07060804010c"
+        "0a020b0f0e03100908010b02050e09031004060d070c0a0f0a040e0910020f0d07080c03050b0106100f030c0b06070a0e09"
+        "05010d020408",
+        "0105100f0c0a080d0b0904060e0702030203040601050709080a0c0e0b0d0f100708090a060b0e1002030d0f0104050c0b0c"
+        "0d0e0203040f010507100608090a030b01020d0905040e0f0a0708100c060c0f05040e07100a0306010802090b0d0a0d0708"
+        "030c0f060910020b0405010e0e1006090801020b040c050d0a0f030704010a0b0f0d09050c020e03100607080d060e100702"
+        "010c0a080b050903040f08090c030410060e0d070f0105020a0b05020f070a080b03060410090c0e0d01060702050b040d01"
+        "0f0e080a030c10090904080105060a07100d030c0f0b0e020f0a030d100e0c08050b090207010604100e0b0c090f03020701"
+        "06040d0a0805",
+    ),
+    5: (
+        "050a090d1913150401180c0b11060f03170e1012020714160801020304061214161719050708090a0b0c0d0f110e10131518"
+        "07080b0c0e02030506090d1013171801041415160a0f1112190f1011121307080a0b0c0e1415161902050609180103040d17"
+        "14151617180d0e0f1011010203041207080a13190506090b0c02110103040c0d14120516130e100617150b070818190f090a"
+        "16181719050e0b090a070f0d0c1101131402060315120804100c0e0f080d041306191507031218021011090a0116170b0514"
+        "09060a0b07100f180802171519140512160c0d04030e011113101213151411170103160a040b080918190f0e050c020d0607"
+        "03010e0a02080711140d12160905150f0b180410170c1913061813140512090c0b0201040e0a0710150619170d0f16030811"
+        "0b0d04060f1718191610080c010211090313140e0715120a0511160807101504130f031917060b140a1201050c09180e020d"
+        "15190c0917060a0e0512180f0d031308021116070b14100104040306160c01090d0e0f10080219071413051117120b0a1815"
+        "17050d13091810080714150a040c16060e03120b110102190f0807150201051217110a13060f0e0b190d1018091404160c03"
+        "0e0b18100a1916031304110514120d0c0115020f0608071709120f1914110b020c15060918170103040716080a0d1305100e"
+        "0609020e151601120d080319180a04050f070c13101117140b0a0405110803060209170b0107150c0e10121914130d180f16"
+        "0d0c0701030a051004131412160f081118170b061909150e02131410180b0f19070c0e0211050d171609040115080a060312"
+        "1917120f16141115180b060910130e0d0a08030204050c0701",
+        "1406080c180d04130e120a050109100717020b03190f11151601020304050b0c0f101115161718190d0e121314060708090a"
+        "07090a0b0d0102030506080c0e0f13041115161910121417180e0f1011121415161719020304060708090a0c1801050b0d13"
+        "13151617190708090a180b0d1112140105060f100203040c0e021001030412130c060a14150d0e05170f11070b1618190809"
+        "1113151606080e14070b170f0c03041819090a0112020d05100b0e120507171619110f01091802061014080d130a1503040c"
+        "0c14170a0815100d1809121907110b02030504160e010f13060f18190d090501040203100813160a12060c0e151114070b17"
+        "03010b14020e0d06150711120a0c0816101805090f13171904160804090a100f050c02031415171811131912070b06010e0d"
+        "170d05100c111908120116040b1302140a0e060f0309151807181106130e04030a14160f071905090b0117150d080c100212"
+        "191207150f18090b13170d0e061001030804020c05110a1614040314060b090a17010c131008071115020d190e1816120f05"
+        "080a0d191003180716130c06050b1509120f0104170e02141109050e18170211100b1504010f0d120c16031408130a060719"
+        "12160c0f1306050e190418020314170a070b1011150d09010815070201110f1412080d0e0a0919160518131706040b0c1003"
+        "0d171108141306010310090b12040f0e0c1618020719050a150a0b1802011607110d05191710080313151409120c040e060f"
+        "05190912150a0b18040e061116010c0f0d07081714101303020604130e030c17150f140718020a0d190b1011050908161201"
+        "100c0f07161912020908051314150e060401030a0d1718110b",
+        "1016030f0702011719040d0912141306050c0a150b1808110e01020405060e111213150307080a0b1416171819090c0d0f10"
+        "08090a0b0c030506070d10111516180102040e0f12131417190d0e1112130a0c10141805060f1719030708090b0102041516"
+        "141517181908090b0f160102040c0e0d10111213030506070a020f010304141605060a17180e07081211130b0c1910150d09"
+        "181415170519120d0e0f041309010a0208100307160b11060c06070e0c0813040209030b10110d1418191517160a010f0512"
+        "0b0d1211090c100717081619050f15040a1401060e03131802161013190a110b1518010c03020612050e0f0d090814070417"
+        "03010c06020d0e110410180a190905150f071408171216130b130414101707190c010612150d0b0f160309020a180e050811"
+        "12110f0915170a18051306011608100e0c0b040d1419020307070b19161815140f08020e0c17031110130105120406090a0d"
+        "0a08050e0d120309160b13041402071118190617100f010c15040c08010e050f130b14111607180309120a10020d15171906"
+        "05180b0a11040d081517090e0c19061314031601020710120f0f131607100902030c11080d0a1201171506190e05040b1418"
+        "191709140318060e1012150f0b1302070d050c0411080a16011506020d120107160a191405100417080b180f110c09030e13"
+        "090307020f0b15140d050a12060e0c190416111013171801080c1210080b0f17040307021401110d0a060e13181516190905"
+        "0e0a1813011608191109070b0310040f17121505060d0c02141119061514101301020e0f171805160c090d0803070a120b04"
+        "17050d041606180a120c19081315090b010207140f110e1003",
+    ),
+}
@@ -1,12 +1,91 @@
 from interfaces import IGraph
 
+# Cache de topologias por chave (a ordem 'n' no Sudoku clássico): o grafo é
+# montado uma única vez por processo
+_TOPOLOGIAS = {}
+
+
+class Topologia:
+    """
+    Tabelas planas e imutáveis de um grafo Sudoku, indexadas pelo vértice.
+
+    Montadas uma vez a partir das listas de adjacência e das unidades, evitam
+    que os solvers refaçam divisões (vertice_para_grid) e consultas a sets
+    nos loops críticos:
+    - vizinhos[v]: tupla com os vizinhos de v.
+    - coordenadas[v]: (linha, col) de v.
+    - linha_de[v], col_de[v], bloco_de[v]: índices de linha, coluna e bloco de v.
+    - unidades: tuplas de vértices (linhas, depois colunas, depois blocos e,
+      nas variantes, as regiões/unidades extras).
+    - unidades_de[v]: índices (em 'unidades') das unidades que contêm v.
+    - colunas_unidades[k][v]: k-ésima unidade de v, em colunas de largura fixa
+      (ao menos 3). Vértices em menos unidades apontam para o índice extra
+      len(unidades), uma unidade vazia, para que os motores leiam as unidades
+      de v com acessos diretos, sem laço, em qualquer variante.
+    - classica: True se valem as simetrias do Sudoku clássico (symmetry.py).
+
+    linha_de, col_de e bloco_de são coordenadas (bloco n x n padrão); as
+    restrições de verdade, em qualquer variante, são as 'unidades'.
+    """
+
+    def __init__(self, graph: "SudokuGraph"):
+        self.n = graph.n
+        self.tamanho = graph.tamanho
+        self.num_vertices = graph.num_vertices
+
+        # frozenset: compartilhado entre instâncias, não pode ser alterado
+        self.adj = {v: frozenset(vizinhos) for v, vizinhos in graph.grafo_adj.items()}
+        self.vizinhos = tuple(tuple(sorted(self.adj[v])) for v in range(self.num_vertices))
+
+        self.coordenadas = tuple(graph.vertice_para_grid(v) for v in range(self.num_vertices))
+        self.linha_de = tuple(linha for (linha, _) in self.coordenadas)
+        self.col_de = tuple(col for (_, col) in self.coordenadas)
+        self.bloco_de = tuple((linha // self.n) * self.n + col // self.n
+                              for (linha, col) in self.coordenadas)
+
+        self.unidades = tuple(tuple(unidade) for unidade in graph.unidades)
+
+        unidades_de = [[] for _ in range(self.num_vertices)]
+        for i, unidade in enumerate(self.unidades):
+            for v in unidade:
+                unidades_de[v].append(i)
+        self.unidades_de = tuple(tuple(indices) for indices in unidades_de)
+
+        vazia = len(self.unidades)
+        largura = max(3, max(len(indices) for indices in self.unidades_de))
+        self.colunas_unidades = tuple(
+            tuple(indices[k] if k < len(indices) else vazia for indices in self.unidades_de)
+            for k in range(largura)
+        )
+
+        self.classica = graph.classica
+
+
 class SudokuGraph(IGraph):
+    # Valem as simetrias do Sudoku clássico (forma canônica da cache)
+    classica = True
+
     def __init__(self, n=3):
         self.n = n
         self.tamanho = n**2
         self.num_vertices = n**4
 
-        self.construir_grafo()
+        # Só a primeira instância de cada ordem (ou variante) monta o grafo;
+        # as demais reaproveitam a topologia em cache.
+        chave = self.chave_topologia()
+        self.topologia = _TOPOLOGIAS.get(chave)
+        if self.topologia is None:
+            self.construir_unidades()
+            self.construir_grafo()
+            self.topologia = Topologia(self)
+            _TOPOLOGIAS[chave] = self.topologia
+
+        self.grafo_adj = self.topologia.adj
+        self.unidades = self.topologia.unidades
+
+    def chave_topologia(self):
+        """Identifica a topologia no cache (variantes acrescentam suas unidades)."""
+        return self.n
 
     def vertice_para_grid(self, v: int) -> tuple[int, int]:
         linha = v // self.tamanho
@@ -56,5 +135,153 @@ class SudokuGraph(IGraph):
         self.grafo_adj = adj
         return adj
     
+    def construir_unidades(self):
+        """
+        Lista as unidades (linhas, colunas e blocos) como tuplas de vértices.
+        Cada unidade é uma clique do grafo: todas as suas cores são distintas.
+        """
+        unidades = []
+
+        for linha in range(self.tamanho):
+            unidades.append(tuple(self.grid_para_vertice(linha, col) for col in range(self.tamanho)))
+
+        for col in range(self.tamanho):
+            unidades.append(tuple(self.grid_para_vertice(linha, col) for linha in range(self.tamanho)))
+
+        for inicio_linha in range(0, self.tamanho, self.n):
+            for inicio_col in range(0, self.tamanho, self.n):
+                unidades.append(tuple(
+                    self.grid_para_vertice(inicio_linha + i_bloco, inicio_col + j_bloco)
+                    for i_bloco in range(self.n)
+                    for j_bloco in range(self.n)
+                ))
+
+        self.unidades = unidades
+        return unidades
+
     def get_vizinhos(self, v):
-        return self.grafo_adj[v]
\ No newline at end of file
+        return self.grafo_adj[v]
+
+    def get_unidades(self):
+        return self.unidades
+
+
+class VariantGraph(SudokuGraph):
+    """
+    Sudoku definido por unidades: linhas e colunas, as regiões (blocos n x n
+    ou, no jigsaw, regiões irregulares) e unidades extras quaisquer (diagonais,
+    janelas...). Cada unidade é uma clique: as arestas são todas derivadas
+    delas, e os motores que leem a topologia (máscaras, propagação, DLX)
+    funcionam sem mudança.
+
+    Args:
+        n: Ordem (3 para 9x9).
+        regioes: Grid n² x n² com o índice (0..n²-1) da região de cada célula,
+                 no lugar dos blocos. None mantém os blocos.
+        unidades_extras: Unidades adicionais, como sequências de n² células
+                         (linha, col) distintas.
+        nome: Nome da variante (só para exibição).
+    """
+
+    classica = False
+
+    def __init__(self, n: int = 3, regioes=None, unidades_extras=(), nome: str = "variante"):
+        self.nome = nome
+        self.regioes = None if regioes is None else tuple(tuple(linha) for linha in regioes)
+        self.unidades_extras = tuple(tuple(tuple(celula) for celula in unidade) for unidade in unidades_extras)
+        super().__init__(n)
+
+    def chave_topologia(self):
+        return (self.n, self.regioes, self.unidades_extras)
+
+    def construir_unidades(self):
+        super().construir_unidades()
+
+        if self.regioes is not None:
+            # Troca os blocos (as últimas n² unidades) pelas regiões irregulares
+            if len(self.regioes) != self.tamanho or any(len(linha) != self.tamanho for linha in self.regioes):
+                raise ValueError(f"As regiões devem formar um grid {self.tamanho}x{self.tamanho}.")
+
+            regioes = [[] for _ in range(self.tamanho)]
+            for linha, indices in enumerate(self.regioes):
+                for col, r in enumerate(indices):
+                    if not 0 <= r < self.tamanho:
+                        raise ValueError(f"Região inválida {r} na célula ({linha}, {col}).")
+                    regioes[r].append(self.grid_para_vertice(linha, col))
+
+            if any(len(regiao) != self.tamanho for regiao in regioes):
+                raise ValueError(f"Cada região deve ter exatamente {self.tamanho} células.")
+
+            self.unidades[-self.tamanho:] = [tuple(regiao) for regiao in regioes]
+
+        for unidade in self.unidades_extras:
+            vertices = tuple(self.grid_para_vertice(linha, col) for (linha, col) in unidade)
+            # Todos os motores tratam cada unidade como "todas as cores aparecem
+            # uma vez" (hidden singles, cobertura exata), então ela precisa
+            # ter exatamente n² células distintas
+            if len(set(vertices)) != len(vertices) or len(vertices) != self.tamanho:
+                raise ValueError(f"Unidade extra inválida (precisa de {self.tamanho} células distintas): {unidade}.")
+            self.unidades.append(vertices)
+
+        return self.unidades
+
+    def construir_grafo(self):
+        """Liga cada par de vértices que divide alguma unidade."""
+        adj = {v: set() for v in range(self.num_vertices)}
+        for unidade in self.unidades:
+            for v in unidade:
+                adj[v].update(unidade)
+        for v in adj:
+            adj[v].discard(v)
+
+        self.grafo_adj = adj
+        return adj
+
+
+class DiagonalSudokuGraph(VariantGraph):
+    """Sudoku X: as duas diagonais principais também não repetem cores."""
+
+    def __init__(self, n: int = 3):
+        t = n * n
+        diagonais = (
+            tuple((i, i) for i in range(t)),
+            tuple((i, t - 1 - i) for i in range(t)),
+        )
+        super().__init__(n, unidades_extras=diagonais, nome="diagonal")
+
+
+class WindokuGraph(VariantGraph):
+    """
+    Windoku (hyper): (n-1)² janelas n x n extras, separadas por uma linha e
+    uma coluna das bordas e entre si (as 4 janelas sombreadas no 9x9).
+    """
+
+    def __init__(self, n: int = 3):
+        inicios = [1 + k * (n + 1) for k in range(n - 1)]
+        janelas = tuple(
+            tuple((l0 + i, c0 + j) for i in range(n) for j in range(n))
+            for l0 in inicios for c0 in inicios
+        )
+        super().__init__(n, unidades_extras=janelas, nome="windoku")
+
+
+class JigsawSudokuGraph(VariantGraph):
+    """Jigsaw: regiões irregulares (grid de índices de região) no lugar dos blocos."""
+
+    def __init__(self, regioes):
+        n = int(round(len(regioes) ** 0.5))
+        super().__init__(n, regioes=regioes, nome="jigsaw")
+
+    @classmethod
+    def de_texto(cls, texto: str) -> "JigsawSudokuGraph":
+        """Lê as regiões de n² linhas com um caractere (0-9, A-Z) por célula."""
+        linhas = [linha.strip() for linha in texto.splitlines() if linha.strip()]
+        return cls([[int(caractere, 36) for caractere in linha] for linha in linhas])
+
+
+# Variantes selecionáveis pelo nome (linha de comando, serviço)
+VARIANTES = {
+    "classico": SudokuGraph,
+    "diagonal": DiagonalSudokuGraph,
+    "windoku": WindokuGraph,
+}
\ No newline at end of file
@@ -0,0 +1,122 @@
+from typing import Sequence
+
+
+class CompactGrid:
+    """
+    Grid de Sudoku compacto: um bytearray plano com n⁴ células, indexado pelo
+    vértice (v = linha * tamanho + col, a mesma numeração do SudokuGraph).
+
+    - Um byte por célula (cores até 255, ou seja, qualquer ordem até 15x15 blocos),
+      contra uma lista de listas de objetos int.
+    - snapshot()/restaurar() e copia() são cópias de buffer, sem deepcopy.
+    - Continua compatível com a API de lista de listas: grid[linha] devolve
+      uma memoryview da linha (leitura e escrita), len(grid) é o tamanho e
+      iterar percorre as linhas. Assim qualquer ISolver aceita um CompactGrid
+      sem adaptação; os que trabalham com vértices leem 'valores' direto.
+    """
+
+    __slots__ = ("n", "tamanho", "valores", "_linhas")
+
+    def __init__(self, n: int, valores: Sequence[int] | None = None):
+        self.n = n
+        self.tamanho = n * n
+        num_vertices = self.tamanho * self.tamanho
+
+        if valores is None:
+            self.valores = bytearray(num_vertices)
+        else:
+            if len(valores) != num_vertices:
+                raise ValueError(f"Esperados {num_vertices} valores, recebidos {len(valores)}.")
+            self.valores = bytearray(valores)
+
+        self._linhas = None
+
+    @classmethod
+    def de_lista(cls, grid: list[list[int]]) -> "CompactGrid":
+        """Adaptador de entrada: monta o grid compacto a partir de uma lista de listas."""
+        n = int(round(len(grid) ** 0.5))
+        return cls(n, [valor for linha in grid for valor in linha])
+
+    def para_lista(self) -> list[list[int]]:
+        """Adaptador de saída: devolve o grid como lista de listas (cópia)."""
+        t = self.tamanho
+        return [list(self.valores[i:i + t]) for i in range(0, len(self.valores), t)]
+
+    def copia(self) -> "CompactGrid":
+        return CompactGrid(self.n, self.valores)
+
+    def snapshot(self) -> bytes:
+        """Estado atual como bytes imutáveis (para restaurar depois)."""
+        return bytes(self.valores)
+
+    def restaurar(self, snapshot: bytes):
+        """Volta ao estado de um snapshot, copiando o buffer no lugar."""
+        self.valores[:] = snapshot
+
+    def vazios(self) -> int:
+        return self.valores.count(0)
+
+    # --- Compatibilidade com list[list[int]] ---
+
+    def _views(self) -> list[memoryview]:
+        # As views são criadas sob demanda e reaproveitadas (escrevem no buffer)
+        if self._linhas is None:
+            buffer = memoryview(self.valores)
+            t = self.tamanho
+            self._linhas = [buffer[i:i + t] for i in range(0, len(self.valores), t)]
+        return self._linhas
+
+    def __getitem__(self, linha: int) -> memoryview:
+        return self._views()[linha]
+
+    def __len__(self) -> int:
+        return self.tamanho
+
+    def __iter__(self):
+        return iter(self._views())
+
+    def __eq__(self, outro) -> bool:
+        if isinstance(outro, CompactGrid):
+            return self.valores == outro.valores
+        return NotImplemented
+
+    def __copy__(self) -> "CompactGrid":
+        return self.copia()
+
+    def __deepcopy__(self, memo) -> "CompactGrid":
+        return self.copia()
+
+    def __getstate__(self):
+        # As memoryviews não são serializáveis (pickle/multiprocessing)
+        return (self.n, bytes(self.valores))
+
+    def __setstate__(self, estado):
+        n, valores = estado
+        self.n = n
+        self.tamanho = n * n
+        self.valores = bytearray(valores)
+        self._linhas = None
+
+    def __repr__(self) -> str:
+        return f"CompactGrid(n={self.n}, vazios={self.vazios()})"
+
+
+def valores_por_vertice(grid, coordenadas: Sequence[tuple[int, int]]) -> Sequence[int]:
+    """
+    Valores do grid indexados pelo vértice, para qualquer representação
+    ('coordenadas' é a tabela da Topologia). Para CompactGrid devolve o
+    próprio buffer (sem cópia).
+    """
+    if isinstance(grid, CompactGrid):
+        return grid.valores
+    return [grid[linha][col] for (linha, col) in coordenadas]
+
+
+def gravar_por_vertice(grid, coordenadas: Sequence[tuple[int, int]], valores: Sequence[int]):
+    """Escreve no grid (de qualquer representação) os valores indexados pelo vértice."""
+    if isinstance(grid, CompactGrid):
+        grid.valores[:] = bytes(valores)
+        return
+
+    for v, (linha, col) in enumerate(coordenadas):
+        grid[linha][col] = valores[v]
@@ -0,0 +1,101 @@
+from time import perf_counter
+from typing import Callable
+
+
+class SearchStats:
+    """
+    Estatísticas (e trace opcional) da busca de um ISolver/ISolutionCounter.
+
+    Para ativar, basta atribuir uma instância ao atributo 'estatisticas' do
+    motor (ex: solver.estatisticas = SearchStats()). Com o atributo em None
+    (o padrão), os motores pagam apenas um teste 'is None' por nó, então dá
+    para deixar a coleta ligada em uma amostra das chamadas em produção.
+
+    Campos:
+    - nos: atribuições (vértice, cor) tentadas na busca.
+    - backtracks: atribuições desfeitas por não levarem a uma solução.
+    - profundidade_maxima: maior número de atribuições empilhadas ao mesmo tempo.
+    - candidatos_avaliados: pares (vértice, cor) considerados nos pontos de
+      ramificação (no naive, cada teste de validade de uma cor).
+    - propagacoes: chamadas do propagador de restrições (motores que propagam).
+    - tempo_selecao: segundos gastos escolhendo o próximo vértice/coluna.
+    - tempo_validacao: segundos gastos verificando/mantendo a consistência
+      (teste de vizinhos, atualização de máscaras, propagação ou cover/uncover).
+
+    'ao_visitar_no(v, cor, profundidade)' é chamado a cada nó, se informado.
+    Com acumular=False (padrão) os contadores são zerados a cada chamada de
+    solve/count_solutions; com True, somam todas as chamadas (ex: todas as
+    verificações de unicidade de uma geração).
+    """
+
+    def __init__(self, ao_visitar_no: Callable[[int, int, int], None] | None = None,
+                 acumular: bool = False):
+        self.ao_visitar_no = ao_visitar_no
+        self.acumular = acumular
+        self.zerar()
+
+    def zerar(self):
+        self.nos = 0
+        self.backtracks = 0
+        self.profundidade = 0
+        self.profundidade_maxima = 0
+        self.candidatos_avaliados = 0
+        self.propagacoes = 0
+        self.tempo_selecao = 0.0
+        self.tempo_validacao = 0.0
+
+    def iniciar(self):
+        """Chamado pelos motores no início de cada solve/count_solutions."""
+        if not self.acumular:
+            self.zerar()
+        self.profundidade = 0
+
+    def no(self, v: int, cor: int):
+        """Registra a atribuição da cor ao vértice v (um nó a mais na pilha)."""
+        self.nos += 1
+        self.profundidade += 1
+        if self.profundidade > self.profundidade_maxima:
+            self.profundidade_maxima = self.profundidade
+
+        if self.ao_visitar_no is not None:
+            self.ao_visitar_no(v, cor, self.profundidade)
+
+    def backtrack(self):
+        """Registra que a última atribuição empilhada foi desfeita."""
+        self.backtracks += 1
+        self.profundidade -= 1
+
+    def selecionar(self, funcao, *args):
+        """Executa a escolha do próximo vértice, somando o tempo em tempo_selecao."""
+        inicio = perf_counter()
+        resultado = funcao(*args)
+        self.tempo_selecao += perf_counter() - inicio
+        return resultado
+
+    def validar(self, funcao, *args):
+        """Executa um passo de consistência, somando o tempo em tempo_validacao."""
+        inicio = perf_counter()
+        resultado = funcao(*args)
+        self.tempo_validacao += perf_counter() - inicio
+        return resultado
+
+    def propagar(self, funcao, *args):
+        """Como validar, contando também uma chamada de propagação."""
+        self.propagacoes += 1
+        return self.validar(funcao, *args)
+
+    def para_dict(self) -> dict:
+        """Resumo serializável (ex: para JSON ou logs)."""
+        return {
+            "nos": self.nos,
+            "backtracks": self.backtracks,
+            "profundidade_maxima": self.profundidade_maxima,
+            "candidatos_avaliados": self.candidatos_avaliados,
+            "propagacoes": self.propagacoes,
+            "tempo_selecao_s": self.tempo_selecao,
+            "tempo_validacao_s": self.tempo_validacao,
+        }
+
+    def __repr__(self) -> str:
+        campos = ", ".join(f"{chave}={valor!r}" for chave, valor in self.para_dict().items())
+        return f"SearchStats({campos})"
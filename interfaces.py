@@ -1,4 +1,6 @@
+import copy
 from abc import ABC, abstractmethod
+from budget import ORCAMENTO_ESGOTADO
 
 class IGraph(ABC):
     """Define o contrato para a topologia do grafo Sudoku."""
@@ -8,6 +10,15 @@ class IGraph(ABC):
         """Retorna os vizinhos (vértices adjacentes) do vértice v."""
         pass
         
+    @abstractmethod
+    def get_unidades(self) -> tuple[tuple[int, ...], ...]:
+        """
+        Retorna as unidades de restrição: conjuntos de vértices que não podem
+        repetir cores (linhas, colunas, blocos e as unidades das variantes).
+        Os vizinhos de v são exatamente os outros vértices das unidades de v.
+        """
+        pass
+
     @abstractmethod
     def vertice_para_grid(self, v: int) -> tuple[int, int]:
         """Converte um índice de vértice (ex: 0-80) para coordenadas (linha, col)."""
@@ -19,11 +30,55 @@ class IGraph(ABC):
         pass
 
 class ISolver(ABC):
+    # Instrumentação opcional (instrumentation.SearchStats); None = desligada
+    estatisticas = None
+    # Limites de tempo/nós opcionais (budget.SearchBudget); None = sem limite.
+    # Esgotado, solve devolve budget.ORCAMENTO_ESGOTADO em vez de True/False.
+    orcamento = None
+
     @abstractmethod
     def solve(self, grid: list[list[int]], graph: IGraph) -> bool:
         pass
 
 class ISolutionCounter(ABC):
+    # Instrumentação opcional (instrumentation.SearchStats); None = desligada
+    estatisticas = None
+    # Limites de tempo/nós opcionais (budget.SearchBudget); None = sem limite.
+    # Esgotado, count_solutions devolve budget.ORCAMENTO_ESGOTADO em vez da contagem.
+    orcamento = None
+    # Callback opcional chamado com os valores por vértice de cada solução
+    # contada (é o estado da busca: copie para guardar); None = só conta.
+    # Contadores que não o suportam simplesmente não o chamam.
+    ao_encontrar = None
+
     @abstractmethod
-    def count_solutions(self) -> int:
-        pass
\ No newline at end of file
+    def count_solutions(self, grid: list[list[int]], graph: IGraph, limit: int | None = None) -> int:
+        """
+        Conta as soluções do grid. Se 'limit' for informado, a contagem para
+        assim que esse número de soluções for atingido.
+        """
+        pass
+
+    def tem_solucao_alternativa(self, grid: list[list[int]], graph: IGraph, v: int, cor_proibida: int) -> bool:
+        """
+        Verifica se existe solução em que o vértice v (vazio no grid) recebe
+        uma cor diferente de 'cor_proibida'.
+
+        Se o grid com v = cor_proibida tem solução única, essa é exatamente a
+        pergunta "remover a pista de v mantém a unicidade?", e custa bem menos
+        do que contar soluções. Esta versão padrão se apoia em count_solutions
+        (com cópia); contadores concretos podem sobrescrevê-la sem copiar nada.
+        """
+        (linha, col) = graph.vertice_para_grid(v)
+        teste = copy.deepcopy(grid)
+
+        for cor in range(1, len(grid) + 1):
+            if cor != cor_proibida:
+                teste[linha][col] = cor
+                encontradas = self.count_solutions(teste, graph, limit=1)
+                if encontradas is ORCAMENTO_ESGOTADO:
+                    return encontradas
+                if encontradas > 0:
+                    return True
+
+        return False
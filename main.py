@@ -1,8 +1,37 @@
+import argparse
+import asyncio
+import sys
 import time
-from graph import SudokuGraph
-from solvers import NaiveBacktrackingSolver, SmartBacktrackingSolver, BacktrackingCounter
-from generator import PuzzleGenerator
-from utils import imprimir_grid, validar_grid_inicial, adicionar_sudoku_nsxns
+from collections import deque
+from graph import SudokuGraph, JigsawSudokuGraph, VARIANTES
+from solvers import NaiveBacktrackingSolver, SmartBacktrackingSolver, BitmaskBacktrackingSolver, BacktrackingCounter
+from propagation import PropagatingSolver
+from dlx import DancingLinksSolver
+from portfolio import PortfolioSolver
+from generator import PuzzleGenerator, SIMETRIAS
+from parallel import resolver_em_paralelo, gerar_em_paralelo
+from grid import CompactGrid
+from cache import CachedSolver
+from database import PuzzleDatabase, PuzzleWriter, texto_para_banco, banco_para_texto
+from service import SolverService
+from utils import imprimir_grid, validar_grid_inicial, adicionar_sudoku_nsxns, linha_para_grid, grid_para_linha
+
+# Extensão que identifica o formato binário empacotado (database.py)
+EXTENSAO_BANCO = ".sdb"
+
+# Motores selecionáveis pela linha de comando (--motor)
+MOTORES = {
+    "naive": NaiveBacktrackingSolver,
+    "smart": SmartBacktrackingSolver,
+    "bitmask": BitmaskBacktrackingSolver,
+    "propagacao": PropagatingSolver,
+    "dlx": DancingLinksSolver,
+    "portfolio": PortfolioSolver,
+}
+
+# Motores que percorrem o grid por grid[linha][col] no laço da busca: em um
+# CompactGrid cada acesso passa por uma memoryview, então recebem listas
+MOTORES_POR_CELULA = frozenset({"naive", "smart"})
 
 def caso_gerar_sudoku():
     print("\n=== MODO: GERAR NOVO SUDOKU ===")
@@ -14,7 +43,7 @@ def caso_gerar_sudoku():
     
     # Usamos o Smart para gerar a solução base
     solver = SmartBacktrackingSolver() 
-    # Usamos o Counter (baseado no Naive) para garantir unicidade na poda
+    # Usamos o Counter (MRV com parada antecipada) para garantir unicidade na poda
     counter = BacktrackingCounter()     
     
     generator = PuzzleGenerator(solver, counter)
@@ -92,8 +121,8 @@ def resolver_generico(grid, n_valor):
     # 1. Instanciação
     graph = SudokuGraph(n=n_valor)
     
-    # Usar SmartSolver para performance
-    solver = SmartBacktrackingSolver() 
+    # Usar o Smart com máscaras de bits para performance
+    solver = BitmaskBacktrackingSolver() 
     
     # 2. Validação
     print("\nValidando consistência inicial...")
@@ -117,8 +146,338 @@ def resolver_generico(grid, n_valor):
         print("\nNão foi possível encontrar uma solução para este tabuleiro.")
 
 
+# --- Modo em Lote (não interativo) ---
+# Pipeline de geradores: cada puzzle atravessa as etapas e é descartado em
+# seguida, então a memória não cresce com o tamanho da entrada.
+
+def ler_puzzles(entrada, n_valor, compacto: bool = True):
+    """Etapa 1: decodifica cada linha em (número da linha, grid, erro); grid compacto ou lista de listas."""
+    for numero, linha in enumerate(entrada, start=1):
+        linha = linha.strip()
+        if not linha or linha.startswith("#"):
+            continue
+
+        try:
+            grid = linha_para_grid(linha, n_valor)
+            yield numero, CompactGrid.de_lista(grid) if compacto else grid, None
+        except ValueError as e:
+            yield numero, None, str(e)
+
+
+def ler_banco(banco, compacto: bool = True):
+    """Etapa 1 (formato binário): lê os registros do banco mapeado em memória."""
+    for numero, grid in enumerate(banco, start=1):
+        yield numero, grid if compacto else grid.para_lista(), None
+
+
+def resolver_puzzles(puzzles, graph, solver):
+    """Etapa 2: valida e resolve os puzzles (o grid é resolvido no lugar)."""
+    for numero, grid, erro in puzzles:
+        if erro is None and not validar_grid_inicial(grid, graph, verbose=False):
+            erro = "pistas conflitantes"
+
+        if erro is None and not solver.solve(grid, graph):
+            erro = "sem solução"
+
+        yield numero, grid, erro
+
+
+def resolver_puzzles_em_paralelo(puzzles, graph, args):
+    """
+    Etapa 2 (versão multiprocesso): valida aqui e resolve no pool.
+
+    Os resultados do pool chegam na ordem de entrada, então a fila basta para
+    reintercalar os puzzles inválidos (que não são enviados) nas posições certas.
+    """
+    fila = deque()
+
+    def validos():
+        for numero, grid, erro in puzzles:
+            if erro is None and not validar_grid_inicial(grid, graph, verbose=False):
+                erro = "pistas conflitantes"
+
+            fila.append((numero, grid, erro))
+            if erro is None:
+                yield grid
+
+    resultados = resolver_em_paralelo(validos(), n=args.n, motor=MOTORES[args.motor],
+                                      processos=args.processos, tamanho_bloco=args.tamanho_envio,
+                                      graph=graph)
+
+    for _, grid, sucesso in resultados:
+        while fila[0][2] is not None:
+            yield fila.popleft()
+
+        numero, _, _ = fila.popleft()
+        yield numero, grid, None if sucesso else "sem solução"
+
+    while fila:
+        yield fila.popleft()
+
+
+def formatar_resultados(resultados):
+    """Etapa 3: uma linha de saída por puzzle (solução ou mensagem de erro)."""
+    for numero, grid, erro in resultados:
+        if erro is None:
+            yield grid_para_linha(grid) + "\n", True
+        else:
+            yield f"ERRO linha {numero}: {erro}\n", False
+
+
+def escrever_texto(resultados, saida, bloco: int) -> tuple[int, int]:
+    """Etapa 4: grava as linhas em blocos. Retorna (total, falhas)."""
+    total = 0
+    falhas = 0
+    buffer = []
+
+    for texto, sucesso in formatar_resultados(resultados):
+        buffer.append(texto)
+        total += 1
+        if not sucesso:
+            falhas += 1
+
+        if len(buffer) >= bloco:
+            saida.write("".join(buffer))
+            saida.flush()
+            buffer.clear()
+
+    saida.write("".join(buffer))
+    saida.flush()
+    return total, falhas
+
+
+def escrever_banco(resultados, escritor: PuzzleWriter) -> tuple[int, int]:
+    """
+    Etapa 3/4 (formato binário): grava as soluções; os erros vão para stderr.
+
+    Um puzzle que falhou ainda ocupa o seu registro (o próprio puzzle não
+    resolvido, ou só zeros se nem foi lido), para que o registro i da saída
+    continue correspondendo ao puzzle i da entrada.
+    """
+    total = 0
+    falhas = 0
+
+    for numero, grid, erro in resultados:
+        total += 1
+        if erro is None:
+            escritor.escrever(grid)
+        else:
+            falhas += 1
+            escritor.escrever(grid if grid is not None else bytes(escritor.n ** 4))
+            print(f"ERRO registro {numero}: {erro}", file=sys.stderr)
+
+    return total, falhas
+
+
+def criar_grafo(args):
+    """Grafo da variante pedida (--variante, ou jigsaw com --regioes)."""
+    if args.regioes is not None:
+        with open(args.regioes, encoding="utf-8") as f:
+            graph = JigsawSudokuGraph.de_texto(f.read())
+        if graph.n != args.n:
+            raise ValueError(f"As regiões são de ordem {graph.n}, mas -n é {args.n}.")
+        return graph
+    return VARIANTES[args.variante](n=args.n)
+
+
+def executar_lote(args) -> int:
+    """Resolve todos os puzzles da entrada, escrevendo as soluções em blocos."""
+    if args.motor == "portfolio" and args.processos > 1:
+        # Cada trabalhador do pool abriria o seu próprio portfólio de processos
+        print("O portfólio já roda um processo por membro; use -m portfolio sem -p.", file=sys.stderr)
+        return 1
+
+    compacto = args.motor not in MOTORES_POR_CELULA
+    if args.entrada.endswith(EXTENSAO_BANCO):
+        entrada = PuzzleDatabase(args.entrada)
+        args.n = entrada.n # A ordem vem do cabeçalho do banco
+        puzzles = ler_banco(entrada, compacto)
+    else:
+        entrada = sys.stdin if args.entrada == "-" else open(args.entrada, encoding="utf-8")
+        puzzles = ler_puzzles(entrada, args.n, compacto)
+
+    graph = criar_grafo(args)
+    solver = None # No modo multiprocesso cada trabalhador monta o seu
+    if args.processos <= 1:
+        solver = MOTORES[args.motor]()
+        if args.cache > 0:
+            solver = CachedSolver(solver, capacidade=args.cache, arquivo=args.arquivo_cache)
+
+    if args.saida.endswith(EXTENSAO_BANCO):
+        saida = PuzzleWriter(args.saida, args.n)
+    else:
+        saida = sys.stdout if args.saida == "-" else open(args.saida, "w", encoding="utf-8")
+
+    start_time = time.perf_counter()
+
+    if args.processos > 1:
+        resultados = resolver_puzzles_em_paralelo(puzzles, graph, args)
+    else:
+        resultados = resolver_puzzles(puzzles, graph, solver)
+
+    try:
+        if isinstance(saida, PuzzleWriter):
+            total, falhas = escrever_banco(resultados, saida)
+        else:
+            total, falhas = escrever_texto(resultados, saida, args.bloco)
+    finally:
+        if isinstance(entrada, PuzzleDatabase):
+            entrada.fechar()
+        elif entrada is not sys.stdin:
+            entrada.close()
+        if isinstance(saida, PuzzleWriter):
+            saida.fechar()
+        elif saida is not sys.stdout:
+            saida.close()
+        if isinstance(solver, (CachedSolver, PortfolioSolver)):
+            solver.fechar()
+
+    # Resumo vai para stderr, para não misturar com as soluções
+    duracao = time.perf_counter() - start_time
+    taxa = total / duracao if duracao > 0 else 0.0
+    print(f"\n--- Resumo ({args.motor}) ---", file=sys.stderr)
+    print(f"Puzzles: {total} | Resolvidos: {total - falhas} | Falhas: {falhas}", file=sys.stderr)
+    print(f"Tempo: {duracao:.4f}s | Vazão: {taxa:.1f} puzzles/s", file=sys.stderr)
+    if isinstance(solver, PortfolioSolver):
+        vitorias = ", ".join(f"{nome}: {qtd}" for nome, qtd in solver.vitorias.most_common())
+        print(f"Portfólio: vitórias {vitorias or '-'}", file=sys.stderr)
+
+    if isinstance(solver, CachedSolver):
+        cache = solver.estatisticas_cache()
+        print(f"Cache: {cache['acertos_memoria']} acertos em memória | {cache['acertos_disco']} em disco | "
+              f"{cache['faltas']} faltas ({cache['taxa_acerto']:.1%})", file=sys.stderr)
+
+    return 0 if falhas == 0 else 1
+
+
+def opcoes_lotes(args) -> dict | None:
+    """Opções da cavação em lotes (--lotes, --alvo, --simetria); None = célula a célula."""
+    if not args.lotes and args.alvo is None and args.simetria == "nenhuma":
+        return None
+    return {"alvo_pistas": args.alvo, "simetria": args.simetria}
+
+
+def executar_geracao(args) -> int:
+    """Gera puzzles em paralelo, escrevendo um por linha assim que ficam prontos."""
+    start_time = time.perf_counter()
+    puzzles = (puzzle for _, puzzle, _ in gerar_em_paralelo(args.quantidade, n=args.n, semente=args.semente,
+                                                           processos=args.processos,
+                                                           isomorfismos=args.isomorfismos,
+                                                           prazo=args.prazo, lotes=opcoes_lotes(args)))
+
+    if args.saida.endswith(EXTENSAO_BANCO):
+        with PuzzleWriter(args.saida, args.n) as escritor:
+            escritor.escrever_todos(puzzles)
+    else:
+        saida = sys.stdout if args.saida == "-" else open(args.saida, "w", encoding="utf-8")
+        try:
+            for puzzle in puzzles:
+                saida.write(grid_para_linha(puzzle) + "\n")
+                saida.flush()
+        finally:
+            if saida is not sys.stdout:
+                saida.close()
+
+    duracao = time.perf_counter() - start_time
+    print(f"\n{args.quantidade} puzzles gerados em {duracao:.4f}s", file=sys.stderr)
+    return 0
+
+
+def executar_conversao(args) -> int:
+    """Converte entre o formato de uma linha por puzzle e o binário empacotado."""
+    if args.entrada.endswith(EXTENSAO_BANCO):
+        quantidade = banco_para_texto(args.entrada, args.saida)
+    elif args.saida.endswith(EXTENSAO_BANCO):
+        quantidade = texto_para_banco(args.entrada, args.saida, args.n)
+    else:
+        print(f"Um dos arquivos deve ter a extensão {EXTENSAO_BANCO}.", file=sys.stderr)
+        return 1
+
+    print(f"{quantidade} puzzles convertidos.", file=sys.stderr)
+    return 0
+
+
+def executar_servico(args) -> int:
+    """Sobe o serviço local de JSON lines até Ctrl+C."""
+    # Sem o portfólio: em cada trabalhador ele abriria mais um processo por membro
+    motores = {nome: motor for nome, motor in MOTORES.items() if nome != "portfolio"}
+    servico = SolverService(motores, ordens=tuple(args.ordens), processos=args.processos,
+                            tamanho_fila=args.fila, timeout=args.timeout)
+    try:
+        asyncio.run(servico.servir(args.host, args.porta))
+    except KeyboardInterrupt:
+        print("\nServiço encerrado.", file=sys.stderr)
+    return 0
+
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Projeto Sudoku & Grafos. Sem argumentos, abre o menu interativo.")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    p_resolver = subparsers.add_parser("resolver", help="Resolve puzzles no formato de uma linha por puzzle.")
+    p_resolver.add_argument("entrada", nargs="?", default="-",
+                            help=f"Arquivo de entrada ('-' para stdin; {EXTENSAO_BANCO} para o formato binário).")
+    p_resolver.add_argument("-o", "--saida", default="-",
+                            help=f"Arquivo de saída ('-' para stdout; {EXTENSAO_BANCO} para o formato binário).")
+    p_resolver.add_argument("-n", type=int, default=3, help="Ordem do Sudoku (3 para 9x9).")
+    p_resolver.add_argument("-m", "--motor", choices=sorted(MOTORES), default="bitmask", help="Solver a usar.")
+    p_resolver.add_argument("--variante", choices=sorted(VARIANTES), default="classico",
+                            help="Regras extras: diagonal (Sudoku X) ou windoku.")
+    p_resolver.add_argument("--regioes", default=None,
+                            help="Arquivo com as regiões do jigsaw (n² linhas, um índice 0-9/A-Z por célula).")
+    p_resolver.add_argument("--bloco", type=int, default=1000, help="Linhas acumuladas antes de cada flush.")
+    p_resolver.add_argument("-p", "--processos", type=int, default=1,
+                            help="Processos trabalhadores (>1 ativa o pool; não combina com -m portfolio).")
+    p_resolver.add_argument("--tamanho-envio", type=int, default=64, help="Puzzles por envio a cada trabalhador.")
+    p_resolver.add_argument("--cache", type=int, default=0,
+                            help="Entradas da cache por forma canônica (0 desativa; só sem -p).")
+    p_resolver.add_argument("--arquivo-cache", default=None, help="Banco em disco para persistir a cache.")
+    p_resolver.set_defaults(executar=executar_lote)
+
+    p_gerar = subparsers.add_parser("gerar", help="Gera puzzles de solução única em paralelo.")
+    p_gerar.add_argument("quantidade", type=int, help="Quantos puzzles gerar.")
+    p_gerar.add_argument("-n", type=int, default=3, help="Ordem do Sudoku (3 para 9x9).")
+    p_gerar.add_argument("-s", "--semente", type=int, default=None, help="Semente do lote (reprodutível).")
+    p_gerar.add_argument("-p", "--processos", type=int, default=None, help="Processos trabalhadores.")
+    p_gerar.add_argument("-o", "--saida", default="-",
+                         help=f"Arquivo de saída ('-' para stdout; {EXTENSAO_BANCO} para o formato binário).")
+    p_gerar.add_argument("--isomorfismos", action="store_true",
+                         help="Soluções base por simetrias aleatórias de sementes (sem busca).")
+    p_gerar.add_argument("--prazo", type=float, default=None,
+                         help="Segundos por puzzle: ao esgotar, devolve o puzzle único atual (mais pistas).")
+    p_gerar.add_argument("--lotes", action="store_true",
+                         help="Cava em lotes com bisseção (bem menos verificações de unicidade).")
+    p_gerar.add_argument("--alvo", type=int, default=None,
+                         help="Pistas a atingir (implica --lotes; nunca remove abaixo disso).")
+    p_gerar.add_argument("--simetria", choices=SIMETRIAS, default="nenhuma",
+                         help="Pistas simétricas: pares pelo centro ou rotação de 90° (implica --lotes).")
+    p_gerar.set_defaults(executar=executar_geracao)
+
+    p_converter = subparsers.add_parser("converter", help=f"Converte entre texto e o formato binário ({EXTENSAO_BANCO}).")
+    p_converter.add_argument("entrada", help="Arquivo de origem.")
+    p_converter.add_argument("saida", help="Arquivo de destino.")
+    p_converter.add_argument("-n", type=int, default=3, help="Ordem do Sudoku (só para texto -> binário).")
+    p_converter.set_defaults(executar=executar_conversao)
+
+    p_servir = subparsers.add_parser("servir", help="Serviço local de solve/count/generate em JSON lines por TCP.")
+    p_servir.add_argument("--host", default="127.0.0.1", help="Endereço a ouvir.")
+    p_servir.add_argument("--porta", type=int, default=8765, help="Porta TCP.")
+    p_servir.add_argument("-p", "--processos", type=int, default=None, help="Processos trabalhadores.")
+    p_servir.add_argument("--ordens", type=int, nargs="+", default=[2, 3, 4],
+                          help="Ordens n com grafos pré-montados em cada trabalhador.")
+    p_servir.add_argument("--fila", type=int, default=1000, help="Tamanho máximo da fila (contrapressão).")
+    p_servir.add_argument("--timeout", type=float, default=10.0, help="Timeout padrão por requisição, em segundos.")
+    p_servir.set_defaults(executar=executar_servico)
+
+    return parser
+
+
 # --- Bloco Principal ---
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        args = criar_parser().parse_args()
+        sys.exit(args.executar(args))
+
     while True:
         print("\n" + "="*30)
         print("   PROJETO SUDOKU & GRAFOS")
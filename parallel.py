@@ -0,0 +1,349 @@
+import multiprocessing as mp
+import os
+import queue
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from itertools import islice
+from interfaces import IGraph
+from graph import SudokuGraph
+from solvers import BitmaskBacktrackingSolver, BacktrackingCounter
+from generator import PuzzleGenerator, BaseGridGenerator
+from budget import SearchBudget, ORCAMENTO_ESGOTADO
+from grid import CompactGrid
+
+# Estado de cada processo trabalhador, criado uma única vez na inicialização
+_graph = None
+_solver = None
+_gerador = None
+_contador = None
+_fila = None
+_parar = None
+
+# Mensagens dos trabalhadores na fila da enumeração
+_SOLUCOES = "solucoes"
+_FIM = "fim"
+
+
+def _inicializar_trabalhador(n: int, motor: type, graph: IGraph | None = None):
+    """Roda uma vez por processo: monta o grafo e o solver reaproveitados por todos os blocos."""
+    global _graph, _solver
+    _graph = graph if graph is not None else SudokuGraph(n=n)
+    _solver = motor()
+
+
+def _resolver_bloco(bloco: list[tuple[int, list[list[int]]]]) -> list[tuple[int, list[list[int]], bool]]:
+    """Resolve um bloco de puzzles dentro do trabalhador."""
+    return [(indice, grid, _solver.solve(grid, _graph)) for indice, grid in bloco]
+
+
+def _agrupar(iteravel, tamanho_bloco: int):
+    """Agrupa um iterável (possivelmente infinito) em listas de até tamanho_bloco itens."""
+    iterador = iter(iteravel)
+    while True:
+        bloco = list(islice(iterador, tamanho_bloco))
+        if not bloco:
+            return
+        yield bloco
+
+
+def resolver_em_paralelo(puzzles, n: int = 3, motor: type = BitmaskBacktrackingSolver,
+                         processos: int | None = None, tamanho_bloco: int = 64,
+                         ordenado: bool = True, graph: IGraph | None = None):
+    """
+    Resolve puzzles em um pool de processos, gerando (índice, grid, sucesso).
+
+    Os puzzles são enviados em blocos de 'tamanho_bloco' para amortizar o custo
+    de comunicação entre processos, e cada trabalhador monta seu SudokuGraph e
+    seu solver uma única vez. A entrada é consumida sob demanda, com no máximo
+    2 blocos pendentes por processo, então a memória não cresce com ela.
+
+    Args:
+        puzzles: Iterável de grids 2D.
+        n: Ordem do Sudoku (ex: 3 para 9x9).
+        motor: Classe ISolver instanciada em cada trabalhador.
+        processos: Número de processos (padrão: número de CPUs).
+        tamanho_bloco: Puzzles por envio ao trabalhador.
+        ordenado: True devolve na ordem de entrada; False devolve cada bloco
+                  assim que ele termina (menor latência).
+        graph: Grafo das variantes (enviado uma vez a cada trabalhador);
+               padrão: SudokuGraph(n).
+    """
+    processos = processos or os.cpu_count() or 1
+    max_pendentes = 2 * processos
+    blocos = _agrupar(enumerate(puzzles), tamanho_bloco)
+
+    with ProcessPoolExecutor(max_workers=processos,
+                             initializer=_inicializar_trabalhador,
+                             initargs=(n, motor, graph)) as executor:
+        if ordenado:
+            # FIFO de futures: sempre espera pelo bloco mais antigo
+            pendentes = deque()
+            for bloco in blocos:
+                pendentes.append(executor.submit(_resolver_bloco, bloco))
+                if len(pendentes) >= max_pendentes:
+                    yield from pendentes.popleft().result()
+
+            while pendentes:
+                yield from pendentes.popleft().result()
+        else:
+            pendentes = set()
+            for bloco in blocos:
+                pendentes.add(executor.submit(_resolver_bloco, bloco))
+                if len(pendentes) >= max_pendentes:
+                    prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                    for futuro in prontos:
+                        yield from futuro.result()
+
+            while pendentes:
+                prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    yield from futuro.result()
+
+
+def _inicializar_gerador(motor: type, contador: type, isomorfismos: bool = False):
+    """Roda uma vez por processo: monta o PuzzleGenerator reaproveitado por todas as tarefas."""
+    global _gerador
+    bases = BaseGridGenerator() if isomorfismos else None
+    _gerador = PuzzleGenerator(motor(), contador(), bases)
+
+
+def _gerar_um(indice: int, n: int, semente, prazo: float | None = None,
+              lotes: dict | None = None) -> tuple[int, list[list[int]], list[list[int]]]:
+    """Gera o puzzle 'indice' com um rng próprio, derivado da semente do lote."""
+    rng = random.Random(f"{semente}:{indice}")
+    if lotes is not None:
+        puzzle, solucao = _gerador.gerar_puzzle_em_lotes(n, rng=rng, verbose=False, prazo=prazo, **lotes)
+    else:
+        puzzle, solucao = _gerador.gerar_puzzle(n, rng=rng, verbose=False, prazo=prazo)
+    return indice, puzzle, solucao
+
+
+def gerar_em_paralelo(quantidade: int, n: int = 3, semente=None,
+                      motor: type = BitmaskBacktrackingSolver,
+                      contador: type = BacktrackingCounter,
+                      processos: int | None = None, isomorfismos: bool = False,
+                      prazo: float | None = None, lotes: dict | None = None):
+    """
+    Gera 'quantidade' puzzles de solução única em um pool de processos,
+    devolvendo (índice, puzzle, solucao) à medida que cada um fica pronto.
+
+    Cada puzzle usa um rng semeado com (semente, índice), então o puzzle de um
+    dado índice é sempre o mesmo para a mesma semente, independentemente do
+    número de processos ou da ordem de conclusão. Os trabalhadores não
+    imprimem nada.
+
+    Args:
+        quantidade: Quantos puzzles gerar.
+        n: Ordem do Sudoku (ex: 3 para 9x9).
+        semente: Semente do lote (None sorteia uma nova).
+        motor: Classe ISolver usada para a solução base.
+        contador: Classe ISolutionCounter usada na verificação de unicidade.
+        processos: Número de processos (padrão: número de CPUs).
+        isomorfismos: Usa BaseGridGenerator para as soluções base (sem busca;
+                      o pool de sementes é o mesmo em todos os processos).
+        prazo: Segundos por puzzle (modo anytime do PuzzleGenerator). Com
+               prazo, o resultado deixa de ser reprodutível pela semente.
+        lotes: Opções de PuzzleGenerator.gerar_puzzle_em_lotes (ex:
+               {"alvo_pistas": 25, "simetria": "central"}); None usa a
+               cavação célula a célula.
+    """
+    processos = processos or os.cpu_count() or 1
+    max_pendentes = 2 * processos
+
+    if semente is None:
+        semente = random.randrange(2**63)
+
+    with ProcessPoolExecutor(max_workers=processos,
+                             initializer=_inicializar_gerador,
+                             initargs=(motor, contador, isomorfismos)) as executor:
+        pendentes = set()
+        for indice in range(quantidade):
+            pendentes.add(executor.submit(_gerar_um, indice, n, semente, prazo, lotes))
+            if len(pendentes) >= max_pendentes:
+                prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    yield futuro.result()
+
+        while pendentes:
+            prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                yield futuro.result()
+
+
+def _inicializar_enumeracao(graph: IGraph, fila, parar):
+    """Roda uma vez por processo: grafo, contador e os canais da enumeração."""
+    global _graph, _contador, _fila, _parar
+    _graph = graph
+    _contador = BacktrackingCounter()
+    _contador.orcamento = SearchBudget(cancelar=parar.is_set) # Para logo se o consumidor desistir
+    _fila = fila
+    _parar = parar
+
+
+def _contar_bloco(bloco: list[bytes]) -> int:
+    """Soma as soluções de um bloco de subproblemas."""
+    n = _graph.topologia.n
+    total = 0
+    for valores in bloco:
+        total += _contador.count_solutions(CompactGrid(n, valores), _graph)
+    return total
+
+
+def _enviar(mensagem) -> bool:
+    """Põe a mensagem na fila limitada, desistindo se a enumeração foi cancelada."""
+    while not _parar.is_set():
+        try:
+            _fila.put(mensagem, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _enumerar_bloco(bloco: list[bytes], tamanho_envio: int):
+    """
+    Enumera as soluções de um bloco de subproblemas, enviando-as em pacotes
+    pela fila. Termina sempre com uma mensagem _FIM (mesmo com erro), que
+    chega depois dos pacotes: a fila preserva a ordem de cada processo.
+    """
+    n = _graph.topologia.n
+    pacote = []
+    erro = None
+
+    def guardar(valores):
+        pacote.append(bytes(valores))
+        if len(pacote) >= tamanho_envio:
+            _enviar((_SOLUCOES, pacote[:]))
+            pacote.clear()
+
+    _contador.ao_encontrar = guardar
+    try:
+        for valores in bloco:
+            if _contador.count_solutions(CompactGrid(n, valores), _graph) is ORCAMENTO_ESGOTADO:
+                break # Cancelada
+        if pacote:
+            _enviar((_SOLUCOES, pacote))
+    except Exception as e:
+        erro = repr(e)
+    finally:
+        _contador.ao_encontrar = None
+        _fila.put((_FIM, erro))
+
+
+def contar_em_paralelo(grid, n: int = 3, graph: IGraph | None = None, profundidade: int = 4,
+                       processos: int | None = None, tamanho_bloco: int = 8) -> int:
+    """
+    Conta todas as soluções de um grid dividindo a árvore de busca entre
+    processos (contagem exata, sem limite).
+
+    A árvore é cortada em 'profundidade' ramificações
+    (BacktrackingCounter.subproblemas) e os subproblemas vão em blocos para o
+    pool à medida que ele os consome, com no máximo 2 blocos pendentes por
+    processo: quem termina um bloco pega o próximo, então subárvores de
+    tamanhos muito diferentes se equilibram sozinhas, e a fronteira nunca
+    fica inteira na memória.
+
+    Args:
+        grid: Grid 2D (ou CompactGrid) com 0 nas células vazias.
+        n: Ordem do Sudoku (ex: 3 para 9x9).
+        graph: Grafo das variantes; padrão: SudokuGraph(n).
+        profundidade: Ramificações até o corte. Mais profundo = mais
+                      subproblemas, menores (melhor equilíbrio, mais envios).
+        processos: Número de processos (padrão: número de CPUs).
+        tamanho_bloco: Subproblemas por envio ao trabalhador.
+    """
+    graph = graph if graph is not None else SudokuGraph(n=n)
+    processos = processos or os.cpu_count() or 1
+    max_pendentes = 2 * processos
+    blocos = _agrupar(BacktrackingCounter().subproblemas(grid, graph, profundidade), tamanho_bloco)
+    total = 0
+
+    with ProcessPoolExecutor(max_workers=processos,
+                             initializer=_inicializar_enumeracao,
+                             initargs=(graph, mp.Queue(), mp.Event())) as executor:
+        pendentes = set()
+        for bloco in blocos:
+            pendentes.add(executor.submit(_contar_bloco, bloco))
+            if len(pendentes) >= max_pendentes:
+                prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                total += sum(futuro.result() for futuro in prontos)
+
+        total += sum(futuro.result() for futuro in pendentes)
+
+    return total
+
+
+def enumerar_em_paralelo(grid, n: int = 3, graph: IGraph | None = None, profundidade: int = 4,
+                         processos: int | None = None, tamanho_bloco: int = 8,
+                         tamanho_envio: int = 256, tamanho_fila: int = 64):
+    """
+    Gera todas as soluções de um grid (CompactGrid), enumeradas em paralelo
+    com a mesma divisão da árvore de contar_em_paralelo, em ordem arbitrária.
+
+    A memória é limitada: os trabalhadores mandam as soluções em pacotes de
+    'tamanho_envio' por uma fila de no máximo 'tamanho_fila' pacotes e
+    ficam bloqueados enquanto o consumidor não a esvazia. Se o consumidor
+    parar antes do fim (break, close), as buscas em andamento são canceladas
+    pelo orçamento e o pool é encerrado.
+
+    Args: os de contar_em_paralelo, mais tamanho_envio e tamanho_fila.
+    """
+    graph = graph if graph is not None else SudokuGraph(n=n)
+    processos = processos or os.cpu_count() or 1
+    max_pendentes = 2 * processos
+    blocos = _agrupar(BacktrackingCounter().subproblemas(grid, graph, profundidade), tamanho_bloco)
+    n = graph.topologia.n
+
+    fila = mp.Queue(maxsize=tamanho_fila)
+    parar = mp.Event()
+
+    with ProcessPoolExecutor(max_workers=processos,
+                             initializer=_inicializar_enumeracao,
+                             initargs=(graph, fila, parar)) as executor:
+        futuros = set()
+        pendentes = 0   # Blocos enviados cuja mensagem _FIM ainda não chegou
+        esgotados = False
+        try:
+            while True:
+                while not esgotados and pendentes < max_pendentes:
+                    bloco = next(blocos, None)
+                    if bloco is None:
+                        esgotados = True
+                    else:
+                        futuros.add(executor.submit(_enumerar_bloco, bloco, tamanho_envio))
+                        pendentes += 1
+
+                if not pendentes:
+                    return
+
+                tipo, dados = _receber(fila, futuros)
+                if tipo == _SOLUCOES:
+                    for valores in dados:
+                        yield CompactGrid(n, valores)
+                else:
+                    pendentes -= 1
+                    if dados is not None:
+                        raise RuntimeError(f"Falha na enumeração: {dados}")
+        finally:
+            # Cancela o que falta e esvazia a fila para liberar os trabalhadores
+            parar.set()
+            while pendentes:
+                if _receber(fila, futuros)[0] == _FIM:
+                    pendentes -= 1
+
+
+def _receber(fila, futuros: set):
+    """
+    Próxima mensagem da fila. Descarta os futuros já concluídos e, se um
+    trabalhador morreu sem responder, propaga o erro do pool.
+    """
+    while True:
+        for futuro in [f for f in futuros if f.done()]:
+            futuros.discard(futuro)
+            futuro.result() # Relança a exceção do pool (ex: BrokenProcessPool)
+
+        try:
+            return fila.get(timeout=1.0)
+        except queue.Empty:
+            continue
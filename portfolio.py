@@ -0,0 +1,212 @@
+import multiprocessing as mp
+from collections import Counter, defaultdict, deque
+from itertools import count
+from time import perf_counter
+from interfaces import ISolver, IGraph
+from budget import SearchBudget, ORCAMENTO_ESGOTADO
+from grid import CompactGrid, valores_por_vertice, gravar_por_vertice
+from solvers import NaiveBacktrackingSolver, SmartBacktrackingSolver, BitmaskBacktrackingSolver, IterativeSolver
+from dlx import DancingLinksSolver
+from utils import percentis
+
+# Respostas de cada membro
+_SOLUCAO = "solucao"
+_SEM_SOLUCAO = "sem_solucao"
+_INTERROMPIDO = "interrompido"
+_ERRO = "erro"
+
+# Motores que percorrem o grid por grid[linha][col] (como MOTORES_POR_CELULA em
+# main.py): recebem lista de listas, não o CompactGrid com memoryviews
+_MOTORES_POR_CELULA = (NaiveBacktrackingSolver, SmartBacktrackingSolver)
+
+
+def portfolio_padrao() -> dict[str, ISolver]:
+    """Mistura padrão: ordens de busca bem diferentes entre si, mais MRV aleatorizado."""
+    return {
+        "bitmask": BitmaskBacktrackingSolver(),
+        "dlx": DancingLinksSolver(),
+        "iterativo": IterativeSolver(),
+        "smart_aleatorio": SmartBacktrackingSolver(ordem_valores="aleatoria", desempate="aleatorio",
+                                                   reinicios=8, limite_nos=200, semente=1),
+    }
+
+
+def _membro(nome: str, solver: ISolver, entrada, saida, parar, intervalo: int):
+    """
+    Laço de um processo do portfólio: resolve cada tarefa recebida e responde
+    (id, nome, status, valores, segundos). A busca consulta 'parar' pelo
+    orçamento, então para logo que outro membro vence.
+    """
+    grafos = {}
+    por_celula = isinstance(solver, _MOTORES_POR_CELULA)
+
+    while True:
+        tarefa = entrada.recv()
+        if tarefa is None:
+            return
+
+        id_tarefa, chave, graph, valores, prazo, max_nos = tarefa
+        if graph is not None:
+            grafos[chave] = graph
+        graph = grafos[chave]
+
+        inicio = perf_counter()
+        try:
+            grid = CompactGrid(graph.topologia.n, valores)
+            if por_celula:
+                grid = grid.para_lista()
+            solver.orcamento = SearchBudget(prazo=prazo, max_nos=max_nos,
+                                            intervalo_relogio=intervalo, cancelar=parar.is_set)
+            resultado = solver.solve(grid, graph)
+        except Exception as e:
+            saida.put((id_tarefa, nome, _ERRO, repr(e), perf_counter() - inicio))
+            continue
+
+        if resultado is ORCAMENTO_ESGOTADO:
+            resposta = (_INTERROMPIDO, None)
+        elif resultado:
+            resposta = (_SOLUCAO, bytes(valores_por_vertice(grid, graph.topologia.coordenadas)))
+        else:
+            resposta = (_SEM_SOLUCAO, None)
+        saida.put((id_tarefa, nome) + resposta + (perf_counter() - inicio,))
+
+
+class PortfolioSolver(ISolver):
+    """
+    Corrida de motores: cada membro do portfólio roda em um processo próprio
+    sobre o mesmo puzzle, e vale a primeira resposta definitiva (solução, ou
+    "sem solução" de uma busca completa). Os demais são cancelados na hora:
+    um evento compartilhado é consultado pelo orçamento da busca (a cada
+    'intervalo' nós), então os perdedores abandonam a busca e o processo
+    continua aquecido para o próximo puzzle.
+
+    Os processos são criados na primeira chamada de solve e reaproveitados;
+    o grafo de cada topologia é enviado uma única vez a cada membro.
+
+    Registro para ajustar a mistura: 'ultimo_vencedor', 'vitorias' (por
+    membro) e estatisticas_portfolio(), com os percentis de latência de
+    todas as corridas e das vencidas por cada membro.
+
+    Args:
+        membros: {nome: ISolver} (instâncias picklable, ex: SmartBacktrackingSolver
+                 com sementes diferentes). Padrão: portfolio_padrao().
+        intervalo: Nós entre consultas ao cancelamento (e ao prazo).
+        janela_latencias: Quantas corridas recentes entram nos percentis.
+
+    Um 'orcamento' (SearchBudget) atribuído ao portfólio vale para cada
+    membro; se todos esgotarem, solve devolve ORCAMENTO_ESGOTADO.
+    """
+
+    def __init__(self, membros: dict[str, ISolver] | None = None, intervalo: int = 64,
+                 janela_latencias: int = 10000):
+        self.membros = membros if membros is not None else portfolio_padrao()
+        if not self.membros:
+            raise ValueError("O portfólio precisa de pelo menos um membro.")
+
+        self.intervalo = intervalo
+        self.processos = None
+        self.ids = count()
+
+        self.ultimo_vencedor = None
+        self.vitorias = Counter()
+        self.latencias = deque(maxlen=janela_latencias)
+        self.latencias_vencedor = defaultdict(lambda: deque(maxlen=janela_latencias))
+
+    def _iniciar_processos(self):
+        self.parar = mp.Event()
+        self.saida = mp.Queue()
+        self.processos = []
+        self.entradas = []
+        self.enviados = set()   # Chaves de topologia já enviadas aos membros
+        self.pendentes = 0      # Respostas ainda não lidas da corrida anterior
+
+        for nome, solver in self.membros.items():
+            recebe, envia = mp.Pipe(duplex=False)
+            processo = mp.Process(target=_membro, name=f"portfolio-{nome}", daemon=True,
+                                  args=(nome, solver, recebe, self.saida, self.parar, self.intervalo))
+            processo.start()
+            self.processos.append(processo)
+            self.entradas.append(envia)
+
+    def _descartar_pendentes(self):
+        """Lê as respostas atrasadas dos perdedores e libera o evento de parada."""
+        while self.pendentes:
+            self.saida.get()
+            self.pendentes -= 1
+        self.parar.clear()
+
+    def solve(self, grid: list[list[int]], graph: IGraph) -> bool:
+        if self.processos is None:
+            self._iniciar_processos()
+        self._descartar_pendentes()
+
+        topologia = graph.topologia
+        chave = graph.chave_topologia()
+        valores = bytes(valores_por_vertice(grid, topologia.coordenadas))
+        enviar_grafo = graph if chave not in self.enviados else None
+        self.enviados.add(chave)
+
+        orcamento = self.orcamento
+        prazo = orcamento.prazo if orcamento is not None else None
+        max_nos = orcamento.max_nos if orcamento is not None else None
+
+        id_tarefa = next(self.ids)
+        inicio = perf_counter()
+        for entrada in self.entradas:
+            entrada.send((id_tarefa, chave, enviar_grafo, valores, prazo, max_nos))
+        self.pendentes = len(self.entradas)
+
+        erros = []
+        while self.pendentes:
+            _, nome, status, dados, _ = self.saida.get()
+            self.pendentes -= 1
+
+            if status in (_SOLUCAO, _SEM_SOLUCAO):
+                self.parar.set() # Cancela os demais; as respostas deles são lidas depois
+                self._registrar(nome, perf_counter() - inicio)
+                if status == _SEM_SOLUCAO:
+                    return False
+                gravar_por_vertice(grid, topologia.coordenadas, dados)
+                return True
+
+            if status == _ERRO:
+                erros.append(f"{nome}: {dados}")
+
+        # Nenhuma resposta definitiva: todos esgotaram o orçamento ou falharam
+        self.ultimo_vencedor = None
+        if len(erros) == len(self.entradas):
+            raise RuntimeError("Todos os membros do portfólio falharam: " + "; ".join(erros))
+        return ORCAMENTO_ESGOTADO
+
+    def _registrar(self, nome: str, segundos: float):
+        self.ultimo_vencedor = nome
+        self.vitorias[nome] += 1
+        self.latencias.append(segundos)
+        self.latencias_vencedor[nome].append(segundos)
+
+    def estatisticas_portfolio(self) -> dict:
+        """Vitórias e percentis de latência (geral e por membro vencedor)."""
+        return {
+            "vitorias": dict(self.vitorias),
+            "latencias": percentis(self.latencias),
+            "por_vencedor": {nome: percentis(amostras) for nome, amostras in self.latencias_vencedor.items()},
+        }
+
+    def fechar(self):
+        """Encerra os processos dos membros."""
+        if self.processos is None:
+            return
+        self.parar.set()
+        for entrada in self.entradas:
+            entrada.send(None)
+        for processo in self.processos:
+            processo.join(timeout=5)
+            if processo.is_alive():
+                processo.terminate()
+        self.processos = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
@@ -0,0 +1,348 @@
+from interfaces import ISolver, IGraph
+from budget import ORCAMENTO_ESGOTADO
+from grid import valores_por_vertice
+
+# Cache de propagadores por topologia (as tabelas de interseção só dependem dela)
+_PROPAGADORES = {}
+
+
+class _Contradicao(Exception):
+    """Sinaliza internamente que algum vértice ficou sem cores candidatas."""
+
+
+class ConstraintPropagator:
+    """
+    Motor de propagação de restrições sobre as unidades do grafo
+    (linhas, colunas e blocos do SudokuGraph).
+
+    Trabalha sobre uma lista de máscaras de candidatos (uma por vértice) e
+    aplica, até atingir um ponto fixo:
+    1. Naked singles: vértice com uma única cor remove essa cor dos vizinhos.
+    2. Hidden singles: cor que só cabe em um vértice da unidade.
+    3. Naked pairs: dois vértices da unidade com o mesmo par de candidatos.
+    4. Hidden pairs: duas cores que só cabem nos mesmos dois vértices.
+    5. Pointing/claiming: cor restrita à interseção de duas unidades.
+
+    Toda inferência é correta (não elimina nenhuma solução), então propagar
+    nunca muda o conjunto de soluções do puzzle.
+    """
+
+    def __init__(self, graph: IGraph):
+        topologia = graph.topologia
+        self.unidades = topologia.unidades
+        self.num_vertices = topologia.num_vertices
+        self.tamanho = topologia.tamanho
+        self.cheia = (1 << self.tamanho) - 1
+
+        self.coordenadas = topologia.coordenadas
+        self.vizinhos = topologia.vizinhos
+
+        # Pares ordenados de unidades que se cruzam em mais de um vértice
+        # (linha x bloco e coluna x bloco no Sudoku clássico):
+        # (vértices de A fora da interseção, interseção, vértices de B fora da interseção)
+        self.intersecoes = []
+        for a in self.unidades:
+            conjunto_a = set(a)
+            for b in self.unidades:
+                if a is b:
+                    continue
+                inter = conjunto_a.intersection(b)
+                if len(inter) >= 2:
+                    self.intersecoes.append((
+                        tuple(v for v in a if v not in inter),
+                        tuple(inter),
+                        tuple(v for v in b if v not in inter),
+                    ))
+
+    def candidatos_iniciais(self, grid: list[list[int]]) -> list[int]:
+        """Máscaras iniciais: a cor da pista para vértices preenchidos, todas para os vazios."""
+        candidatos = [self.cheia] * self.num_vertices
+
+        for v, cor in enumerate(valores_por_vertice(grid, self.coordenadas)):
+            if cor != 0:
+                candidatos[v] = 1 << (cor - 1)
+
+        return candidatos
+
+    def propagar(self, candidatos: list[int], alterados: list[int] | None = None,
+                 trilha: list[tuple[int, int]] | None = None) -> bool:
+        """
+        Aplica as técnicas até o ponto fixo, modificando 'candidatos' no lugar.
+
+        Args:
+            candidatos: Máscaras de candidatos por vértice.
+            alterados: Vértices que viraram singles desde a última propagação.
+                       None significa "todos os singles" (estado novo).
+            trilha: Se informada, recebe (vértice, máscara anterior) a cada
+                    alteração, para que o chamador possa desfazê-las no lugar.
+
+        Returns:
+            bool: False se encontrou uma contradição (sem solução), True caso contrário.
+        """
+        if alterados is None:
+            alterados = [v for v in range(self.num_vertices) if candidatos[v] & (candidatos[v] - 1) == 0]
+        self.fila = list(alterados)
+        self.trilha = trilha
+
+        try:
+            while True:
+                self._naked_singles(candidatos)
+
+                # Técnicas mais caras só rodam quando as mais baratas se esgotam
+                if self._hidden_singles(candidatos):
+                    continue
+                if self._naked_pairs(candidatos):
+                    continue
+                if self._hidden_pairs(candidatos):
+                    continue
+                if self._pointing_claiming(candidatos):
+                    continue
+
+                return True
+        except _Contradicao:
+            return False
+
+    def _restringir(self, candidatos: list[int], v: int, mascara: int):
+        """Reduz os candidatos de v para 'mascara', enfileirando-o se virar single."""
+        if mascara == 0:
+            raise _Contradicao()
+
+        if self.trilha is not None:
+            self.trilha.append((v, candidatos[v]))
+
+        candidatos[v] = mascara
+        if mascara & (mascara - 1) == 0:
+            self.fila.append(v)
+
+    def _naked_singles(self, candidatos: list[int]):
+        while self.fila:
+            v = self.fila.pop()
+            bit = candidatos[v]
+
+            for vizinho in self.vizinhos[v]:
+                if candidatos[vizinho] & bit:
+                    self._restringir(candidatos, vizinho, candidatos[vizinho] & ~bit)
+
+    def _hidden_singles(self, candidatos: list[int]) -> bool:
+        mudou = False
+
+        for unidade in self.unidades:
+            vista = 0
+            repetida = 0
+            for v in unidade:
+                m = candidatos[v]
+                repetida |= vista & m
+                vista |= m
+
+            # Alguma cor não cabe em nenhum vértice da unidade
+            if vista != self.cheia:
+                raise _Contradicao()
+
+            unicas = vista & ~repetida
+            if not unicas:
+                continue
+
+            for v in unidade:
+                m = candidatos[v] & unicas
+                if not m:
+                    continue
+
+                # Duas cores que só cabem no mesmo vértice: impossível
+                if m & (m - 1):
+                    raise _Contradicao()
+
+                if candidatos[v] != m:
+                    self._restringir(candidatos, v, m)
+                    mudou = True
+
+        return mudou
+
+    def _naked_pairs(self, candidatos: list[int]) -> bool:
+        mudou = False
+
+        for unidade in self.unidades:
+            vistos = {}
+            for v in unidade:
+                m = candidatos[v]
+                if m.bit_count() != 2:
+                    continue
+
+                if m not in vistos:
+                    vistos[m] = v
+                    continue
+
+                # Dois vértices com o mesmo par: as duas cores são deles
+                par = (vistos[m], v)
+                for outro in unidade:
+                    if outro not in par and candidatos[outro] & m:
+                        self._restringir(candidatos, outro, candidatos[outro] & ~m)
+                        mudou = True
+
+        return mudou
+
+    def _hidden_pairs(self, candidatos: list[int]) -> bool:
+        mudou = False
+
+        for unidade in self.unidades:
+            # Para cada cor que aparece em exatamente dois vértices, guarda o par
+            pares = {}
+            for d in range(self.tamanho):
+                bit = 1 << d
+                posicoes = tuple(v for v in unidade if candidatos[v] & bit)
+                if len(posicoes) == 2:
+                    pares[posicoes] = pares.get(posicoes, 0) | bit
+
+            for posicoes, cores in pares.items():
+                if cores.bit_count() != 2:
+                    continue
+
+                # As duas cores só cabem nesses dois vértices: descarta o resto deles
+                for v in posicoes:
+                    if candidatos[v] & ~cores:
+                        self._restringir(candidatos, v, candidatos[v] & cores)
+                        mudou = True
+
+        return mudou
+
+    def _pointing_claiming(self, candidatos: list[int]) -> bool:
+        mudou = False
+
+        for (resto_a, inter, resto_b) in self.intersecoes:
+            na_inter = 0
+            for v in inter:
+                na_inter |= candidatos[v]
+
+            fora = 0
+            for v in resto_a:
+                fora |= candidatos[v]
+
+            # Cores que, na unidade A, só cabem na interseção com B
+            presas = na_inter & ~fora
+            if not presas:
+                continue
+
+            for v in resto_b:
+                if candidatos[v] & presas:
+                    self._restringir(candidatos, v, candidatos[v] & ~presas)
+                    mudou = True
+
+        return mudou
+
+
+def obter_propagador(graph: IGraph) -> ConstraintPropagator:
+    """Retorna o propagador da topologia do grafo, montando-o na 1ª vez."""
+    topologia = graph.topologia
+    if topologia not in _PROPAGADORES:
+        _PROPAGADORES[topologia] = ConstraintPropagator(graph)
+    return _PROPAGADORES[topologia]
+
+
+class PropagatingSolver(ISolver):
+    """
+    Solver em pipeline: propaga restrições antes de qualquer busca.
+
+    - Sem solver interno: faz busca MRV própria, propagando até o ponto fixo
+      em cada nó da árvore (a maioria dos puzzles fáceis e médios é resolvida
+      sem nenhuma ramificação).
+    - Com solver interno: funciona como estágio de pré-processamento, preenche
+      no grid os vértices determinados e delega o restante ao solver injetado.
+    """
+
+    def __init__(self, solver_interno: ISolver | None = None):
+        self.solver_interno = solver_interno
+
+    def solve(self, grid: list[list[int]], graph: IGraph) -> bool:
+        self.propagador = obter_propagador(graph)
+        est = self.estatisticas
+
+        candidatos = self.propagador.candidatos_iniciais(grid)
+        if est is None:
+            consistente = self.propagador.propagar(candidatos)
+        else:
+            est.iniciar()
+            consistente = est.propagar(self.propagador.propagar, candidatos)
+
+        if self.orcamento is not None:
+            self.orcamento.iniciar()
+
+        if not consistente:
+            return False
+
+        if self.solver_interno is not None:
+            self._gravar(grid, candidatos)
+            return self.solver_interno.solve(grid, graph)
+
+        solucao = self._buscar(candidatos)
+        if self.orcamento is not None and self.orcamento.esgotado:
+            return ORCAMENTO_ESGOTADO
+        if solucao is None:
+            return False
+
+        self._gravar(grid, solucao)
+        return True
+
+    def _gravar(self, grid: list[list[int]], candidatos: list[int]):
+        """Escreve no grid os vértices com uma única cor candidata."""
+        for v, m in enumerate(candidatos):
+            if m & (m - 1) == 0:
+                (linha, col) = self.propagador.coordenadas[v]
+                grid[linha][col] = m.bit_length()
+
+    def _escolher_vertice(self, candidatos: list[int]) -> int | None:
+        """MRV: vértice indeciso com menos candidatos (None se todos decididos)."""
+        melhor_v = None
+        min_opcoes = self.propagador.tamanho + 1
+
+        for v, m in enumerate(candidatos):
+            qtd = m.bit_count()
+            if 1 < qtd < min_opcoes:
+                min_opcoes = qtd
+                melhor_v = v
+                if qtd == 2:
+                    break
+
+        return melhor_v
+
+    def _buscar(self, candidatos: list[int]) -> list[int] | None:
+        est = self.estatisticas
+
+        # 1. MRV: vértice indeciso com menos candidatos
+        if est is None:
+            melhor_v = self._escolher_vertice(candidatos)
+        else:
+            melhor_v = est.selecionar(self._escolher_vertice, candidatos)
+
+        # Caso Base (Sucesso): todos os vértices decididos
+        if melhor_v is None:
+            return candidatos
+
+        # 2. Ramifica sobre as cores candidatas, propagando em cada ramo
+        livres = candidatos[melhor_v]
+        if est is not None:
+            est.candidatos_avaliados += livres.bit_count()
+
+        while livres:
+            if self.orcamento is not None and self.orcamento.consumir():
+                return None # Orçamento esgotado: abandona a busca
+
+            bit = livres & -livres
+            livres ^= bit
+
+            ramo = list(candidatos)
+            ramo[melhor_v] = bit
+
+            if est is None:
+                consistente = self.propagador.propagar(ramo, [melhor_v])
+            else:
+                est.no(melhor_v, bit.bit_length())
+                consistente = est.propagar(self.propagador.propagar, ramo, [melhor_v])
+
+            if consistente:
+                solucao = self._buscar(ramo)
+                if solucao is not None:
+                    return solucao
+
+            if est is not None:
+                est.backtrack()
+
+        return None
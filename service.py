@@ -0,0 +1,264 @@
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from graph import SudokuGraph
+from solvers import BitmaskBacktrackingSolver, BacktrackingCounter, IterativeSolver
+from dlx import DancingLinksSolver
+from generator import PuzzleGenerator, BaseGridGenerator
+from budget import SearchBudget, ORCAMENTO_ESGOTADO
+from utils import linha_para_grid, grid_para_linha, validar_grid_inicial, percentis
+
+# Contadores selecionáveis nas requisições "count" (campo "motor")
+CONTADORES = {
+    "backtracking": BacktrackingCounter,
+    "dlx": DancingLinksSolver,
+    "iterativo": IterativeSolver,
+}
+
+# Tempo extra que o laço de eventos espera além do prazo, para que a própria
+# resposta de orçamento esgotado do trabalhador chegue antes do timeout
+_FOLGA = 0.5
+
+# Estado de cada processo trabalhador, criado uma única vez na inicialização
+_graphs = {}
+_solvers = {}
+_contadores = {}
+_gerador = None
+
+
+def _inicializar_trabalhador(ordens: tuple[int, ...], motores: dict):
+    """Roda uma vez por processo: grafos das ordens atendidas e uma instância de cada motor."""
+    global _gerador
+    for n in ordens:
+        _graphs[n] = SudokuGraph(n=n)
+    for nome, motor in motores.items():
+        _solvers[nome] = motor()
+    for nome, contador in CONTADORES.items():
+        _contadores[nome] = contador()
+    _gerador = PuzzleGenerator(BitmaskBacktrackingSolver(), BacktrackingCounter(), BaseGridGenerator())
+
+
+def _graph(n: int) -> SudokuGraph:
+    if n not in _graphs:
+        raise ValueError(f"Ordem n={n} não atendida por este serviço.")
+    return _graphs[n]
+
+
+def _resolver(n: int, linha: str, motor: str, prazo: float) -> dict:
+    graph = _graph(n)
+    grid = linha_para_grid(linha, n)
+    if not validar_grid_inicial(grid, graph, verbose=False):
+        return {"ok": False, "erro": "pistas conflitantes"}
+
+    solver = _solvers[motor]
+    solver.orcamento = SearchBudget(prazo=prazo)
+    resultado = solver.solve(grid, graph)
+
+    if resultado is ORCAMENTO_ESGOTADO:
+        return {"ok": False, "erro": "tempo esgotado"}
+    if not resultado:
+        return {"ok": False, "erro": "sem solução"}
+    return {"ok": True, "solucao": grid_para_linha(grid)}
+
+
+def _contar(n: int, linha: str, motor: str, limite: int | None, prazo: float) -> dict:
+    graph = _graph(n)
+    grid = linha_para_grid(linha, n)
+
+    contador = _contadores[motor]
+    contador.orcamento = SearchBudget(prazo=prazo)
+    resultado = contador.count_solutions(grid, graph, limit=limite)
+
+    if resultado is ORCAMENTO_ESGOTADO:
+        return {"ok": False, "erro": "tempo esgotado"}
+    return {"ok": True, "solucoes": resultado}
+
+
+def _gerar(n: int, semente, prazo: float) -> dict:
+    _graph(n)
+    puzzle, solucao = _gerador.gerar_puzzle(n, rng=random.Random(semente), verbose=False, prazo=prazo)
+    return {"ok": True, "puzzle": grid_para_linha(puzzle), "solucao": grid_para_linha(solucao),
+            "completo": _gerador.completo}
+
+
+class SolverService:
+    """
+    Serviço local de longa duração: recebe requisições em JSON lines por TCP,
+    enfileira com asyncio e despacha para um pool de processos aquecido (cada
+    trabalhador monta os SudokuGraph das ordens atendidas e os motores uma vez).
+
+    Uma requisição por linha, por exemplo:
+        {"id": 1, "op": "solve", "puzzle": "..5.3...", "n": 3, "motor": "dlx"}
+        {"id": 2, "op": "count", "puzzle": "...", "limite": 2}
+        {"id": 3, "op": "generate", "n": 3, "semente": 42}
+        {"id": 4, "op": "stats"}
+    Cada resposta é uma linha JSON com o mesmo "id" (podem chegar fora de ordem).
+
+    - Timeout por requisição ("timeout" ou o padrão do serviço), contado desde
+      a chegada: requisições vencidas na fila nem são despachadas, e o tempo
+      restante segue para o trabalhador como orçamento da busca (SearchBudget),
+      que interrompe o motor e libera o processo. Na geração, o prazo ativa o
+      modo anytime: a resposta traz o puzzle único obtido até ali e
+      "completo": false.
+    - Contrapressão: a fila tem tamanho máximo. Com ela cheia, a leitura da
+      conexão para (o TCP segura o cliente) por até 'espera_fila' segundos;
+      depois disso a requisição é recusada com erro "fila cheia".
+    - "stats" devolve percentis de latência por operação e contadores.
+    """
+
+    def __init__(self, motores: dict, ordens: tuple[int, ...] = (2, 3, 4), processos: int | None = None,
+                 tamanho_fila: int = 1000, timeout: float = 10.0, espera_fila: float = 1.0,
+                 janela_latencias: int = 10000):
+        self.motores = motores
+        self.ordens = ordens
+        self.processos = processos
+        self.timeout = timeout
+        self.espera_fila = espera_fila
+
+        self.fila = asyncio.Queue(maxsize=tamanho_fila)
+        self.latencias = {op: deque(maxlen=janela_latencias) for op in ("solve", "count", "generate")}
+        self.contadores = {"recebidas": 0, "concluidas": 0, "erros": 0, "expiradas": 0, "recusadas": 0}
+        self.executor = None
+        self.num_trabalhadores = 0
+
+    async def servir(self, host: str = "127.0.0.1", porta: int = 8765):
+        """Sobe o pool e o servidor TCP e atende até ser cancelado."""
+        self.num_trabalhadores = self.processos or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.num_trabalhadores,
+                                            initializer=_inicializar_trabalhador,
+                                            initargs=(self.ordens, self.motores))
+        despachantes = [asyncio.create_task(self._despachar())
+                        for _ in range(2 * self.num_trabalhadores)]
+
+        servidor = await asyncio.start_server(self._atender, host, porta)
+        print(f"Serviço ouvindo em {host}:{porta}", file=sys.stderr)
+
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            for tarefa in despachantes:
+                tarefa.cancel()
+            self.executor.shutdown(cancel_futures=True)
+
+    async def _atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter):
+        """Lê as requisições de uma conexão; as respostas são escritas ao ficarem prontas."""
+        trava = asyncio.Lock()
+        pendentes = set()
+
+        async def responder(resposta: dict):
+            async with trava:
+                escritor.write((json.dumps(resposta, ensure_ascii=False) + "\n").encode("utf-8"))
+                await escritor.drain()
+
+        try:
+            while linha := await leitor.readline():
+                if not linha.strip():
+                    continue
+
+                try:
+                    requisicao = json.loads(linha)
+                    if not isinstance(requisicao, dict):
+                        raise ValueError("a requisição deve ser um objeto JSON")
+                except ValueError as e:
+                    await responder({"ok": False, "erro": f"JSON inválido: {e}"})
+                    continue
+
+                if requisicao.get("op") == "stats":
+                    await responder({"id": requisicao.get("id"), "ok": True, **self.estatisticas()})
+                    continue
+
+                self.contadores["recebidas"] += 1
+                futuro = asyncio.get_running_loop().create_future()
+                chegada = time.perf_counter()
+
+                try:
+                    await asyncio.wait_for(self.fila.put((requisicao, chegada, futuro)), self.espera_fila)
+                except asyncio.TimeoutError:
+                    self.contadores["recusadas"] += 1
+                    await responder({"id": requisicao.get("id"), "ok": False, "erro": "fila cheia"})
+                    continue
+
+                tarefa = asyncio.create_task(self._aguardar(requisicao, futuro, responder))
+                pendentes.add(tarefa)
+                tarefa.add_done_callback(pendentes.discard)
+
+            if pendentes:
+                await asyncio.gather(*pendentes)
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    async def _aguardar(self, requisicao: dict, futuro: asyncio.Future, responder):
+        resposta = await futuro
+        resposta["id"] = requisicao.get("id")
+        await responder(resposta)
+
+    async def _despachar(self):
+        """Consome a fila e executa cada requisição no pool, respeitando o timeout."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            requisicao, chegada, futuro = await self.fila.get()
+            try:
+                resposta = await self._executar(loop, requisicao, chegada)
+            except Exception as e:
+                resposta = {"ok": False, "erro": str(e)}
+            finally:
+                self.fila.task_done()
+
+            if resposta.get("ok"):
+                self.contadores["concluidas"] += 1
+            elif resposta.get("erro") == "tempo esgotado":
+                self.contadores["expiradas"] += 1
+            else:
+                self.contadores["erros"] += 1
+
+            if not futuro.done():
+                futuro.set_result(resposta)
+
+    async def _executar(self, loop, requisicao: dict, chegada: float) -> dict:
+        op = requisicao.get("op")
+        n = int(requisicao.get("n", 3))
+        timeout = float(requisicao.get("timeout", self.timeout))
+
+        if op == "solve":
+            motor = requisicao.get("motor", "bitmask")
+            if motor not in self.motores:
+                return {"ok": False, "erro": f"motor desconhecido: {motor!r}"}
+            chamada = (_resolver, n, requisicao["puzzle"], motor)
+        elif op == "count":
+            motor = requisicao.get("motor", "dlx")
+            if motor not in CONTADORES:
+                return {"ok": False, "erro": f"contador desconhecido: {motor!r}"}
+            chamada = (_contar, n, requisicao["puzzle"], motor, requisicao.get("limite"))
+        elif op == "generate":
+            chamada = (_gerar, n, requisicao.get("semente", random.randrange(2**63)))
+        else:
+            return {"ok": False, "erro": f"operação desconhecida: {op!r}"}
+
+        restante = timeout - (time.perf_counter() - chegada)
+        if restante <= 0:
+            return {"ok": False, "erro": "tempo esgotado"} # Venceu ainda na fila
+
+        try:
+            resposta = await asyncio.wait_for(loop.run_in_executor(self.executor, *chamada, restante),
+                                              restante + _FOLGA)
+        except asyncio.TimeoutError:
+            return {"ok": False, "erro": "tempo esgotado"}
+
+        self.latencias[op].append(time.perf_counter() - chegada)
+        return resposta
+
+    def estatisticas(self) -> dict:
+        return {
+            "fila": self.fila.qsize(),
+            **self.contadores,
+            "latencias": {op: percentis(amostras) for op, amostras in self.latencias.items()},
+        }
@@ -1,4 +1,8 @@
+import random
 from interfaces import ISolver, ISolutionCounter, IGraph
+from budget import ORCAMENTO_ESGOTADO
+from propagation import obter_propagador
+from grid import valores_por_vertice, gravar_por_vertice
 
 class NaiveBacktrackingSolver(ISolver):
     """
@@ -23,10 +27,20 @@ class NaiveBacktrackingSolver(ISolver):
         # Armazena referências temporárias para a execução recursiva
         self.grid = grid
         self.graph = graph
+        self.topologia = graph.topologia
         self.tamanho = len(grid)
+
+        if self.estatisticas is not None:
+            self.estatisticas.iniciar()
+        if self.orcamento is not None:
+            self.orcamento.iniciar()
         
         # Inicia a recursão
-        return self._resolver()
+        sucesso = self._resolver()
+
+        if self.orcamento is not None and self.orcamento.esgotado:
+            return ORCAMENTO_ESGOTADO
+        return sucesso
 
     def _encontrar_proximo_vazio(self) -> tuple[int, int] | None:
         """
@@ -45,9 +59,9 @@ class NaiveBacktrackingSolver(ISolver):
         sem conflitar com seus vizinhos já coloridos.
         """
         # Itera por todos os vizinhos (mesma linha, coluna ou bloco)
-        for vizinho in self.graph.get_vizinhos(v):
-            # Converte o vértice vizinho em coordenadas
-            (l_viz, c_viz) = self.graph.vertice_para_grid(vizinho)
+        for vizinho in self.topologia.vizinhos[v]:
+            # Coordenadas do vizinho (pré-calculadas na topologia)
+            (l_viz, c_viz) = self.topologia.coordenadas[vizinho]
             
             # Verifica se o vizinho já tem a cor que estamos tentando usar
             if self.grid[l_viz][c_viz] == cor:
@@ -60,8 +74,13 @@ class NaiveBacktrackingSolver(ISolver):
         """
         O núcleo do algoritmo de backtracking recursivo.
         """
+        est = self.estatisticas
+
         # 1. Encontrar o próximo vértice a colorir
-        celula_vazia = self._encontrar_proximo_vazio()
+        if est is None:
+            celula_vazia = self._encontrar_proximo_vazio()
+        else:
+            celula_vazia = est.selecionar(self._encontrar_proximo_vazio)
 
         # 2. Caso Base (Sucesso):
         # Se não há células vazias, o grid está completo.
@@ -76,10 +95,20 @@ class NaiveBacktrackingSolver(ISolver):
         for cor in range(1, self.tamanho + 1):
             
             # 4a. Verificar restrições (Checar vizinhos)
-            if self._is_coloracao_valida(v, cor):
-                
+            if est is None:
+                valida = self._is_coloracao_valida(v, cor)
+            else:
+                est.candidatos_avaliados += 1
+                valida = est.validar(self._is_coloracao_valida, v, cor)
+
+            if valida:
+                if self.orcamento is not None and self.orcamento.consumir():
+                    return False
+
                 # 4b. Tentar (Colorir o vértice)
                 self.grid[linha][col] = cor
+                if est is not None:
+                    est.no(v, cor)
                 
                 # 4c. Chamar recursão
                 if self._resolver():
@@ -88,6 +117,12 @@ class NaiveBacktrackingSolver(ISolver):
                 # 4d. Desfazer (Backtrack)
                 # Se a recursão falhou (retornou False), desfazemos a tentativa.
                 self.grid[linha][col] = 0
+                if est is not None:
+                    est.backtrack()
+
+                # Orçamento esgotado: desfaz tudo sem explorar mais
+                if self.orcamento is not None and self.orcamento.esgotado:
+                    return False
         
         # 5. Caso Base (Falha):
         # Se todas as cores (1-9) falharam para esta célula.
@@ -99,14 +134,81 @@ class SmartBacktrackingSolver(ISolver):
     Implementa Backtracking com otimizações:
     1. Forward Checking (calcula possibilidades antes de tentar).
     2. Heurística MRV (escolhe a célula com menos opções).
+
+    Heurísticas configuráveis (no construtor ou em cada chamada de solve):
+    - ordem_valores: "natural" (crescente), "lcv" (Least Constraining Value:
+      primeiro a cor que menos reduz as opções dos vizinhos vazios) ou
+      "aleatoria".
+    - desempate: como escolher entre células empatadas no MRV: "varredura"
+      (a primeira encontrada), "grau" (a com mais vizinhos vazios) ou
+      "aleatorio".
+    - reinicios / limite_nos: com reinicios > 0, cada tentativa é abortada ao
+      passar de limite_nos nós e recomeça com empates e ordem de valores
+      sorteados; o limite dobra a cada reinício e a última tentativa não tem
+      limite, então a busca continua completa.
+
+    Após cada solve, 'nos_visitados' guarda o total de nós explorados (somando
+    as tentativas), para comparar combinações de heurísticas.
     """
 
-    def solve(self, grid: list[list[int]], graph: IGraph) -> bool:
+    ORDENS_VALORES = ("natural", "lcv", "aleatoria")
+    DESEMPATES = ("varredura", "grau", "aleatorio")
+
+    def __init__(self, ordem_valores: str = "natural", desempate: str = "varredura",
+                 reinicios: int = 0, limite_nos: int = 1000, semente=None):
+        self.ordem_valores = ordem_valores
+        self.desempate = desempate
+        self.reinicios = reinicios
+        self.limite_nos = limite_nos
+        self.rng = random.Random(semente)
+
+    def solve(self, grid: list[list[int]], graph: IGraph, ordem_valores: str | None = None,
+              desempate: str | None = None, reinicios: int | None = None,
+              limite_nos: int | None = None) -> bool:
         self.grid = grid
         self.graph = graph
+        self.topologia = graph.topologia
         self.tamanho = len(grid)
-        
-        return self._resolver()
+
+        # Parâmetros da chamada sobrepõem os do construtor
+        self.ordem_atual = ordem_valores or self.ordem_valores
+        self.desempate_atual = desempate or self.desempate
+        reinicios = self.reinicios if reinicios is None else reinicios
+        limite = self.limite_nos if limite_nos is None else limite_nos
+
+        if self.ordem_atual not in self.ORDENS_VALORES:
+            raise ValueError(f"ordem_valores inválida: {self.ordem_atual!r}")
+        if self.desempate_atual not in self.DESEMPATES:
+            raise ValueError(f"desempate inválido: {self.desempate_atual!r}")
+
+        self.nos_visitados = 0
+        self.aleatorizar = False
+
+        if self.estatisticas is not None:
+            self.estatisticas.iniciar()
+        if self.orcamento is not None:
+            self.orcamento.iniciar()
+
+        for tentativa in range(reinicios + 1):
+            # A última tentativa roda sem limite para manter a busca completa
+            self.limite_tentativa = limite if tentativa < reinicios else None
+            self.nos_tentativa = 0
+            self.interrompido = False
+
+            if self._resolver():
+                return True
+
+            if self.orcamento is not None and self.orcamento.esgotado:
+                return ORCAMENTO_ESGOTADO # Os reinícios dividem o mesmo orçamento
+
+            if not self.interrompido:
+                return False # Busca completa sem solução: reiniciar não adianta
+
+            # Reinício: próximas tentativas sorteiam empates e ordem de valores
+            self.aleatorizar = True
+            limite *= 2
+
+        return False
     
     def _calcular_possibilidades(self, linha: int, col: int) -> set[int]:
         """
@@ -120,8 +222,8 @@ class SmartBacktrackingSolver(ISolver):
         possiveis = set(range(1, self.tamanho + 1))
         
         # 3. Remove as cores usadas pelos vizinhos
-        for vizinho in self.graph.get_vizinhos(v):
-            (l_viz, c_viz) = self.graph.vertice_para_grid(vizinho)
+        for vizinho in self.topologia.vizinhos[v]:
+            (l_viz, c_viz) = self.topologia.coordenadas[vizinho]
             val_vizinho = self.grid[l_viz][c_viz]
             
             if val_vizinho != 0: # Se o vizinho já tem cor
@@ -139,6 +241,8 @@ class SmartBacktrackingSolver(ISolver):
         """
         melhor_celula = None
         min_opcoes = self.tamanho + 1 # Valor inicial alto para comparação
+        empatadas = [] # Células com min_opcoes (só usadas fora da "varredura")
+        guardar_empates = self.aleatorizar or self.desempate_atual != "varredura"
         
         tem_vazio = False # Flag para saber se o tabuleiro já está cheio
 
@@ -160,20 +264,85 @@ class SmartBacktrackingSolver(ISolver):
                     if qtd < min_opcoes:
                         min_opcoes = qtd
                         melhor_celula = (l, c)
+                        empatadas = [melhor_celula]
                         
                         # Otimização extra: Se só tem 1 opção, é impossível ser melhor.
                         # Retorna logo para economizar tempo.
                         if min_opcoes == 1:
                             return melhor_celula
+                    elif qtd == min_opcoes and guardar_empates:
+                        empatadas.append((l, c))
 
         if not tem_vazio:
             return None # Tabuleiro completo!
+
+        if len(empatadas) > 1:
+            return self._desempatar(empatadas)
             
         return melhor_celula
+
+    def _desempatar(self, empatadas: list[tuple[int, int]]) -> tuple[int, int]:
+        """Escolhe entre células empatadas no MRV conforme a heurística de desempate."""
+        if self.desempate_atual == "grau":
+            # Grau dinâmico: mais vizinhos vazios = mais restrições propagadas
+            graus = [self._grau_vazio(celula) for celula in empatadas]
+            maior_grau = max(graus)
+            empatadas = [celula for celula, grau in zip(empatadas, graus) if grau == maior_grau]
+
+        if self.desempate_atual == "aleatorio" or self.aleatorizar:
+            return self.rng.choice(empatadas)
+
+        return empatadas[0]
+
+    def _grau_vazio(self, celula: tuple[int, int]) -> int:
+        """Quantos vizinhos da célula ainda estão vazios."""
+        v = self.graph.grid_para_vertice(*celula)
+        grau = 0
+        for vizinho in self.topologia.vizinhos[v]:
+            (l_viz, c_viz) = self.topologia.coordenadas[vizinho]
+            if self.grid[l_viz][c_viz] == 0:
+                grau += 1
+        return grau
+
+    def _ordenar_valores(self, linha: int, col: int, cores_validas: set[int]) -> list[int]:
+        """Ordena as cores a tentar conforme a heurística de ordem de valores."""
+        cores = sorted(cores_validas)
+
+        if self.ordem_atual == "aleatoria" or self.aleatorizar:
+            self.rng.shuffle(cores) # Em "lcv", o sort estável abaixo mantém o sorteio só entre empates
+
+        if self.ordem_atual == "lcv":
+            # Quantos vizinhos vazios perderiam cada cor se ela fosse usada aqui
+            v = self.graph.grid_para_vertice(linha, col)
+            conflitos = dict.fromkeys(cores, 0)
+            for vizinho in self.topologia.vizinhos[v]:
+                (l_viz, c_viz) = self.topologia.coordenadas[vizinho]
+                if self.grid[l_viz][c_viz] == 0:
+                    for cor in self._calcular_possibilidades(l_viz, c_viz):
+                        if cor in conflitos:
+                            conflitos[cor] += 1
+            cores.sort(key=conflitos.__getitem__)
+
+        return cores
     
     def _resolver(self) -> bool:
+        # 0. Contabiliza o nó e respeita o limite da tentativa (reinícios)
+        self.nos_visitados += 1
+        self.nos_tentativa += 1
+        if self.limite_tentativa is not None and self.nos_tentativa > self.limite_tentativa:
+            self.interrompido = True
+            return False
+        if self.orcamento is not None and self.orcamento.consumir():
+            self.interrompido = True
+            return False
+
+        est = self.estatisticas
+
         # 1. Pergunta para o Seletor qual a próxima célula
-        resultado = self._encontrar_melhor_celula()
+        if est is None:
+            resultado = self._encontrar_melhor_celula()
+        else:
+            resultado = est.selecionar(self._encontrar_melhor_celula)
         
         # Caso Base 1: Beco sem saída detectado antecipadamente
         if resultado == "FALHA":
@@ -186,12 +355,19 @@ class SmartBacktrackingSolver(ISolver):
         # Preparação
         linha, col = resultado
         
-        # 2. Busca apenas as cores VÁLIDAS (otimização do loop)
-        cores_validas = self._calcular_possibilidades(linha, col)
+        # 2. Busca apenas as cores VÁLIDAS (otimização do loop),
+        #    na ordem definida pela heurística de valores
+        if est is None:
+            cores_validas = self._calcular_possibilidades(linha, col)
+        else:
+            cores_validas = est.validar(self._calcular_possibilidades, linha, col)
+            est.candidatos_avaliados += len(cores_validas)
         
-        for cor in cores_validas:
+        for cor in self._ordenar_valores(linha, col, cores_validas):
             # Tentar
             self.grid[linha][col] = cor
+            if est is not None:
+                est.no(self.graph.grid_para_vertice(linha, col), cor)
             
             # Recursão
             if self._resolver():
@@ -199,83 +375,524 @@ class SmartBacktrackingSolver(ISolver):
             
             # Backtrack (Desfazer)
             self.grid[linha][col] = 0
+            if est is not None:
+                est.backtrack()
+
+            # Tentativa abortada pelo limite de nós: desfaz tudo sem explorar mais
+            if self.interrompido:
+                return False
             
         return False
 
 
-class BacktrackingCounter(ISolutionCounter):
-    def count_solutions(self, grid, graph) -> int:
+class _BuscaComMascaras:
+    """
+    Estado compartilhado pelas buscas com rastreamento incremental de candidatos.
+
+    Mantém:
+    1. Máscaras de bits com as cores já usadas em cada unidade do grafo
+       (linha, coluna, bloco e, nas variantes, regiões, diagonais, janelas...).
+    2. A quantidade de candidatos de cada célula (vértice) ainda vazia.
+
+    Colorir ou descolorir um vértice atualiza essas estruturas em O(grau), e a
+    heurística MRV apenas lê os contadores, sem montar conjuntos. As unidades
+    de cada vértice vêm das colunas pré-compiladas da topologia, então
+    qualquer variante roda no mesmo caminho rápido do Sudoku clássico.
+    """
+
+    def _preparar(self, grid: list[list[int]], graph: IGraph) -> bool:
+        """
+        Monta o estado interno (valores planos, vizinhos, máscaras e contadores).
+        Retorna False se as pistas iniciais já violam alguma restrição.
+        """
         self.grid = grid
         self.graph = graph
         self.tamanho = len(grid)
+
+        if self.estatisticas is not None:
+            self.estatisticas.iniciar()
+        if self.orcamento is not None:
+            self.orcamento.iniciar()
+
+        topologia = graph.topologia
+        self.num_vertices = topologia.num_vertices
+        self.cheia = (1 << self.tamanho) - 1 # Máscara com todas as cores
+
+        # Tabelas planas compartilhadas (somente leitura) da topologia em cache
+        self.vizinhos = topologia.vizinhos
+        self.unidades_de = topologia.unidades_de
+        self.u0, self.u1, self.u2 = topologia.colunas_unidades[:3]
+        self.colunas_extras = topologia.colunas_unidades[3:]
+
+        # Clássico, jigsaw: 3 unidades por vértice, sem laço nenhum
+        self._usadas = self._usadas_extras if self.colunas_extras else self._usadas_3
+
+        self.valores = list(valores_por_vertice(grid, topologia.coordenadas))
+
+        # Uma máscara por unidade, mais a unidade vazia do preenchimento das colunas
+        self.mascaras = [0] * (len(topologia.unidades) + 1)
+
+        for v in range(self.num_vertices):
+            cor = self.valores[v]
+            if cor != 0:
+                bit = 1 << (cor - 1)
+                if self._usadas(v) & bit:
+                    return False
+                for u in self.unidades_de[v]:
+                    self.mascaras[u] |= bit
+
+        self.qtd_candidatos = [0] * self.num_vertices
+        for v in range(self.num_vertices):
+            if self.valores[v] == 0:
+                self.qtd_candidatos[v] = (self.cheia & ~self._usadas(v)).bit_count()
+
+        return True
+
+    def _usadas_3(self, v: int) -> int:
+        """Máscara das cores já usadas nas unidades do vértice v (até 3 unidades)."""
+        m = self.mascaras
+        return m[self.u0[v]] | m[self.u1[v]] | m[self.u2[v]]
+
+    def _usadas_extras(self, v: int) -> int:
+        """Como _usadas_3, para variantes com vértices em mais de 3 unidades."""
+        m = self.mascaras
+        usadas = m[self.u0[v]] | m[self.u1[v]] | m[self.u2[v]]
+        for coluna in self.colunas_extras:
+            usadas |= m[coluna[v]]
+        return usadas
+
+    def _colorir(self, v: int, cor: int):
+        """Atribui 'cor' ao vértice v e desconta o candidato dos vizinhos vazios."""
+        bit = 1 << (cor - 1)
+
+        # Só desconta quem ainda tinha essa cor como candidata
+        for vizinho in self.vizinhos[v]:
+            if self.valores[vizinho] == 0 and not (self._usadas(vizinho) & bit):
+                self.qtd_candidatos[vizinho] -= 1
+
+        for u in self.unidades_de[v]:
+            self.mascaras[u] |= bit
+        self.valores[v] = cor
+
+    def _descolorir(self, v: int, cor: int):
+        """Desfaz _colorir: libera a cor e devolve o candidato aos vizinhos vazios."""
+        bit = 1 << (cor - 1)
+
+        self.valores[v] = 0
+        for u in self.unidades_de[v]:
+            self.mascaras[u] &= ~bit
+
+        for vizinho in self.vizinhos[v]:
+            if self.valores[vizinho] == 0 and not (self._usadas(vizinho) & bit):
+                self.qtd_candidatos[vizinho] += 1
+
+    def _tentar(self, v: int, cor: int):
+        """_colorir como nó da busca (registrado nas estatísticas, se ativas)."""
+        est = self.estatisticas
+        if est is None:
+            self._colorir(v, cor)
+        else:
+            est.validar(self._colorir, v, cor)
+            est.no(v, cor)
+
+    def _desfazer(self, v: int, cor: int):
+        """_descolorir como backtrack da busca (registrado nas estatísticas, se ativas)."""
+        est = self.estatisticas
+        if est is None:
+            self._descolorir(v, cor)
+        else:
+            est.validar(self._descolorir, v, cor)
+            est.backtrack()
+
+    def _encontrar_melhor_celula(self):
+        """
+        MRV usando os contadores incrementais.
+        Retorna o vértice escolhido, None (grid completo) ou "FALHA" (beco sem saída).
+        """
+        melhor_v = None
+        min_opcoes = self.tamanho + 1
+
+        for v in range(self.num_vertices):
+            if self.valores[v] == 0:
+                qtd = self.qtd_candidatos[v]
+
+                if qtd == 0:
+                    return "FALHA"
+
+                if qtd < min_opcoes:
+                    min_opcoes = qtd
+                    melhor_v = v
+
+                    if min_opcoes == 1:
+                        return melhor_v
+
+        return melhor_v
+
+
+class BitmaskBacktrackingSolver(_BuscaComMascaras, ISolver):
+    """
+    Variante do SmartBacktrackingSolver com rastreamento incremental de candidatos.
+
+    Em vez de recalcular um set de possibilidades para cada célula vazia a cada
+    passo, usa as máscaras e contadores de _BuscaComMascaras.
+    """
+
+    def solve(self, grid: list[list[int]], graph: IGraph) -> bool:
+        if not self._preparar(grid, graph):
+            return False # Pistas iniciais conflitantes
+
+        sucesso = self._resolver()
+
+        if self.orcamento is not None and self.orcamento.esgotado:
+            return ORCAMENTO_ESGOTADO
+
+        if sucesso:
+            # Copia a coloração encontrada de volta para o grid
+            gravar_por_vertice(self.grid, self.graph.topologia.coordenadas, self.valores)
+
+        return sucesso
+
+    def _resolver(self) -> bool:
+        est = self.estatisticas
+
+        if self.orcamento is not None and self.orcamento.consumir():
+            return False # Orçamento esgotado: desfaz tudo sem explorar mais
+
+        if est is None:
+            resultado = self._encontrar_melhor_celula()
+        else:
+            resultado = est.selecionar(self._encontrar_melhor_celula)
+
+        if resultado == "FALHA":
+            return False
+
+        if resultado is None:
+            return True
+
+        v = resultado
+        livres = self.cheia & ~self._usadas(v)
+        if est is not None:
+            est.candidatos_avaliados += livres.bit_count()
+
+        # Itera pelos bits ligados (cores válidas), do menor para o maior
+        while livres:
+            bit = livres & -livres
+            livres ^= bit
+            cor = bit.bit_length()
+
+            self._tentar(v, cor)
+
+            if self._resolver():
+                return True
+
+            self._desfazer(v, cor)
+
+            if self.orcamento is not None and self.orcamento.esgotado:
+                return False
+
+        return False
+
+
+class BacktrackingCounter(_BuscaComMascaras, ISolutionCounter):
+    """
+    Conta as soluções de um grid usando a mesma ordenação do Smart
+    (MRV + Forward Checking), com parada antecipada ao atingir 'limit'.
+
+    Para verificar unicidade basta limit=2: assim que a segunda solução
+    aparece, a busca é interrompida. O grid recebido não é modificado.
+    Chama 'ao_encontrar' (ISolutionCounter) a cada solução contada.
+    """
+
+    def count_solutions(self, grid: list[list[int]], graph: IGraph, limit: int | None = None) -> int:
         self.contador_solucoes = 0
+        self.limite = limit
+
+        if not self._preparar(grid, graph):
+            return 0 # Pistas conflitantes: nenhuma solução
 
         self._contar_recursivo()
 
-        return self.contador_solucoes
-    
-    def _contar_recursivo(self):
-            # 1. Encontra o próximo vértice a colorir
-            celula_vazia = self._encontrar_proximo_vazio()
+        if self.orcamento is not None and self.orcamento.esgotado:
+            return ORCAMENTO_ESGOTADO # A contagem parcial fica em contador_solucoes
 
-            # 2. Caso Base (Sucesso):
-            # Se não há células vazias, uma solução completa foi encontrada.
-            if celula_vazia is None:
-                self.contador_solucoes += 1 # Incrementa o contador
-                return False # Retorna False para FORÇAR a continuação da busca
+        return self.contador_solucoes
 
-            # 3. Preparar Recursão:
-            linha, col = celula_vazia
-            v = self.graph.grid_para_vertice(linha, col)
+    def tem_solucao_alternativa(self, grid: list[list[int]], graph: IGraph, v: int, cor_proibida: int) -> bool:
+        """
+        Busca uma solução com v != cor_proibida, sem copiar o grid: a busca
+        trabalha no estado plano interno e desfaz as próprias alterações.
+        """
+        self.contador_solucoes = 0
+        self.limite = 1
 
-            # 4. Caso Recursivo (Tentar cores de 1 a 9)
-            for cor in range(1, self.tamanho + 1):
-                
-                # 4a. Verificar restrições (Checar vizinhos)
-                if self._is_coloracao_valida(v, cor):
-                    
-                    # 4b. Tentar (Colorir o vértice)
-                    self.grid[linha][col] = cor
-                    
-                    # 4c. Chamar recursão
-                    #    Note que NÃO retornamos True aqui.
-                    #    Nós apenas chamamos a função para continuar a busca.
-                    self._contar_recursivo()
-                    
-                    # 4d. Desfazer (Backtrack)
-                    # O backtrack acontece IMEDIATAMENTE após a chamada recursiva,
-                    # para que o loop 'for' possa tentar a próxima cor.
-                    self.grid[linha][col] = 0
-            
-            # 5. Caso Base (Falha):
-            # Se todas as cores (1-9) falharam para esta célula.
+        if not self._preparar(grid, graph):
             return False
 
-    def _encontrar_proximo_vazio(self) -> tuple[int, int] | None:
+        livres = self.cheia & ~self._usadas(v) & ~(1 << (cor_proibida - 1))
+
+        while livres:
+            bit = livres & -livres
+            livres ^= bit
+            cor = bit.bit_length()
+
+            self._tentar(v, cor)
+            encontrou = self._contar_recursivo()
+            self._desfazer(v, cor)
+
+            if self.orcamento is not None and self.orcamento.esgotado:
+                return ORCAMENTO_ESGOTADO
+            if encontrou:
+                return True
+
+        return False
+
+    def subproblemas(self, grid: list[list[int]], graph: IGraph, profundidade: int):
         """
-        Encontra a próxima célula vazia (valor 0) no grid.
-        Na Teoria dos Grafos: "Encontra o próximo vértice não colorido".
+        Divide a árvore de busca em subproblemas independentes: desce pela
+        mesma ordem MRV até 'profundidade' ramificações e gera os valores por
+        vértice (bytes) de cada nó dessa fronteira. Vértices forçados (um
+        único candidato) não contam como ramificação. As soluções do grid
+        são exatamente a união disjunta das soluções dos subproblemas.
+
+        É um gerador: a fronteira nunca fica inteira na memória.
         """
-        for l in range(self.tamanho):
-            for c in range(self.tamanho):
-                if self.grid[l][c] == 0:
-                    return (l, c)
-        return None # Nenhuma célula vazia, o grid está completo.
+        if not self._preparar(grid, graph):
+            return # Pistas conflitantes: nenhum subproblema
+        yield from self._dividir(profundidade)
 
-    def _is_coloracao_valida(self, v: int, cor: int) -> bool:
+    def _dividir(self, profundidade: int):
+        resultado = self._encontrar_melhor_celula()
+
+        if resultado == "FALHA":
+            return
+
+        if resultado is None or profundidade == 0:
+            yield bytes(self.valores)
+            return
+
+        v = resultado
+        livres = self.cheia & ~self._usadas(v)
+        proxima = profundidade - 1 if livres & (livres - 1) else profundidade
+
+        while livres:
+            bit = livres & -livres
+            livres ^= bit
+            cor = bit.bit_length()
+
+            self._colorir(v, cor)
+            yield from self._dividir(proxima)
+            self._descolorir(v, cor)
+
+    def _contar_recursivo(self) -> bool:
         """
-        Verifica se uma 'cor' (dígito) pode ser colocada no vértice 'v'
-        sem conflitar com seus vizinhos já coloridos.
+        Explora a árvore de busca contando as folhas completas.
+        Retorna True quando o limite foi atingido ou o orçamento acabou
+        (sinal para parar a busca).
         """
-        # Itera por todos os vizinhos (mesma linha, coluna ou bloco)
-        for vizinho in self.graph.get_vizinhos(v):
-            # Converte o vértice vizinho em coordenadas
-            (l_viz, c_viz) = self.graph.vertice_para_grid(vizinho)
-            
-            # Verifica se o vizinho já tem a cor que estamos tentando usar
-            if self.grid[l_viz][c_viz] == cor:
-                return False
-        
-        # Nenhuma colisão encontrada
+        est = self.estatisticas
+
+        if self.orcamento is not None and self.orcamento.consumir():
+            return True
+
+        # 1. Seleciona o vértice mais restrito (MRV)
+        if est is None:
+            resultado = self._encontrar_melhor_celula()
+        else:
+            resultado = est.selecionar(self._encontrar_melhor_celula)
+
+        if resultado == "FALHA":
+            return False
+
+        # 2. Caso Base (Sucesso): uma solução completa foi encontrada
+        if resultado is None:
+            self.contador_solucoes += 1
+            if self.ao_encontrar is not None:
+                self.ao_encontrar(self.valores)
+            return self.limite is not None and self.contador_solucoes >= self.limite
+
+        v = resultado
+        livres = self.cheia & ~self._usadas(v)
+        if est is not None:
+            est.candidatos_avaliados += livres.bit_count()
+
+        # 3. Tenta apenas as cores válidas (Forward Checking)
+        while livres:
+            bit = livres & -livres
+            livres ^= bit
+            cor = bit.bit_length()
+
+            self._tentar(v, cor)
+            parar = self._contar_recursivo()
+            self._desfazer(v, cor)
+
+            if parar:
+                return True # Limite atingido: propaga a parada
+
+        return False
+
+
+class IterativeSolver(ISolver, ISolutionCounter):
+    """
+    Solver/contador sem recursão, pensado para ordens grandes (16x16, 25x25...).
+
+    A árvore de busca é percorrida com uma pilha explícita de quadros
+    [marca da trilha, vértice, cores ainda não tentadas], e toda alteração de
+    candidatos (a escolha da cor e tudo o que a propagação deduz a partir dela)
+    é registrada em uma trilha de pares (vértice, máscara anterior). O
+    backtrack apenas desempilha a trilha até a marca do quadro, desfazendo as
+    alterações no lugar, sem cópias e sem frames de Python por vértice.
+
+    Em cada nó roda o ConstraintPropagator, sem o qual MRV puro costuma travar
+    em tabuleiros grandes.
+    """
+
+    def solve(self, grid: list[list[int]], graph: IGraph) -> bool:
+        self.limite = 1
+
+        if not self._iniciar(grid, graph):
+            return False
+
+        encontrou = self._buscar()
+        if self._esgotado():
+            return ORCAMENTO_ESGOTADO
+        if not encontrou:
+            return False
+
+        gravar_por_vertice(grid, self.propagador.coordenadas, [m.bit_length() for m in self.candidatos])
+
         return True
-        
\ No newline at end of file
+
+    def count_solutions(self, grid: list[list[int]], graph: IGraph, limit: int | None = None) -> int:
+        self.limite = limit
+
+        if self._iniciar(grid, graph):
+            self._buscar()
+
+        return self._resultado(self.contador_solucoes)
+
+    def tem_solucao_alternativa(self, grid: list[list[int]], graph: IGraph, v: int, cor_proibida: int) -> bool:
+        self.limite = 1
+        if not self._iniciar(grid, graph, (v, cor_proibida)):
+            return False
+        return self._resultado(self._buscar())
+
+    def _esgotado(self) -> bool:
+        return self.orcamento is not None and self.orcamento.esgotado
+
+    def _resultado(self, resultado):
+        """O próprio resultado, ou ORCAMENTO_ESGOTADO se a busca foi interrompida."""
+        return ORCAMENTO_ESGOTADO if self._esgotado() else resultado
+
+    def _iniciar(self, grid: list[list[int]], graph: IGraph, proibida: tuple[int, int] | None = None) -> bool:
+        """Monta os candidatos iniciais e propaga. Retorna False se já há contradição."""
+        self.propagador = obter_propagador(graph)
+        self.candidatos = self.propagador.candidatos_iniciais(grid)
+        self.trilha = []
+        self.contador_solucoes = 0
+
+        if proibida is not None:
+            v, cor = proibida
+            self.candidatos[v] &= ~(1 << (cor - 1))
+
+        if self.orcamento is not None:
+            self.orcamento.iniciar()
+
+        est = self.estatisticas
+        if est is None:
+            return self.propagador.propagar(self.candidatos)
+
+        est.iniciar()
+        return est.propagar(self.propagador.propagar, self.candidatos)
+
+    def _escolher_vertice(self) -> int | None:
+        """MRV: vértice indeciso com menos candidatos (None se todos decididos)."""
+        melhor_v = None
+        min_opcoes = self.propagador.tamanho + 1
+
+        for v, m in enumerate(self.candidatos):
+            qtd = m.bit_count()
+            if 1 < qtd < min_opcoes:
+                min_opcoes = qtd
+                melhor_v = v
+                if qtd == 2:
+                    break
+
+        return melhor_v
+
+    def _desfazer_ate(self, marca: int):
+        """Restaura as máscaras registradas na trilha depois da marca."""
+        candidatos = self.candidatos
+        trilha = self.trilha
+
+        while len(trilha) > marca:
+            v, anterior = trilha.pop()
+            candidatos[v] = anterior
+
+    def _solucao_encontrada(self) -> bool:
+        """Conta a solução atual. Retorna True se o limite foi atingido."""
+        self.contador_solucoes += 1
+        return self.limite is not None and self.contador_solucoes >= self.limite
+
+    def _buscar(self) -> bool:
+        """
+        Percorre a árvore de busca com a pilha explícita.
+        Retorna True quando o limite de soluções foi atingido (os candidatos
+        ficam com a última solução encontrada) ou o orçamento acabou.
+        """
+        candidatos = self.candidatos
+        trilha = self.trilha
+        est = self.estatisticas
+        orcamento = self.orcamento
+
+        v = self._escolher_vertice() if est is None else est.selecionar(self._escolher_vertice)
+        if v is None:
+            return self._solucao_encontrada()
+
+        pilha = [[len(trilha), v, candidatos[v]]]
+        if est is not None:
+            est.candidatos_avaliados += candidatos[v].bit_count()
+
+        while pilha:
+            quadro = pilha[-1]
+            marca, v, livres = quadro
+
+            # A trilha passa da marca só se a última cor deste quadro foi tentada
+            if est is not None and len(trilha) > marca:
+                est.backtrack()
+
+            # Backtrack no lugar: volta ao estado de quando o quadro foi criado
+            self._desfazer_ate(marca)
+
+            if not livres:
+                pilha.pop() # Cores esgotadas: volta para o quadro de baixo
+                continue
+
+            if orcamento is not None and orcamento.consumir():
+                return True
+
+            # Tenta a próxima cor, registrando a escolha na trilha
+            bit = livres & -livres
+            quadro[2] = livres ^ bit
+            trilha.append((v, candidatos[v]))
+            candidatos[v] = bit
+
+            if est is None:
+                consistente = self.propagador.propagar(candidatos, [v], trilha)
+            else:
+                est.no(v, bit.bit_length())
+                consistente = est.propagar(self.propagador.propagar, candidatos, [v], trilha)
+
+            if not consistente:
+                continue # Contradição: a próxima volta desfaz e tenta outra cor
+
+            proximo = self._escolher_vertice() if est is None else est.selecionar(self._escolher_vertice)
+            if proximo is None:
+                if self._solucao_encontrada():
+                    return True
+                continue
+
+            pilha.append([len(trilha), proximo, candidatos[proximo]])
+            if est is not None:
+                est.candidatos_avaliados += candidatos[proximo].bit_count()
+
+        return False
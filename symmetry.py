@@ -0,0 +1,164 @@
+import random
+from itertools import islice, permutations, product
+from typing import Sequence
+
+# Máximo de combinações (ordem das linhas x ordem das colunas) testadas por
+# orientação ao procurar a forma canônica.
+LIMITE_COMBINACOES = 512
+
+
+class Transformacao:
+    """
+    Elemento do grupo de simetrias do Sudoku, em forma plana:
+    transformado[i] = rotulos[original[perm[i]]].
+
+    'perm' combina transposição e permutações de bandas, linhas dentro das
+    bandas, pilhas e colunas dentro das pilhas; 'rotulos' é a troca de dígitos
+    (rotulos[0] = 0, para que células vazias continuem vazias).
+    """
+
+    __slots__ = ("perm", "rotulos")
+
+    def __init__(self, perm: Sequence[int], rotulos: Sequence[int]):
+        self.perm = tuple(perm)
+        self.rotulos = tuple(rotulos)
+
+    def aplicar(self, valores: Sequence[int]) -> bytearray:
+        rotulos = self.rotulos
+        return bytearray(rotulos[valores[v]] for v in self.perm)
+
+    def desfazer(self, valores: Sequence[int]) -> bytearray:
+        """Inverso de aplicar: leva valores do espaço transformado de volta ao original."""
+        inverso = [0] * len(self.rotulos)
+        for original, novo in enumerate(self.rotulos):
+            inverso[novo] = original
+
+        resultado = bytearray(len(self.perm))
+        for i, v in enumerate(self.perm):
+            resultado[v] = inverso[valores[i]]
+        return resultado
+
+
+def transformacao_aleatoria(n: int, rng: random.Random | None = None) -> Transformacao:
+    """Sorteia um elemento uniforme do grupo de simetrias da ordem n."""
+    rng = rng or random
+    t = n * n
+
+    def ordem_aleatoria():
+        grupos = list(range(n))
+        rng.shuffle(grupos)
+        ordem = []
+        for g in grupos:
+            dentro = list(range(g * n, (g + 1) * n))
+            rng.shuffle(dentro)
+            ordem.extend(dentro)
+        return ordem
+
+    ordem_l = ordem_aleatoria()
+    ordem_c = ordem_aleatoria()
+    if rng.random() < 0.5:
+        perm = [c * t + l for l in ordem_l for c in ordem_c]
+    else:
+        perm = [l * t + c for l in ordem_l for c in ordem_c]
+
+    rotulos = list(range(1, t + 1))
+    rng.shuffle(rotulos)
+    return Transformacao(perm, [0] + rotulos)
+
+
+def _ordens(n: int, assinatura_grupo, assinatura_linha):
+    """
+    Gera as ordens de linhas (ou colunas) compatíveis com as assinaturas:
+    grupos (bandas/pilhas) ordenados pela assinatura do grupo e, dentro de
+    cada grupo, linhas ordenadas pela própria assinatura. Empates geram todas
+    as permutações do trecho empatado.
+    """
+    def variantes(itens, chave):
+        itens = sorted(itens, key=chave)
+        trechos = []
+        inicio = 0
+        for i in range(1, len(itens) + 1):
+            if i == len(itens) or chave(itens[i]) != chave(itens[inicio]):
+                trechos.append(itens[inicio:i])
+                inicio = i
+        for escolha in product(*(permutations(trecho) for trecho in trechos)):
+            yield [item for trecho in escolha for item in trecho]
+
+    for grupos in variantes(range(n), assinatura_grupo):
+        internas = [list(variantes(range(g * n, (g + 1) * n), assinatura_linha)) for g in grupos]
+        for escolha in product(*internas):
+            yield [linha for bloco in escolha for linha in bloco]
+
+
+def _candidatas(valores: Sequence[int], n: int, transposto: bool, limite: int):
+    """Pares (ordem das linhas, ordem das colunas) a testar em uma orientação."""
+    t = n * n
+
+    def celula(linha, col):
+        return valores[col * t + linha] if transposto else valores[linha * t + col]
+
+    # Pistas por (linha, pilha) e por (coluna, banda): invariantes às trocas do outro eixo
+    pistas_lp = [[sum(1 for c in range(p * n, (p + 1) * n) if celula(l, c)) for p in range(n)] for l in range(t)]
+    pistas_cb = [[sum(1 for l in range(b * n, (b + 1) * n) if celula(l, c)) for b in range(n)] for c in range(t)]
+
+    assin_linha = [(sum(pistas_lp[l]), tuple(sorted(pistas_lp[l]))) for l in range(t)]
+    assin_col = [(sum(pistas_cb[c]), tuple(sorted(pistas_cb[c]))) for c in range(t)]
+    assin_banda = [tuple(sorted(assin_linha[b * n:(b + 1) * n])) for b in range(n)]
+    assin_pilha = [tuple(sorted(assin_col[p * n:(p + 1) * n])) for p in range(n)]
+
+    # Sem truncar, o número de ordens pode explodir (ex: muitas linhas vazias)
+    lado = max(1, int(limite ** 0.5))
+    linhas = list(islice(_ordens(n, assin_banda.__getitem__, assin_linha.__getitem__), lado))
+    colunas = list(islice(_ordens(n, assin_pilha.__getitem__, assin_col.__getitem__), lado))
+    return linhas, colunas
+
+
+def forma_canonica(valores: Sequence[int], n: int,
+                   limite: int = LIMITE_COMBINACOES) -> tuple[bytes, Transformacao]:
+    """
+    Leva um puzzle (valores planos por vértice) a uma forma canônica sob o
+    grupo de simetrias do Sudoku, devolvendo (forma, transformação usada).
+
+    As linhas e colunas são ordenadas por assinaturas invariantes (quantidade
+    de pistas por banda/pilha), os empates são resolvidos testando as ordens
+    possíveis e os dígitos são renumerados por ordem de aparição; fica a menor
+    sequência resultante. Com muitos empates a busca é truncada em 'limite'
+    combinações: a forma continua válida (a transformação é exata), apenas
+    deixa de identificar alguns puzzles equivalentes.
+    """
+    t = n * n
+    melhor = None
+    melhor_transf = None
+
+    for transposto in (False, True):
+        linhas, colunas = _candidatas(valores, n, transposto, limite)
+
+        for ordem_l in linhas:
+            for ordem_c in colunas:
+                if transposto:
+                    perm = [c * t + l for l in ordem_l for c in ordem_c]
+                else:
+                    perm = [l * t + c for l in ordem_l for c in ordem_c]
+
+                # Renumeração por ordem de aparição
+                rotulos = [0] * (t + 1)
+                proximo = 1
+                forma = bytearray(len(perm))
+                for i, v in enumerate(perm):
+                    cor = valores[v]
+                    if cor:
+                        if not rotulos[cor]:
+                            rotulos[cor] = proximo
+                            proximo += 1
+                        forma[i] = rotulos[cor]
+
+                if melhor is None or forma < melhor:
+                    # Completa a troca de dígitos com os que não aparecem
+                    for cor in range(1, t + 1):
+                        if not rotulos[cor]:
+                            rotulos[cor] = proximo
+                            proximo += 1
+                    melhor = forma
+                    melhor_transf = Transformacao(perm, rotulos)
+
+    return bytes(melhor), melhor_transf
@@ -0,0 +1,91 @@
+import random
+import unittest
+import numpy as np
+from batch import BatchSolver, SEM_SOLUCAO, RESOLVIDO_PROPAGACAO, RESOLVIDO_BUSCA
+from dlx import DancingLinksSolver
+from graph import VARIANTES, SudokuGraph
+from grid import CompactGrid
+from utils import validar_grid_inicial
+from validation import linhas_para_array
+
+CLASSICOS_9X9 = [
+    "......5.614..6...9.7.....3....98.7..7.6...4...9......1.13..59......2..5..24.....3",
+    ".4.2....82......4...9.1...73.1.5.8.....9..5..9..48...1.....7..67...634...2.......",
+    "800000000003600000070090200050007000000045700000100030001000068008500010090000400",
+    # Pistas conflitantes (dois 5 na primeira linha)
+    "5.....5.614..6...9.7.....3....98.7..7.6...4...9......1.13..59......2..5..24.....3",
+    # Pistas compatíveis, mas a célula (0, 8) precisaria do 9 que já está na coluna
+    "12345678." + "........9" + "." * 63,
+    # Poucas pistas: várias soluções
+    "12345678." + "." * 72,
+]
+
+CLASSICO_16X16 = ("D18..9.F....A.4.2...7.C.9A.....D.9.B...58......GCEF.6A.D.24.....1C2..78....6G.95F.5D.2..4....."
+                  "7.A...5....G...23....EA..13.....C....7.456...2...8.5.2..3.7.C...E....4......3..91...B..D.C..E"
+                  "..3.4....B...G....1.F5.G....72.6FD.A3.D...G...EB.9..2.B....1..4......")
+
+
+def puzzles_da_variante(graph, rng: random.Random, proporcoes=(0.3, 0.45, 0.6)) -> np.ndarray:
+    """Puzzles cavados de uma solução do grafo, mais um com pistas conflitantes."""
+    solucao = CompactGrid(graph.topologia.n)
+    DancingLinksSolver().solve(solucao, graph)
+    solucao = np.frombuffer(bytes(solucao.valores), dtype=np.uint8)
+
+    puzzles = [solucao * np.array([rng.random() < proporcao for _ in solucao])
+               for proporcao in proporcoes]
+    conflito = puzzles[-1].copy()
+    a, b = graph.topologia.unidades[-1][:2]
+    conflito[a] = conflito[b] = 1
+    return np.array(puzzles + [conflito], dtype=np.uint8)
+
+
+class TestBatchSolver(unittest.TestCase):
+    def comparar(self, graph, puzzles: np.ndarray):
+        n = graph.topologia.n
+        solucoes, status = BatchSolver(graph=graph, tamanho_bloco=2).resolver_lote(puzzles)
+        referencia = DancingLinksSolver()
+
+        for puzzle, solucao, estado in zip(puzzles, solucoes, status):
+            grid = CompactGrid(n, bytes(puzzle))
+            if not validar_grid_inicial(grid, graph, verbose=False):
+                quantidade = 0
+            else:
+                quantidade = referencia.count_solutions(grid, graph, limit=2)
+
+            if quantidade == 0:
+                self.assertEqual(estado, SEM_SOLUCAO)
+                np.testing.assert_array_equal(solucao, puzzle)
+                continue
+
+            self.assertIn(estado, (RESOLVIDO_PROPAGACAO, RESOLVIDO_BUSCA))
+            self.assertTrue(((puzzle == 0) | (solucao == puzzle)).all())
+            self.assertNotIn(0, solucao)
+            self.assertTrue(validar_grid_inicial(CompactGrid(n, bytes(solucao)), graph, verbose=False))
+
+            if quantidade == 1:
+                referencia.solve(grid, graph)
+                self.assertEqual(bytes(solucao), bytes(grid.valores))
+
+    def test_classico_9x9(self):
+        self.comparar(SudokuGraph(n=3), linhas_para_array(CLASSICOS_9X9, 3))
+
+    def test_variantes_9x9(self):
+        for nome, variante in VARIANTES.items():
+            with self.subTest(variante=nome):
+                graph = variante(n=3)
+                self.comparar(graph, puzzles_da_variante(graph, random.Random(nome)))
+
+    def test_classico_16x16(self):
+        graph = SudokuGraph(n=4)
+        # Cavados com mais pistas: com poucas, a busca de reserva no 16x16 leva minutos
+        cavados = puzzles_da_variante(graph, random.Random(16), proporcoes=(0.6, 0.75))
+        puzzles = np.concatenate([linhas_para_array([CLASSICO_16X16], 4), cavados])
+        self.comparar(graph, puzzles)
+
+    def test_formato_invalido(self):
+        with self.assertRaises(ValueError):
+            BatchSolver(n=3).resolver_lote(np.zeros((2, 80), dtype=np.uint8))
+
+
+if __name__ == "__main__":
+    unittest.main()
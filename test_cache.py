@@ -0,0 +1,101 @@
+import os
+import random
+import tempfile
+import unittest
+from cache import CachedSolver
+from dlx import DancingLinksSolver
+from graph import SudokuGraph
+from grid import CompactGrid
+from symmetry import transformacao_aleatoria
+from utils import linha_para_grid, validar_grid_inicial
+
+PUZZLES = {
+    2: [".....4...2.34.2."],
+    3: [".4.2....82......4...9.1...73.1.5.8.....9..5..9..48...1.....7..67...634...2.......",
+        ".7.5...........1.9..9.4..6......5..8..83..94.4....65.1..382....6.........2.9....."],
+}
+
+# Pistas compatíveis entre si, mas a célula (0, 8) precisaria do 9 que já está na coluna
+SEM_SOLUCAO = "12345678." + "........9" + "." * 63
+
+
+def valores(linha: str, n: int) -> bytes:
+    return bytes(CompactGrid.de_lista(linha_para_grid(linha, n)).valores)
+
+
+class TestCachedSolver(unittest.TestCase):
+    def verificar_solucao(self, puzzle: bytes, solucao: bytes, n: int):
+        self.assertNotIn(0, solucao)
+        self.assertTrue(all(p == 0 or p == s for p, s in zip(puzzle, solucao)))
+        self.assertTrue(validar_grid_inicial(CompactGrid(n, solucao), SudokuGraph(n=n), verbose=False))
+
+    def test_acerto_em_puzzle_transformado(self):
+        rng = random.Random(0)
+        for n, linhas in PUZZLES.items():
+            graph = SudokuGraph(n=n)
+            solver = CachedSolver(DancingLinksSolver())
+
+            for linha in linhas:
+                original = valores(linha, n)
+                grid = CompactGrid(n, original)
+                self.assertTrue(solver.solve(grid, graph))
+                solucao = bytes(grid.valores)
+                self.verificar_solucao(original, solucao, n)
+
+                for _ in range(5):
+                    transformacao = transformacao_aleatoria(n, rng)
+                    puzzle = bytes(transformacao.aplicar(original))
+                    acertos = solver.acertos_memoria
+
+                    grid = CompactGrid(n, puzzle)
+                    self.assertTrue(solver.solve(grid, graph))
+                    self.assertEqual(solver.acertos_memoria, acertos + 1)
+                    self.verificar_solucao(puzzle, bytes(grid.valores), n)
+                    # Puzzle de solução única: tem de ser a solução original transformada
+                    self.assertEqual(bytes(grid.valores), bytes(transformacao.aplicar(solucao)))
+
+            self.assertEqual(solver.faltas, len(linhas))
+
+    def test_lista_de_listas(self):
+        solver = CachedSolver(DancingLinksSolver())
+        graph = SudokuGraph(n=3)
+        linha = PUZZLES[3][0]
+        solver.solve(linha_para_grid(linha, 3), graph)
+
+        grid = linha_para_grid(linha, 3)
+        self.assertTrue(solver.solve(grid, graph))
+        self.assertEqual(solver.acertos_memoria, 1)
+        self.verificar_solucao(valores(linha, 3), bytes(CompactGrid.de_lista(grid).valores), 3)
+
+    def test_sem_solucao_fica_na_cache(self):
+        solver = CachedSolver(DancingLinksSolver())
+        graph = SudokuGraph(n=3)
+        for _ in range(2):
+            grid = linha_para_grid(SEM_SOLUCAO, 3)
+            self.assertFalse(solver.solve(grid, graph))
+            self.assertEqual(grid, linha_para_grid(SEM_SOLUCAO, 3))
+        self.assertEqual((solver.faltas, solver.acertos_memoria), (1, 1))
+
+    def test_lru_e_disco(self):
+        graph = SudokuGraph(n=3)
+        with tempfile.TemporaryDirectory() as pasta:
+            arquivo = os.path.join(pasta, "cache")
+            with CachedSolver(DancingLinksSolver(), capacidade=1, arquivo=arquivo) as solver:
+                for linha in PUZZLES[3]:
+                    solver.solve(linha_para_grid(linha, 3), graph)
+                self.assertEqual(solver.descartes, 1)
+
+                # O primeiro saiu da LRU, mas continua no disco
+                grid = linha_para_grid(PUZZLES[3][0], 3)
+                self.assertTrue(solver.solve(grid, graph))
+                self.assertEqual(solver.acertos_disco, 1)
+
+            with CachedSolver(DancingLinksSolver(), arquivo=arquivo) as solver:
+                grid = CompactGrid(3, valores(PUZZLES[3][1], 3))
+                self.assertTrue(solver.solve(grid, graph))
+                self.assertEqual((solver.acertos_disco, solver.faltas), (1, 0))
+                self.verificar_solucao(valores(PUZZLES[3][1], 3), bytes(grid.valores), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import random
+import tempfile
+import unittest
+from database import PuzzleDatabase, PuzzleWriter, empacotar, desempacotar, tamanho_registro
+from grid import CompactGrid
+
+
+def grids_aleatorios(n: int, quantidade: int, rng: random.Random) -> list[bytes]:
+    return [bytes(rng.randint(0, n * n) for _ in range(n ** 4)) for _ in range(quantidade)]
+
+
+class TestEmpacotamento(unittest.TestCase):
+    def test_ida_e_volta(self):
+        rng = random.Random(0)
+        for n in (2, 3, 4, 5):
+            extremos = [bytes(n ** 4), bytes([n * n]) * n ** 4]
+            for valores in extremos + grids_aleatorios(n, 20, rng):
+                registro = empacotar(valores, n)
+                self.assertEqual(len(registro), tamanho_registro(n))
+                self.assertEqual(bytes(desempacotar(registro, n)), valores)
+
+
+class TestPuzzleDatabase(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.TemporaryDirectory()
+        self.caminho = os.path.join(self.pasta.name, "puzzles.sdb")
+
+    def tearDown(self):
+        self.pasta.cleanup()
+
+    def test_ida_e_volta_pelo_arquivo(self):
+        rng = random.Random(1)
+        for n in (2, 3, 4, 5):
+            grids = grids_aleatorios(n, 10, rng)
+            with PuzzleWriter(self.caminho, n) as escritor:
+                escritor.escrever(CompactGrid(n, grids[0]))
+                escritor.escrever(CompactGrid(n, grids[1]).para_lista())
+                escritor.escrever_todos(grids[2:])
+
+            with PuzzleDatabase(self.caminho) as banco:
+                self.assertEqual(banco.n, n)
+                self.assertEqual(len(banco), len(grids))
+                self.assertEqual([bytes(grid.valores) for grid in banco], grids)
+                self.assertEqual(bytes(banco[-1].valores), grids[-1])
+                self.assertEqual(bytes(banco.valores(-len(grids))), grids[0])
+                with self.assertRaises(IndexError):
+                    banco.valores(len(grids))
+                with self.assertRaises(IndexError):
+                    banco.valores(-len(grids) - 1)
+
+    def test_banco_vazio(self):
+        with PuzzleWriter(self.caminho, 3):
+            pass
+
+        with PuzzleDatabase(self.caminho) as banco:
+            self.assertEqual(len(banco), 0)
+            self.assertEqual(list(banco), [])
+            with self.assertRaises(IndexError):
+                banco[0]
+            with self.assertRaises(IndexError):
+                banco[-1]
+
+    def test_arquivo_vazio_ou_truncado(self):
+        open(self.caminho, "wb").close()
+        with self.assertRaises(ValueError):
+            PuzzleDatabase(self.caminho)
+
+        with PuzzleWriter(self.caminho, 3) as escritor:
+            escritor.escrever(bytes(81))
+            escritor.escrever(bytes(81))
+        with open(self.caminho, "r+b") as f:
+            f.truncate(os.path.getsize(self.caminho) - 1)
+        with self.assertRaises(ValueError):
+            PuzzleDatabase(self.caminho)
+
+
+if __name__ == "__main__":
+    unittest.main()
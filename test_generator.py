@@ -0,0 +1,54 @@
+import random
+import unittest
+from generator import PuzzleGenerator, BaseGridGenerator, SEMENTES_PADRAO
+from grid import CompactGrid
+from utils import validar_grid_inicial
+from solvers import BitmaskBacktrackingSolver, BacktrackingCounter
+from dlx import DancingLinksSolver
+from graph import SudokuGraph
+
+
+def contar_pistas(puzzle: list[list[int]]) -> int:
+    return sum(valor != 0 for linha in puzzle for valor in linha)
+
+
+class TestBaseGridGenerator(unittest.TestCase):
+    def test_sementes_padrao_sao_solucoes_distintas(self):
+        for n, sementes in SEMENTES_PADRAO.items():
+            self.assertGreater(len(set(sementes)), 1)
+            for semente in sementes:
+                grid = CompactGrid(n, bytes.fromhex(semente))
+                self.assertEqual(grid.vazios(), 0)
+                self.assertTrue(validar_grid_inicial(grid, SudokuGraph(n=n), verbose=False))
+
+    def test_grids_gerados_sao_solucoes(self):
+        bases = BaseGridGenerator()
+        rng = random.Random(0)
+        for n in (2, 3, 4, 6):
+            grid = bases.gerar(n, rng)
+            self.assertEqual(grid.vazios(), 0)
+            self.assertTrue(validar_grid_inicial(grid, SudokuGraph(n=n), verbose=False))
+
+
+class TestGeracaoEmLotes(unittest.TestCase):
+    def setUp(self):
+        self.gerador = PuzzleGenerator(BitmaskBacktrackingSolver(), BacktrackingCounter(), BaseGridGenerator())
+        self.graph = SudokuGraph(n=3)
+
+    def test_alvo_alcancavel_e_atingido(self):
+        for semente in range(5):
+            puzzle, _ = self.gerador.gerar_puzzle_em_lotes(3, rng=random.Random(semente), verbose=False,
+                                                           alvo_pistas=30)
+            self.assertEqual(contar_pistas(puzzle), 30)
+            self.assertEqual(DancingLinksSolver().count_solutions(puzzle, self.graph, limit=2), 1)
+
+    def test_alvo_abaixo_do_minimo_termina_no_minimo(self):
+        sem_alvo, _ = self.gerador.gerar_puzzle_em_lotes(3, rng=random.Random(0), verbose=False,
+                                                         simetria="central")
+        com_alvo, _ = self.gerador.gerar_puzzle_em_lotes(3, rng=random.Random(0), verbose=False,
+                                                         simetria="central", alvo_pistas=10)
+        self.assertEqual(contar_pistas(com_alvo), contar_pistas(sem_alvo))
+
+
+if __name__ == "__main__":
+    unittest.main()
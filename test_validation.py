@@ -0,0 +1,85 @@
+import random
+import unittest
+import numpy as np
+from dlx import DancingLinksSolver
+from graph import VARIANTES, SudokuGraph
+from grid import CompactGrid
+from utils import validar_grid_inicial
+from validation import BatchValidator, linhas_para_array
+
+
+def grids_de_teste(graph, rng: random.Random) -> np.ndarray:
+    """Uma solução do grafo, puzzles cavados dela e cópias com pistas conflitantes."""
+    topologia = graph.topologia
+    solucao = CompactGrid(topologia.n)
+    DancingLinksSolver().solve(solucao, graph)
+    solucao = np.frombuffer(bytes(solucao.valores), dtype=np.uint8)
+
+    grids = [solucao.copy(), np.zeros(topologia.num_vertices, dtype=np.uint8)]
+    for _ in range(4):
+        puzzle = solucao * (np.array([rng.random() < 0.4 for _ in solucao]))
+        grids.append(puzzle.astype(np.uint8))
+
+    # Repete uma pista em cada tipo de unidade (linha, coluna, bloco, extras da variante)
+    for u, unidade in enumerate(topologia.unidades):
+        if u >= 3 * topologia.tamanho or rng.random() < 0.15:
+            grid = grids[rng.randrange(2, 6)].copy()
+            a, b = rng.sample(list(unidade), 2)
+            grid[b] = grid[a] = rng.randint(1, topologia.tamanho)
+            grids.append(grid)
+    return np.array(grids)
+
+
+def conflitos_escalares(grid, graph) -> list:
+    topologia = graph.topologia
+    pares = []
+    for a in range(topologia.num_vertices):
+        for b in topologia.vizinhos[a]:
+            if a < b and grid[a] and grid[a] == grid[b]:
+                pares.append((topologia.coordenadas[a], topologia.coordenadas[b], int(grid[a])))
+    return sorted(pares)
+
+
+class TestBatchValidator(unittest.TestCase):
+    def comparar(self, graph, grids, **opcoes):
+        validador = BatchValidator(graph=graph, **opcoes)
+        validos = validador.validos(grids)
+        conflitos = validador.conflitos(grids)
+
+        self.assertFalse(validos.all())
+        for grid, valido, encontrados in zip(grids, validos, conflitos):
+            esperado = validar_grid_inicial(CompactGrid(graph.topologia.n, bytes(grid)), graph, verbose=False)
+            self.assertEqual(bool(valido), esperado)
+            self.assertEqual(sorted(encontrados), conflitos_escalares(grid, graph))
+
+    def test_variantes_9x9(self):
+        for nome, variante in VARIANTES.items():
+            with self.subTest(variante=nome):
+                graph = variante(n=3)
+                self.comparar(graph, grids_de_teste(graph, random.Random(nome)))
+
+    def test_classico_16x16_em_blocos(self):
+        graph = SudokuGraph(n=4)
+        grids = grids_de_teste(graph, random.Random(16))
+        self.comparar(graph, grids, tamanho_bloco=3)
+
+    def test_ordenacao_sem_mascaras(self):
+        graph = SudokuGraph(n=3)
+        grids = grids_de_teste(graph, random.Random(0))
+        validador = BatchValidator(graph=graph)
+        validador.mascaras = False # Caminho das ordens com mais de 32 cores
+        np.testing.assert_array_equal(validador.validos(grids), BatchValidator(graph=graph).validos(grids))
+
+    def test_linhas_para_array(self):
+        linhas = ["1.3" + "0" * 78, "9" * 81]
+        array = linhas_para_array(linhas, 3)
+        self.assertEqual(array.shape, (2, 81))
+        self.assertEqual(list(array[0, :4]), [1, 0, 3, 0])
+        with self.assertRaises(ValueError):
+            linhas_para_array(["1" * 80], 3)
+        with self.assertRaises(ValueError):
+            linhas_para_array(["a" * 81], 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
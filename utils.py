@@ -1,4 +1,5 @@
 from interfaces import IGraph
+from grid import valores_por_vertice
 
 def imprimir_grid(grid: list[list[int]], n: int):
     """Imprime o grid de Sudoku formatado."""
@@ -17,30 +18,78 @@ def imprimir_grid(grid: list[list[int]], n: int):
             print(f"{val} " if val != 0 else ". ", end="")
         print() # Nova linha no final da linha do grid
 
-def validar_grid_inicial(grid: list[list[int]], graph: IGraph) -> bool:
+def validar_grid_inicial(grid: list[list[int]], graph: IGraph, verbose: bool = True) -> bool:
     """
     Verifica se as pistas iniciais (não-zero) do grid são válidas
     de acordo com as regras do grafo.
+
+    Com verbose=False nada é impresso (útil no modo em lote, onde a saída
+    padrão carrega apenas as soluções).
     """
-    tamanho = len(grid)
-    for l in range(tamanho):
-        for c in range(tamanho):
-            valor = grid[l][c]
-            
-            # Se for uma pista (um número já preenchido)
-            if valor != 0:
-                v = graph.grid_para_vertice(l, c)
-                
-                # Verificamos seus vizinhos
-                for vizinho in graph.get_vizinhos(v):
-                    l_viz, c_viz = graph.vertice_para_grid(vizinho)
-                    
-                    # Se um vizinho tiver o MESMO valor da pista, o puzzle é inválido
-                    if grid[l_viz][c_viz] == valor:
+    topologia = graph.topologia
+    valores = valores_por_vertice(grid, topologia.coordenadas)
+
+    for v, valor in enumerate(valores):
+        # Se for uma pista (um número já preenchido)
+        if valor != 0:
+            # Verificamos seus vizinhos
+            for vizinho in topologia.vizinhos[v]:
+                # Se um vizinho tiver o MESMO valor da pista, o puzzle é inválido
+                if valores[vizinho] == valor:
+                    if verbose:
+                        (l, c) = topologia.coordenadas[v]
                         print(f"  [Erro de Validação] Conflito encontrado na célula ({l}, {c})")
-                        return False
+                    return False
     return True
 
+def percentis(amostras) -> dict:
+    """p50/p90/p99/máximo (em ms) de uma coleção de latências em segundos."""
+    if not amostras:
+        return {"quantidade": 0}
+
+    ordenadas = sorted(amostras)
+
+    def p(q):
+        return round(ordenadas[min(len(ordenadas) - 1, int(q * len(ordenadas)))] * 1000, 3)
+
+    return {"quantidade": len(ordenadas), "p50_ms": p(0.50), "p90_ms": p(0.90),
+            "p99_ms": p(0.99), "max_ms": round(ordenadas[-1] * 1000, 3)}
+
+def linha_para_grid(linha: str, n: int) -> list[list[int]]:
+    """
+    Converte o formato de uma linha (ex: 81 caracteres para 9x9) em grid 2D.
+
+    Cada caractere é uma célula: '0' ou '.' para vazio, '1'-'9' e depois
+    'A'-'Z' para as cores 10 em diante (ex: 'G' = 16 em um 16x16).
+    """
+    tamanho = n * n
+    linha = linha.strip()
+
+    if len(linha) != tamanho * tamanho:
+        raise ValueError(f"Esperados {tamanho * tamanho} caracteres, recebidos {len(linha)}.")
+
+    valores = []
+    for caractere in linha:
+        if caractere == ".":
+            valores.append(0)
+            continue
+
+        try:
+            valor = int(caractere, 36)
+        except ValueError:
+            raise ValueError(f"Caractere inválido: {caractere!r}.")
+
+        if valor > tamanho:
+            raise ValueError(f"Valor {caractere!r} fora do intervalo 1-{tamanho}.")
+        valores.append(valor)
+
+    return [valores[i:i + tamanho] for i in range(0, len(valores), tamanho)]
+
+def grid_para_linha(grid: list[list[int]]) -> str:
+    """Inverso de linha_para_grid: serializa o grid em uma linha ('.' para vazio)."""
+    simbolos = "." + "123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    return "".join(simbolos[valor] for linha in grid for valor in linha)
+
 def adicionar_sudoku_nsxns(n: int)-> list[list]:
 
     print("Coloque os números do sudoku e aperte enter 0 p/ vazio e -1 se quiser voltar")
@@ -0,0 +1,157 @@
+import numpy as np
+from interfaces import IGraph
+from graph import SudokuGraph
+
+# Tabela de decodificação dos caracteres de linha_para_grid ('.'/'0' vazio,
+# '1'-'9' e 'A'-'Z' em base 36); 255 marca caractere inválido
+_DECODIFICAR = np.full(256, 255, dtype=np.uint8)
+_DECODIFICAR[ord(".")] = 0
+for _valor, _caractere in enumerate("0123456789abcdefghijklmnopqrstuvwxyz"):
+    _DECODIFICAR[ord(_caractere)] = _valor
+    _DECODIFICAR[ord(_caractere.upper())] = _valor
+
+
+def linhas_para_array(linhas, n: int) -> np.ndarray:
+    """
+    Decodifica puzzles no formato de uma linha (como linha_para_grid) direto
+    em um array (N, n⁴) de uint8, sem passar por listas de listas.
+    """
+    tamanho = n * n
+    num_vertices = tamanho * tamanho
+
+    texto = []
+    for i, linha in enumerate(linhas):
+        linha = linha.strip()
+        if len(linha) != num_vertices:
+            raise ValueError(f"Linha {i}: esperados {num_vertices} caracteres, recebidos {len(linha)}.")
+        texto.append(linha)
+
+    bruto = np.frombuffer("".join(texto).encode("ascii", errors="replace"), dtype=np.uint8)
+    valores = _DECODIFICAR[bruto].reshape(len(texto), num_vertices)
+
+    ruins = (valores > tamanho).any(axis=1)
+    if ruins.any():
+        i = int(np.flatnonzero(ruins)[0])
+        raise ValueError(f"Linha {i}: caractere inválido ou fora do intervalo 1-{tamanho}.")
+    return valores
+
+
+class BatchValidator:
+    """
+    Valida lotes de grids de uma vez (NumPy): pistas repetidas em alguma
+    unidade do grafo (linha, coluna, bloco ou unidade de variante).
+
+    Cada grid é uma linha de um array (N, n⁴) com 0 nas células vazias, como
+    no BatchSolver. Dois caminhos:
+
+    - validos(grids): só o booleano por grid. Cada pista vira uma máscara de
+      bits e, por unidade, a soma das máscaras difere do OR delas exatamente
+      quando há cor repetida (ordens com mais de 32 cores usam a ordenação
+      de cada unidade no lugar das máscaras).
+    - conflitos(grids): todos os pares de células conflitantes de cada grid.
+      Os pares só são montados para os grids que o caminho rápido reprovou.
+    """
+
+    def __init__(self, n: int = 3, graph: IGraph | None = None, tamanho_bloco: int = 65536):
+        """
+        Args:
+            n: Ordem do Sudoku (ex: 3 para 9x9).
+            graph: Grafo a usar (ex: uma variante); padrão: SudokuGraph(n).
+            tamanho_bloco: Quantos grids processar por vez (limita a memória).
+        """
+        self.graph = graph if graph is not None else SudokuGraph(n=n)
+        topologia = self.graph.topologia
+
+        self.tamanho = topologia.tamanho
+        self.num_vertices = topologia.num_vertices
+        self.coordenadas = topologia.coordenadas
+        self.tamanho_bloco = tamanho_bloco
+        self.tamanho_sub_bloco = max(1, tamanho_bloco // self.num_vertices)
+        self.mascaras = self.tamanho <= 32
+
+        # Tabelas de "gather" (unidades, tamanho), uma por tamanho de unidade
+        por_tamanho = {}
+        for unidade in topologia.unidades:
+            por_tamanho.setdefault(len(unidade), []).append(unidade)
+        self.grupos = [np.array(unidades, dtype=np.intp) for unidades in por_tamanho.values()]
+
+    def _preparar(self, grids) -> np.ndarray:
+        grids = np.asarray(grids)
+        if grids.ndim != 2 or grids.shape[1] != self.num_vertices:
+            raise ValueError(f"Esperado um array (N, {self.num_vertices}), recebido {grids.shape}.")
+        if grids.size and (grids.min() < 0 or grids.max() > self.tamanho):
+            raise ValueError(f"Valores fora do intervalo 0-{self.tamanho}.")
+        return grids
+
+    def validos(self, grids) -> np.ndarray:
+        """Vetor (N,) de bool: True para os grids sem pistas conflitantes."""
+        grids = self._preparar(grids)
+        resultado = np.empty(len(grids), dtype=bool)
+
+        for inicio in range(0, len(grids), self.tamanho_bloco):
+            fim = inicio + self.tamanho_bloco
+            resultado[inicio:fim] = ~self._com_conflito(grids[inicio:fim])
+
+        return resultado
+
+    def _com_conflito(self, bloco: np.ndarray) -> np.ndarray:
+        conflito = np.zeros(len(bloco), dtype=bool)
+
+        if self.mascaras:
+            valores = bloco.astype(np.int64)
+            mascaras = np.where(valores > 0, np.left_shift(1, np.maximum(valores - 1, 0)), 0)
+            for unidades in self.grupos:
+                por_unidade = mascaras[:, unidades]                 # (M, U, T)
+                usadas = np.bitwise_or.reduce(por_unidade, axis=2)  # (M, U)
+                conflito |= (por_unidade.sum(axis=2) != usadas).any(axis=1)
+        else:
+            for unidades in self.grupos:
+                ordenados = np.sort(bloco[:, unidades], axis=2)
+                repetidos = (ordenados[:, :, 1:] == ordenados[:, :, :-1]) & (ordenados[:, :, 1:] > 0)
+                conflito |= repetidos.any(axis=(1, 2))
+
+        return conflito
+
+    def conflitos(self, grids) -> list[list[tuple[tuple[int, int], tuple[int, int], int]]]:
+        """
+        Todos os conflitos de cada grid, na ordem da entrada: uma lista (vazia
+        se o grid é válido) de ((linha, col), (linha, col), valor), um item
+        por par de células com a mesma pista em alguma unidade. Pares que
+        dividem mais de uma unidade (ex: linha e bloco) aparecem uma vez.
+        """
+        grids = self._preparar(grids)
+        resultado = [[] for _ in range(len(grids))]
+
+        for inicio in range(0, len(grids), self.tamanho_bloco):
+            bloco = grids[inicio:inicio + self.tamanho_bloco]
+            invalidos = np.flatnonzero(self._com_conflito(bloco))
+
+            # Comparar cada par de células da unidade custa bem mais memória
+            # por grid, então os reprovados vão em sub-blocos menores
+            for sub in range(0, len(invalidos), self.tamanho_sub_bloco):
+                indices = invalidos[sub:sub + self.tamanho_sub_bloco]
+                for i, a, b in self._pares(bloco[indices]):
+                    valor = int(bloco[indices[i], a])
+                    resultado[inicio + indices[i]].append((self.coordenadas[a], self.coordenadas[b], valor))
+
+        return resultado
+
+    def _pares(self, bloco: np.ndarray):
+        """(grid, vértice a, vértice b) com a < b, sem repetição, para cada par conflitante."""
+        chaves = []
+        v = self.num_vertices
+
+        for unidades in self.grupos:
+            por_unidade = bloco[:, unidades]                                    # (M, U, T)
+            iguais = (por_unidade[:, :, :, None] == por_unidade[:, :, None, :]) & (por_unidade[:, :, :, None] > 0)
+            iguais &= np.triu(np.ones(unidades.shape[1], dtype=bool), k=1)       # Cada par uma vez
+            g, u, i, j = np.nonzero(iguais)
+
+            a = unidades[u, i]
+            b = unidades[u, j]
+            chaves.append((g * v + np.minimum(a, b)) * v + np.maximum(a, b))
+
+        for chave in np.unique(np.concatenate(chaves)).tolist():
+            resto, b = divmod(chave, v)
+            g, a = divmod(resto, v)
+            yield g, a, b